@@ -0,0 +1,4 @@
+"""Performance benchmarks for UE Config Assistant.
+
+Run with ``python -m benchmarks.run`` from the repository root.
+"""
@@ -0,0 +1,194 @@
+"""Deterministic generators for synthetic benchmark inputs.
+
+Every generator takes a ``seed`` so that the same arguments always produce
+byte-identical output.  This keeps benchmark numbers comparable between runs
+and machines.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+from typing import Dict, List
+
+PREFIXES = ["r", "sg", "a", "p", "fx", "net", "t", "s", "au", "ai"]
+WORDS = [
+    "Shadow",
+    "Lumen",
+    "Nanite",
+    "Bloom",
+    "Fog",
+    "Streaming",
+    "Texture",
+    "Quality",
+    "Distance",
+    "Scale",
+    "Max",
+    "Min",
+    "Resolution",
+    "Pool",
+    "Size",
+    "Enable",
+    "Debug",
+    "Cache",
+    "Budget",
+    "Reflection",
+]
+CATEGORIES = ["Rendering", "Audio", "Physics", "Networking", "Animation", ""]
+CONFIG_PATTERNS = ["Default", "Project", "Platform"]
+CONFIG_KINDS = ["Engine", "Game", "Input", "Editor", "Scalability", "DeviceProfiles"]
+
+
+def cvar_name(rng: random.Random, idx: int) -> str:
+    """Return a unique, realistic looking dotted CVar name."""
+    prefix = rng.choice(PREFIXES)
+    parts = [rng.choice(WORDS) for _ in range(rng.randint(1, 3))]
+    return f"{prefix}.{'.'.join(parts)}{idx}"
+
+
+def make_cvar_records(count: int, seed: int = 0) -> List[Dict[str, str]]:
+    """Return ``count`` cache records shaped like :func:`index_headers` output."""
+    rng = random.Random(seed)
+    records = []
+    for idx in range(count):
+        lo = rng.randint(0, 4)
+        records.append(
+            {
+                "name": cvar_name(rng, idx),
+                "description": " ".join(rng.choice(WORDS) for _ in range(12)),
+                "default": str(rng.randint(0, 10)),
+                "category": rng.choice(CATEGORIES),
+                "range": f"{lo}-{lo + rng.randint(1, 10)}" if rng.random() < 0.3 else "",
+                "file": f"Engine/Source/Runtime/Module{idx % 50}/Public/File{idx % 7}.h",
+            }
+        )
+    return records
+
+
+def make_cache_file(path: Path, count: int, seed: int = 0) -> Path:
+    """Write a JSON cache with ``count`` records to ``path``."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(make_cvar_records(count, seed), indent=2))
+    return path
+
+
+def make_engine_tree(
+    root: Path,
+    headers: int = 200,
+    cvars_per_header: int = 20,
+    filler_lines: int = 40,
+    seed: int = 0,
+) -> List[str]:
+    """Create a synthetic engine source tree below ``root``.
+
+    Each header contains ``cvars_per_header`` declarations using both macro
+    styles understood by the indexer, some with ``Category``/``Range``
+    comments, interleaved with ``filler_lines`` lines of unrelated code.
+    Returns the list of generated CVar names in file order.
+    """
+    rng = random.Random(seed)
+    names: List[str] = []
+    idx = 0
+    for h in range(headers):
+        module = root / "Engine" / "Source" / "Runtime" / f"Module{h % 25}" / "Public"
+        module.mkdir(parents=True, exist_ok=True)
+        lines = ["#pragma once", ""]
+        for c in range(cvars_per_header):
+            for f in range(filler_lines // max(cvars_per_header, 1)):
+                lines.append(f"static int32 GFiller{h}_{c}_{f} = {rng.randint(0, 99)};")
+            name = cvar_name(rng, idx)
+            idx += 1
+            names.append(name)
+            if rng.random() < 0.5:
+                lines.append(f"// Category: {rng.choice(CATEGORIES) or 'Misc'}")
+            if rng.random() < 0.3:
+                lo = rng.randint(0, 3)
+                lines.append(f"// Range: {lo}-{lo + rng.randint(1, 8)}")
+            desc = " ".join(rng.choice(WORDS) for _ in range(8))
+            if c % 2:
+                lines.append(
+                    f'IConsoleVariable::Register("{name}", {rng.randint(0, 4)}, "{desc}");'
+                )
+            else:
+                kind = rng.choice(["INTEGER", "FLOAT", "STRING"])
+                lines.append(f'UE_CVAR_{kind}("{name}", {rng.randint(0, 4)}, "{desc}");')
+        (module / f"Header{h}.h").write_text("\n".join(lines) + "\n")
+    return names
+
+
+def make_config_tree(
+    config_dir: Path,
+    files: int = 24,
+    sections: int = 10,
+    keys_per_section: int = 50,
+    duplicate_ratio: float = 0.1,
+    seed: int = 0,
+) -> Path:
+    """Create ``files`` ini files in ``config_dir`` following UE naming.
+
+    Roughly ``duplicate_ratio`` of the keys in every file reuse a key from a
+    shared pool so that :meth:`ConfigDB.find_duplicates` has work to do.
+    """
+    rng = random.Random(seed)
+    config_dir.mkdir(parents=True, exist_ok=True)
+    shared = [cvar_name(rng, i) for i in range(keys_per_section)]
+    for n in range(files):
+        prefix = CONFIG_PATTERNS[n % len(CONFIG_PATTERNS)]
+        kind = CONFIG_KINDS[(n // len(CONFIG_PATTERNS)) % len(CONFIG_KINDS)]
+        suffix = n // (len(CONFIG_PATTERNS) * len(CONFIG_KINDS))
+        name = f"{prefix}{kind}{suffix or ''}.ini"
+        lines: List[str] = []
+        for s in range(sections):
+            section = "ConsoleVariables" if s == 0 else f"/Script/Module{s}.Settings{s}"
+            lines.append(f"[{section}]")
+            for k in range(keys_per_section):
+                if rng.random() < duplicate_ratio:
+                    key = shared[k]
+                else:
+                    key = f"{cvar_name(rng, k)}_{n}"
+                lines.append(f"{key}={rng.randint(0, 100)}")
+            lines.append("")
+        (config_dir / name).write_text("\n".join(lines))
+    (config_dir / "GameUserSettings.ini").write_text(
+        "[/Script/Engine.GameUserSettings]\n"
+        + "\n".join(f"{k}={rng.randint(0, 3)}" for k in shared[:10])
+        + "\n"
+    )
+    return config_dir
+
+
+def make_docs_page(path: Path, rows: int = 5000, tables: int = 10, seed: int = 0) -> Path:
+    """Write an HTML page shaped like the online console variable reference.
+
+    ``rows`` CVars are spread over ``tables`` ``table.table`` elements, each
+    with a header row, surrounded by navigation markup and scripts like the
+    real page.  Returns ``path``.
+    """
+    rng = random.Random(seed)
+    parts = [
+        "<!DOCTYPE html><html><head><title>Console Variables Reference</title>",
+        "<script>window.__STATE__ = {\"tr\": \"<td>not a cell</td>\"};</script>",
+        "<style>.table td { padding: 4px; }</style></head><body>",
+        '<nav><table class="nav"><tr><td>Home</td><td>Docs</td><td>Search</td></tr></table></nav>',
+    ]
+    per_table = max(1, rows // max(tables, 1))
+    for idx in range(rows):
+        if idx % per_table == 0:
+            if idx:
+                parts.append("</tbody></table>")
+            parts.append(f"<h2>{rng.choice(WORDS)} Variables</h2>")
+            parts.append('<table class="table">')
+            parts.append("<thead><tr><th>Variable</th><th>Default Value</th><th>Description</th></tr></thead><tbody>")
+        desc = " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 30)))
+        if rng.random() < 0.2:
+            desc += " &amp; <code>0</code>: off,<br> <code>1</code>: on"
+        parts.append(
+            f"<tr><td><p><code>{cvar_name(rng, idx)}</code></p></td>"
+            f"<td><p><code>{rng.randint(0, 10)}</code></p></td>"
+            f"<td>\n  <p>{desc}</p>\n</td></tr>"
+        )
+    parts.append("</tbody></table></body></html>")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(parts), encoding="utf-8")
+    return path
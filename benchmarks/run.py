@@ -0,0 +1,392 @@
+"""Benchmark runner comparing throughput against a stored baseline.
+
+Example::
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.run
+    python -m benchmarks.run --only index_headers --scale 2
+    python -m benchmarks.run --update-baseline
+    python -m benchmarks.run --only docs_parse_stream --docs-page saved_reference.html
+
+Each case reports items processed per second (best of ``--repeat`` runs) and
+the peak traced Python memory of a separate run under :mod:`tracemalloc`.
+A case regresses when its throughput falls below the baseline by more than
+``--tolerance``; the process then exits with status 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks import generators  # noqa: E402
+from ue_configurator.config_db import ConfigDB  # noqa: E402
+
+BASELINE_FILE = Path(__file__).with_name("baseline.json")
+
+
+@dataclass
+class Case:
+    """A single benchmark.
+
+    ``setup`` prepares inputs inside a scratch directory and returns state
+    passed to ``run``.  ``run`` performs the measured work and returns the
+    number of items it processed, used to compute throughput.
+    """
+
+    name: str
+    setup: Callable[[Path, int], Any]
+    run: Callable[[Any], int]
+    needs_qt: bool = False
+    #: Optional module the case needs; it is skipped when missing.
+    requires: str = ""
+
+
+def _setup_engine(tmp: Path, scale: int) -> Path:
+    generators.make_engine_tree(tmp / "engine", headers=100 * scale)
+    return tmp / "engine"
+
+
+def _run_index_headers(root: Path) -> int:
+    from ue_configurator.indexer import index_headers
+
+    return len(index_headers(root))
+
+
+def _setup_cache(tmp: Path, scale: int) -> Path:
+    return generators.make_cache_file(tmp / "cache.json", 10000 * scale)
+
+
+def _run_load_cache(cache: Path) -> int:
+    from ue_configurator.indexer import load_cache
+
+    return len(load_cache(cache))
+
+
+def _setup_config(tmp: Path, scale: int) -> Path:
+    return generators.make_config_tree(tmp / "Config", files=12 * scale)
+
+
+def _loaded_db(tmp: Path, scale: int) -> ConfigDB:
+    db = ConfigDB()
+    db.load(_setup_config(tmp, scale))
+    return db
+
+
+def _run_db_load(config_dir: Path) -> int:
+    db = ConfigDB()
+    db.load(config_dir)
+    return len(db.files)
+
+
+def _run_db_entries(db: ConfigDB) -> int:
+    return sum(len(v) for v in db.entries().values())
+
+
+def _run_find_duplicates(db: ConfigDB) -> int:
+    db.find_duplicates()
+    return sum(len(v) for v in db.entries().values())
+
+
+def _setup_file_stats(tmp: Path, scale: int) -> Any:
+    from ue_configurator.file_stats import FileStatsIndex, scan_file
+
+    db = _loaded_db(tmp, scale)
+    index = FileStatsIndex(db.list_files())
+    for ini in db.files:
+        index.add(scan_file(ini))
+    return db, index
+
+
+def _run_file_stats_toggle(state: Any) -> int:
+    db, index = state
+    for name, _enabled in db.list_files():
+        index.set_enabled(name, False)
+        index.set_enabled(name, True)
+    return 2 * sum(len(keys) for keys in index._keys.values())
+
+
+def _run_db_save(db: ConfigDB) -> int:
+    assert db.config_dir is not None
+    db.save(db.config_dir)
+    return len(db.files)
+
+
+def _setup_validate(tmp: Path, scale: int) -> Any:
+    from ue_configurator.cvar_index import CVarIndex
+
+    db = _loaded_db(tmp, scale)
+    return db, CVarIndex(generators.make_cvar_records(20000 * scale))
+
+
+def _run_validate(state: Any) -> int:
+    from ue_configurator.validation import collect_rows, validate_cvars
+
+    db, index = state
+    validate_cvars(db, index)
+    return len(collect_rows(db))
+
+
+def _setup_search(tmp: Path, scale: int) -> Any:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtGui import QStandardItemModel, QStandardItem
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import Qt
+
+    from ue_configurator.ui.search_pane import SearchFilterProxyModel
+
+    app = QApplication.instance() or QApplication([])
+    model = QStandardItemModel(0, 3)
+    for item in generators.make_cvar_records(10000 * scale):
+        name = QStandardItem(item["name"])
+        name.setData(item["category"], Qt.UserRole)
+        model.appendRow([name, QStandardItem(item["description"]), QStandardItem(item["file"])])
+    proxy = SearchFilterProxyModel()
+    proxy.setSourceModel(model)
+    return app, model, proxy
+
+
+def _run_search(state: Any) -> int:
+    _app, model, proxy = state
+    for text in ("shadow", "lumen.max", "r.", "zzz", ""):
+        proxy.set_text_filter(text)
+        proxy.rowCount()
+    proxy.set_category_filter("Rendering")
+    proxy.set_category_filter("All")
+    return model.rowCount() * 7
+
+
+def _setup_merge(tmp: Path, scale: int) -> Any:
+    records = generators.make_cvar_records(100000 * scale)
+    half = len(records) // 2
+    docs = [dict(r, file="", category="", range="") for r in records[half // 2 :]]
+    return records[:half], docs
+
+
+def _run_merge(state: Any) -> int:
+    from ue_configurator.cvar_merge import merge_sources
+
+    headers, docs = state
+    return len(merge_sources(headers, docs).records)
+
+
+def _setup_namespaces(tmp: Path, scale: int) -> Any:
+    return generators.make_cvar_records(50000 * scale)
+
+
+def _run_namespaces(records: Any) -> int:
+    from ue_configurator.namespace_tree import NamespaceTree
+
+    tree = NamespaceTree(records)
+    nodes = [n for top in tree.root.children() for n in [top, *top.children()]]
+    for text in ("shadow", "lumen.max", "r.", "zzz"):
+        bits = tree.match(text)
+        for node in nodes:
+            node.count(bits)
+    return len(records)
+
+
+#: Saved copy of the online reference page used instead of a synthetic one.
+DOCS_PAGE: Path | None = None
+DOCS_CHUNK = 64 * 1024
+
+
+def _setup_docs_page(tmp: Path, scale: int) -> bytes:
+    if DOCS_PAGE is not None:
+        return DOCS_PAGE.read_bytes()
+    return generators.make_docs_page(tmp / "reference.html", rows=5000 * scale).read_bytes()
+
+
+def _chunks(page: bytes) -> List[bytes]:
+    return [page[i : i + DOCS_CHUNK] for i in range(0, len(page), DOCS_CHUNK)]
+
+
+def _run_docs_stream(page: bytes) -> int:
+    from ue_configurator.doc_parser import iter_console_variables
+
+    return sum(1 for _ in iter_console_variables(_chunks(page), use_lxml=False))
+
+
+def _run_docs_lxml(page: bytes) -> int:
+    from ue_configurator.doc_parser import iter_console_variables
+
+    return sum(1 for _ in iter_console_variables(_chunks(page), use_lxml=True))
+
+
+def _run_docs_bs4(page: bytes) -> int:
+    """The former DOM based parser, kept as a reference point."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(page.decode("utf-8"), "html.parser")
+    count = 0
+    for table in soup.find_all("table", class_="table"):
+        for row in table.find_all("tr")[1:]:
+            cols = row.find_all("td")
+            if len(cols) >= 3:
+                [c.get_text(strip=True) for c in cols[:3]]
+                count += 1
+    return count
+
+
+CASES: List[Case] = [
+    Case("index_headers", _setup_engine, _run_index_headers),
+    Case("load_cache", _setup_cache, _run_load_cache),
+    Case("configdb_load", _setup_config, _run_db_load),
+    Case("configdb_entries", _loaded_db, _run_db_entries),
+    Case("configdb_find_duplicates", _loaded_db, _run_find_duplicates),
+    Case("configdb_save", _loaded_db, _run_db_save),
+    Case("file_stats_toggle", _setup_file_stats, _run_file_stats_toggle),
+    Case("validate_cvars", _setup_validate, _run_validate),
+    Case("search_filter", _setup_search, _run_search, needs_qt=True),
+    Case("merge_sources", _setup_merge, _run_merge),
+    Case("namespace_tree", _setup_namespaces, _run_namespaces),
+    Case("docs_parse_stream", _setup_docs_page, _run_docs_stream),
+    Case("docs_parse_lxml", _setup_docs_page, _run_docs_lxml, requires="lxml"),
+    Case("docs_parse_bs4", _setup_docs_page, _run_docs_bs4, requires="bs4"),
+]
+
+
+def _qt_available() -> bool:
+    try:
+        import PySide6.QtWidgets  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _module_available(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def measure(case: Case, scale: int, repeat: int) -> Dict[str, float]:
+    """Run ``case`` and return throughput and peak memory figures."""
+    with tempfile.TemporaryDirectory() as tmp:
+        state = case.setup(Path(tmp), scale)
+        best = float("inf")
+        items = 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            items = case.run(state)
+            best = min(best, time.perf_counter() - start)
+        tracemalloc.start()
+        case.run(state)
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {
+        "scale": scale,
+        "items": items,
+        "seconds": best,
+        "items_per_sec": items / best if best > 0 else float("inf"),
+        "peak_kib": peak / 1024,
+    }
+
+
+def load_baseline(path: Path = BASELINE_FILE) -> Dict[str, Dict[str, float]]:
+    if path.exists():
+        try:
+            return json.loads(path.read_text())
+        except Exception:
+            pass
+    return {}
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> List[str]:
+    """Return the names of cases slower than ``baseline`` beyond ``tolerance``."""
+    regressions = []
+    for name, res in results.items():
+        base = baseline.get(name)
+        # Throughput is only comparable for identically sized inputs.
+        if not base or base.get("scale", 1) != res["scale"]:
+            continue
+        if res["items_per_sec"] < base["items_per_sec"] * (1 - tolerance):
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run performance benchmarks")
+    parser.add_argument("--scale", type=int, default=1, help="Input size multiplier")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case")
+    parser.add_argument("--only", action="append", help="Run only the named case(s)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.3,
+        help="Allowed fractional throughput drop before a case counts as a regression",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store the results as the new baseline",
+    )
+    parser.add_argument("--json", type=Path, help="Also write results as JSON to this path")
+    parser.add_argument(
+        "--docs-page",
+        type=Path,
+        help="Saved copy of the console variable reference page for the docs_parse_* cases",
+    )
+    args = parser.parse_args(argv)
+
+    if args.update_baseline and args.docs_page:
+        parser.error("--update-baseline cannot be combined with --docs-page")
+    global DOCS_PAGE
+    DOCS_PAGE = args.docs_page
+
+    qt = _qt_available()
+    baseline = load_baseline(args.baseline)
+    results: Dict[str, Dict[str, float]] = {}
+    print(f"{'case':<28}{'items/s':>14}{'baseline':>14}{'peak KiB':>12}")
+    for case in CASES:
+        if args.only and case.name not in args.only:
+            continue
+        if case.needs_qt and not qt:
+            print(f"{case.name:<28}{'skipped (PySide6 missing)':>40}")
+            continue
+        if case.requires and not _module_available(case.requires):
+            print(f"{case.name:<28}{f'skipped ({case.requires} missing)':>40}")
+            continue
+        res = measure(case, args.scale, args.repeat)
+        results[case.name] = res
+        base = baseline.get(case.name, {}).get("items_per_sec")
+        base_txt = f"{base:,.0f}" if base else "-"
+        print(
+            f"{case.name:<28}{res['items_per_sec']:>14,.0f}{base_txt:>14}{res['peak_kib']:>12,.0f}"
+        )
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+    if args.update_baseline:
+        baseline.update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True))
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if DOCS_PAGE is not None:
+        # A real page is not comparable with the synthetic baseline.
+        results = {k: v for k, v in results.items() if not k.startswith("docs_parse")}
+    regressions = compare(results, baseline, args.tolerance)
+    for name in regressions:
+        print(f"REGRESSION: {name} is more than {args.tolerance:.0%} slower than baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,7 +15,6 @@ REQUIRED_MODULES = {
     "configupdater": "configupdater",
     "rich": "rich",
     "requests": "requests",
-    "beautifulsoup4": "bs4",
 }
 
 
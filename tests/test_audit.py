@@ -0,0 +1,40 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import json
+from pathlib import Path
+
+from ue_configurator.audit import audit_projects, expand_projects, format_csv, has_issues
+
+
+def _project(root: Path, name: str, version: str, engine_ini: str) -> Path:
+    proj = root / name
+    (proj / "Config").mkdir(parents=True)
+    up = proj / f"{name}.uproject"
+    up.write_text(json.dumps({"EngineAssociation": version}))
+    (proj / "Config" / "DefaultEngine.ini").write_text(engine_ini)
+    return up
+
+
+def test_audit_projects_in_pool(tmp_path: Path):
+    cache = tmp_path / "cache.json"
+    cache.with_name("cache-5.4.json").write_text(json.dumps([{"name": "r.Known"}]))
+    clean = _project(tmp_path, "Clean", "5.4", "[ConsoleVariables]\nr.Known=1\n")
+    bad = _project(tmp_path, "Bad", "5.4", "[ConsoleVariables]\nr.Typo=1\n")
+
+    projects = expand_projects([str(tmp_path / "*" / "*.uproject")])
+    assert projects == sorted([clean.resolve(), bad.resolve()])
+
+    results = audit_projects(projects, cache, workers=2)
+    by_name = {Path(r["project"]).stem: r for r in results}
+    assert by_name["Clean"]["cvar_index"] is True
+    assert not has_issues(by_name["Clean"])
+    assert by_name["Bad"]["unknown_cvars"] == [
+        {"section": "ConsoleVariables", "key": "r.typo", "files": ["DefaultEngine.ini"]}
+    ]
+    assert "r.typo" in format_csv(results)
+
+
+def test_missing_index_skips_cvar_check(tmp_path: Path):
+    up = _project(tmp_path, "Proj", "5.9", "[ConsoleVariables]\nr.Anything=1\n")
+    [result] = audit_projects(expand_projects([str(tmp_path)]), tmp_path / "none.json")
+    assert result["engine_version"] == "5.9"
+    assert result["cvar_index"] is False and result["unknown_cvars"] == []
@@ -0,0 +1,35 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from pathlib import Path
+
+from benchmarks import generators
+from benchmarks.run import compare
+from ue_configurator.config_db import ConfigDB
+from ue_configurator.indexer import index_headers
+
+
+def test_generators_are_deterministic(tmp_path: Path):
+    assert generators.make_cvar_records(50, seed=3) == generators.make_cvar_records(50, seed=3)
+    generators.make_config_tree(tmp_path / "a", files=4, seed=1)
+    generators.make_config_tree(tmp_path / "b", files=4, seed=1)
+    for path in (tmp_path / "a").iterdir():
+        assert path.read_text() == (tmp_path / "b" / path.name).read_text()
+
+
+def test_engine_tree_is_fully_indexed(tmp_path: Path):
+    names = generators.make_engine_tree(tmp_path, headers=3, cvars_per_header=5)
+    found = [r["name"] for r in index_headers(tmp_path)]
+    assert sorted(found) == sorted(names)
+
+
+def test_config_tree_has_duplicates(tmp_path: Path):
+    cfg = generators.make_config_tree(tmp_path / "Config", files=6, duplicate_ratio=0.5)
+    db = ConfigDB()
+    db.load(cfg)
+    assert len(db.files) == 7
+    assert db.find_duplicates()
+
+
+def test_compare_flags_regressions():
+    baseline = {"a": {"scale": 1, "items_per_sec": 100.0}, "b": {"scale": 2, "items_per_sec": 100.0}}
+    results = {"a": {"scale": 1, "items_per_sec": 50.0}, "b": {"scale": 1, "items_per_sec": 1.0}}
+    assert compare(results, baseline, 0.3) == ["a"]
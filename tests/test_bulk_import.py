@@ -0,0 +1,85 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import json
+from pathlib import Path
+
+import pytest
+
+from ue_configurator.bulk_import import bulk_import
+from ue_configurator.config_db import ConfigDB
+
+
+def _db(tmp_path: Path) -> ConfigDB:
+    cfg = tmp_path / "Config"
+    cfg.mkdir()
+    (cfg / "DefaultEngine.ini").write_text("[ConsoleVariables]\nr.Bloom=1\nr.Fog=1\n")
+    (cfg / "ProjectEngine.ini").write_text("[ConsoleVariables]\n")
+    db = ConfigDB()
+    db.load(cfg)
+    return db
+
+
+def test_csv_rows_apply_in_one_transaction(tmp_path: Path):
+    db = _db(tmp_path)
+    notified = []
+    db.add_listener(notified.append)
+    sheet = tmp_path / "tuning.csv"
+    sheet.write_text(
+        "key,value,target,action\n"
+        "r.Bloom,0,DefaultEngine.ini,\n"
+        "r.ScreenPercentage,75,,set\n"
+        "r.Fog,,,delete\n"
+    )
+    applied = bulk_import(db, sheet)
+    assert [(op.action, op.option, op.file, op.previous) for op in applied] == [
+        ("insert", "r.bloom", "DefaultEngine.ini", "1"),
+        ("insert", "r.screenpercentage", "ProjectEngine.ini", None),
+        ("delete", "r.fog", "DefaultEngine.ini", "1"),
+    ]
+    assert notified == [{"r.bloom", "r.screenpercentage", "r.fog"}]
+    assert db.effective_setting("r.Bloom").value == "0"
+    assert db.effective_setting("r.Fog") is None
+
+
+def test_json_mapping_and_validation(tmp_path: Path):
+    db = _db(tmp_path)
+    data = tmp_path / "tuning.json"
+    data.write_text(json.dumps({"SystemSettings": {"r.Shadow.MaxResolution": 2048}}))
+    applied = bulk_import(db, data, target="DefaultEngine.ini")
+    assert applied[0].file == "DefaultEngine.ini" and applied[0].value == "2048"
+
+    data.write_text(json.dumps([{"key": "r.A", "value": "1"}, {"key": "r.B"}]))
+    with pytest.raises(ValueError, match="Row 2"):
+        bulk_import(db, data)
+    assert db.effective_setting("r.A") is None
+
+    data.write_text(json.dumps([{"key": "r.A", "value": "1"}, ["r.B", "2"]]))
+    with pytest.raises(ValueError, match="Row 2"):
+        bulk_import(db, data)
+    data.write_text(json.dumps({"SystemSettings": ["r.B=2"]}))
+    with pytest.raises(ValueError, match="SystemSettings"):
+        bulk_import(db, data)
+
+
+def test_failed_transaction_rolls_back(tmp_path: Path):
+    db = _db(tmp_path)
+    before = {ini.path.name: ini.snapshot() for ini in db.files}
+    with pytest.raises(ValueError):
+        with db.transaction() as tx:
+            tx.insert("ConsoleVariables", "r.New", "1")
+            tx.delete("ConsoleVariables", "r.Bloom")
+            tx.comment("ConsoleVariables", "r.Fog", target="Missing.ini")
+    assert {ini.path.name: ini.snapshot() for ini in db.files} == before
+    assert db.effective_setting("r.New") is None
+
+
+def test_transaction_tracks_targets_across_operations(tmp_path: Path):
+    db = _db(tmp_path)
+    with db.transaction() as tx:
+        tx.delete("ConsoleVariables", "r.Bloom")
+        tx.insert("ConsoleVariables", "r.Bloom", "2")
+        tx.insert("ConsoleVariables", "r.Bloom", "3")
+    # Each insert goes to the highest priority file not holding the key yet.
+    assert [(s.file, s.value) for s in db.settings()["r.bloom"]] == [
+        ("DefaultEngine.ini", "3"),
+        ("ProjectEngine.ini", "2"),
+    ]
@@ -0,0 +1,127 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from ue_configurator.cli import main, EXIT_OK, EXIT_FAILED, EXIT_ERROR
+
+
+def _project(tmp_path: Path) -> Path:
+    proj = tmp_path / "Proj"
+    cfg = proj / "Config"
+    cfg.mkdir(parents=True)
+    (proj / "Proj.uproject").write_text("{}")
+    (cfg / "DefaultGame.ini").write_text("[Section]\nKey=1\n")
+    (cfg / "ProjectGame.ini").write_text("[Section]\nKey=2\n")
+    return proj
+
+
+def _run(capsys, *argv: str):
+    code = main(list(argv))
+    return code, json.loads(capsys.readouterr().out)
+
+
+def test_duplicates_exit_code(tmp_path: Path, capsys):
+    proj = _project(tmp_path)
+    code, out = _run(capsys, "duplicates", str(proj / "Proj.uproject"))
+    assert code == EXIT_FAILED
+    assert out == [{"section": "Section", "key": "key", "files": ["DefaultGame.ini", "ProjectGame.ini"]}]
+
+    code, out = _run(capsys, "duplicates", str(proj), "--disable", "DefaultGame.ini")
+    assert code == EXIT_OK and out == []
+
+
+def test_resolve_then_validate(tmp_path: Path, capsys):
+    proj = _project(tmp_path)
+    code, out = _run(capsys, "resolve", str(proj), "--action", "delete")
+    assert code == EXIT_OK and out["backup"]
+    assert "key" not in (proj / "Config" / "DefaultGame.ini").read_text().lower()
+
+    code, out = _run(capsys, "validate", str(proj / "Config"))
+    assert code == EXIT_OK and out["ok"] is True
+
+
+def test_insert_dry_run_does_not_write(tmp_path: Path, capsys):
+    proj = _project(tmp_path)
+    code, out = _run(capsys, "insert", str(proj), "ConsoleVariables", "r.Test", "1", "--dry-run")
+    assert code == EXIT_OK
+    assert out["files"] == ["ProjectGame.ini"] and out["backup"] is None
+    assert "r.test" not in (proj / "Config" / "ProjectGame.ini").read_text().lower()
+
+
+def test_missing_project_is_an_error(tmp_path: Path, capsys):
+    code, out = _run(capsys, "files", str(tmp_path / "missing"))
+    assert code == EXIT_ERROR and "error" in out
+
+
+def test_cli_does_not_import_qt(tmp_path: Path):
+    proj = _project(tmp_path)
+    root = Path(__file__).resolve().parent.parent
+    script = (
+        "import sys, runpy; sys.argv = ['ue_configurator', 'files', %r]\n"
+        "try:\n    runpy.run_module('ue_configurator', run_name='__main__')\n"
+        "except SystemExit:\n    pass\n"
+        "assert not any(m.startswith('PySide6') for m in sys.modules)\n"
+    ) % str(proj)
+    subprocess.run([sys.executable, "-c", script], cwd=root, check=True, capture_output=True)
+
+
+def test_device_profiles_matrix(tmp_path: Path, capsys):
+    proj = _project(tmp_path)
+    (proj / "Config" / "DefaultDeviceProfiles.ini").write_text(
+        "[Windows DeviceProfile]\n+CVars=r.Bloom=1\n\n[WindowsClient DeviceProfile]\nBaseProfileName=Windows\n"
+    )
+    code, out = _run(capsys, "device-profiles", str(proj), "--profile", "WindowsClient")
+    assert code == EXIT_OK
+    assert out["profiles"] == {"WindowsClient": ["WindowsClient", "Windows"]}
+    assert out["cvars"] == {"r.Bloom": {"WindowsClient": {"value": "1", "from": "Windows"}}}
+
+
+def test_scalability_lookup(tmp_path: Path, capsys):
+    proj = _project(tmp_path)
+    (proj / "Config" / "DefaultScalability.ini").write_text("[ShadowQuality@2]\nr.ShadowQuality=3\n")
+    code, out = _run(capsys, "scalability", str(proj), "--group", "sg.ShadowQuality", "--level", "2")
+    assert code == EXIT_OK
+    assert out["groups"] == {"sg.ShadowQuality": {"2": {"r.ShadowQuality": "3"}}}
+
+    code, out = _run(capsys, "scalability", str(proj), "--cvar", "r.shadowquality")
+    assert out == [{"group": "sg.ShadowQuality", "level": "2", "value": "3"}]
+
+
+def test_merge_preset_dry_run_reports_delta(tmp_path: Path, capsys):
+    proj = _project(tmp_path)
+    preset = tmp_path / "preset.ini"
+    preset.write_text("[Section]\nKey=3\nOther=1\n")
+    code, out = _run(capsys, "merge-preset", str(proj), str(preset), "--dry-run")
+    assert code == EXIT_OK and out["backup"] is None
+    assert out["counts"] == {"add": 1, "change": 0, "noop": 0, "conflict": 1}
+    assert [c["key"] for c in out["changes"]] == ["key", "other"]
+
+
+def test_bulk_import_dry_run(tmp_path: Path, capsys):
+    proj = _project(tmp_path)
+    sheet = tmp_path / "rows.csv"
+    sheet.write_text("section,key,value\nSection,Other,5\n")
+    code, out = _run(capsys, "bulk-import", str(proj), str(sheet), "--dry-run")
+    assert code == EXIT_OK and out["backup"] is None
+    assert out["applied"] == [
+        {"action": "insert", "section": "Section", "key": "other", "value": "5", "file": "ProjectGame.ini"}
+    ]
+    assert "other" not in (proj / "Config" / "ProjectGame.ini").read_text().lower()
+
+
+def test_malformed_ini_is_an_error(tmp_path: Path, capsys):
+    proj = _project(tmp_path)
+    (proj / "Config" / "DefaultEngine.ini").write_text("r.Test=1\n")
+    code, out = _run(capsys, "validate", str(proj))
+    assert code == EXIT_ERROR and "error" in out
+
+
+def test_resolve_section_requires_key(tmp_path: Path, capsys):
+    proj = _project(tmp_path)
+    with pytest.raises(SystemExit) as exc:
+        main(["resolve", str(proj), "--section", "Section"])
+    assert exc.value.code == EXIT_ERROR
+    assert "Key=1" in (proj / "Config" / "DefaultGame.ini").read_text()
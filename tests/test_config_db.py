@@ -130,3 +130,47 @@ def test_insert_persists_after_validate(tmp_path: Path) -> None:
 
 
 
+
+
+def test_settings_reverse_index_tracks_edits(tmp_path: Path) -> None:
+    cfg = tmp_path / "Config"
+    cfg.mkdir()
+    write_ini(cfg / "DefaultEngine.ini", "[SystemSettings]\nr.Bloom=1\n")
+    write_ini(cfg / "ProjectEngine.ini", "[SystemSettings]\nr.Bloom=0\n")
+
+    db = ConfigDB()
+    db.load(cfg)
+    changes = []
+    db.add_listener(changes.append)
+    assert [s.file for s in db.settings()["r.bloom"]] == ["DefaultEngine.ini", "ProjectEngine.ini"]
+    assert db.effective_setting("r.Bloom").value == "0"
+
+    db.insert_setting("ConsoleVariables", "r.Fog", "1", "DefaultEngine.ini")
+    assert changes == [{"r.fog"}]
+    assert db.effective_setting("r.fog") == ("DefaultEngine.ini", "ConsoleVariables", "1")
+
+    db.resolve_duplicate("SystemSettings", "r.Bloom", "comment")
+    assert [s.file for s in db.settings()["r.bloom"]] == ["ProjectEngine.ini"]
+
+    db.set_file_enabled("ProjectEngine.ini", False)
+    assert changes[-1] is None
+    assert "r.bloom" not in db.settings()
+
+
+def test_resolve_skips_entries_already_commented(tmp_path: Path) -> None:
+    cfg = tmp_path / "Config"
+    cfg.mkdir()
+    write_ini(cfg / "DefaultEngine.ini", "[SystemSettings]\nr.x=1\n")
+    write_ini(cfg / "ProjectEngine.ini", "[SystemSettings]\nr.x=2\n")
+    write_ini(cfg / "PlatformEngine.ini", "[SystemSettings]\nr.x=3\n")
+
+    db = ConfigDB()
+    db.load(cfg)
+    # Comment out the highest priority entry; ProjectEngine.ini now wins.
+    db.files[2].comment_option("SystemSettings", "r.x")
+    db._changed()
+    dups = db.find_duplicates()[("SystemSettings", "r.x")]
+    assert [f.path.name for f in dups] == ["DefaultEngine.ini", "ProjectEngine.ini"]
+
+    db.resolve_duplicate("SystemSettings", "r.x", "comment")
+    assert db.settings()["r.x"] == [("ProjectEngine.ini", "SystemSettings", "2")]
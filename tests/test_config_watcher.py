@@ -0,0 +1,33 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+
+from ue_configurator.config_db import ConfigDB
+from ue_configurator.ui.config_watcher import ConfigWatcher
+
+
+def test_watcher_reports_external_edits(tmp_path: Path) -> None:
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    cfg = tmp_path / "Config"
+    cfg.mkdir()
+    path = cfg / "DefaultEngine.ini"
+    path.write_text("[S]\nr.Bloom=1\n")
+    db = ConfigDB()
+    db.load(cfg)
+
+    watcher = ConfigWatcher(db, force_polling=True)
+    assert str(path) in watcher.watcher.files()
+    assert watcher.poll_timer.isActive()
+    seen = []
+    watcher.changed.connect(seen.append)
+    assert watcher.check() == []
+
+    path.write_text("[S]\nr.Bloom=0\nr.Fog=0\n")
+    assert watcher.check() == ["DefaultEngine.ini"]
+    assert seen == [["DefaultEngine.ini"]]
+    db.reload_changed()
+    assert watcher.check() == []
@@ -0,0 +1,86 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+from PySide6.QtCore import Qt  # noqa: E402
+
+from ue_configurator.config_db import ConfigDB  # noqa: E402
+from ue_configurator.ui.conflict_pane import ACTION_COLUMN, ConflictPane, DuplicateModel  # noqa: E402
+
+
+def _db(tmp_path: Path, keys: int = 3) -> ConfigDB:
+    cfg = tmp_path / "Config"
+    cfg.mkdir()
+    lines = [f"Key{i}=default" for i in range(keys)]
+    (cfg / "DefaultGame.ini").write_text("[Section]\n" + "\n".join(lines) + "\n[Other]\nShadow=1\n")
+    (cfg / "ProjectGame.ini").write_text("[Section]\n" + "\n".join(l.replace("default", "project") for l in lines) + "\n[Other]\nShadow=2\n")
+    db = ConfigDB()
+    db.load(cfg)
+    return db
+
+
+def _value(db: ConfigDB, section: str, key: str):
+    return [(f, v) for f, s, k, v in ((ini.path.name, *opt[:3]) for ini in db.files for opt in ini.iter_options()) if (s, k) == (section, key)]
+
+
+def test_model_loads_rows_in_batches(tmp_path: Path) -> None:
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    db = _db(tmp_path, keys=600)
+    model = DuplicateModel(db)
+    model.set_duplicates(db.find_duplicates())
+    assert model.visible_count() == 601
+    assert model.rowCount() == DuplicateModel.BATCH
+    while model.canFetchMore(model.index(-1, 0).parent()):
+        model.fetchMore(model.index(-1, 0).parent())
+    assert model.rowCount() == 601
+
+    top = model.index(0, 0)
+    assert model.rowCount(top) == 2
+    child = model.index(1, 0, top)
+    assert child.parent() == top
+    assert child.data() == "ProjectGame.ini"
+    assert model.index(1, 1, top).data() == "project"
+    assert model.index(1, ACTION_COLUMN, top).data() == "Keep"
+
+    model.set_filter("shadow")
+    assert model.visible_count() == 1 and model.index(0, 1).data() == "shadow"
+
+
+def test_pane_bulk_actions_and_apply(tmp_path: Path) -> None:
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    db = _db(tmp_path)
+    pane = ConflictPane(db)
+    model = pane.model
+    assert model.rowCount() == 4
+    assert pane.tree.isPersistentEditorOpen(model.index(0, ACTION_COLUMN)) is False
+
+    pane.filter_box.setText("key")
+    pane.delete_all_btn.click()
+    pane.filter_box.setText("")
+    actions = {model.index(r, 1).data(): model.index(r, ACTION_COLUMN).data() for r in range(model.rowCount())}
+    assert actions == {"key0": "Delete", "key1": "Delete", "key2": "Delete", "shadow": "Comment"}
+    assert model.setData(model.index(1, ACTION_COLUMN), "Ignore")
+    assert not model.setData(model.index(1, 0), "Ignore")
+
+    pane.apply()
+    assert model.rowCount() == 1  # key1 was ignored
+    assert [v for f, v in _value(db, "Section", "key0")] == ["project"]
+    assert len(_value(db, "Section", "key1")) == 2
+    # One Apply is one undo step.
+    db.undo()
+    assert len(_value(db, "Section", "key0")) == 2
+
+
+def test_set_all_refreshes_file_rows(tmp_path: Path) -> None:
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    db = _db(tmp_path)
+    model = DuplicateModel(db)
+    model.set_duplicates(db.find_duplicates())
+    changed = []
+    model.dataChanged.connect(lambda first, last: changed.append((first.parent().row(), first.row(), last.row())))
+    model.set_all("Delete")
+    assert changed == [(-1, 0, 3), (0, 0, 1), (1, 0, 1), (2, 0, 1), (3, 0, 1)]
+    assert model.index(0, ACTION_COLUMN, model.index(0, 0)).data() == "Delete"
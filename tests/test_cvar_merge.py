@@ -0,0 +1,134 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import json
+from pathlib import Path
+
+from benchmarks import generators
+from ue_configurator.cvar_merge import DOCS, HEADERS, merge_sources, source_view
+from ue_configurator.header_watch import HeaderWatcher
+from ue_configurator.indexer import build_cache, docs_file
+
+
+def _rec(name, description="", default="", category="", range_="", file=""):
+    return {"name": name, "description": description, "default": default, "category": category, "range": range_, "file": file}
+
+
+HEADER_RECORDS = [
+    _rec("r.Shadow", "", "1.0f", "Rendering", "0-1", "Shadow.h"),
+    _rec("r.Fog", "Fog toggle", "1", "", "", "Fog.h"),
+    _rec("r.HeaderOnly", "Only in headers", "0", file="Only.h"),
+]
+DOC_RECORDS = [
+    _rec("R.SHADOW", "Enables  shadows.", "1"),
+    _rec("r.Fog", "Enables fog", "2"),
+    _rec("r.DocsOnly", "Only in docs", "3"),
+]
+
+
+def test_merge_fills_gaps_and_tracks_provenance() -> None:
+    result = merge_sources(HEADER_RECORDS, DOC_RECORDS)
+    by_name = {r["name"]: r for r in result.records}
+    assert list(by_name) == ["r.Shadow", "r.Fog", "r.HeaderOnly", "r.DocsOnly"]
+
+    shadow = by_name["r.Shadow"]
+    assert shadow["description"] == "Enables  shadows."
+    assert shadow["sources"] == [HEADERS, DOCS]
+    assert shadow["provenance"] == {
+        "description": DOCS,
+        "default": HEADERS,
+        "category": HEADERS,
+        "range": HEADERS,
+        "file": HEADERS,
+    }
+    assert "conflicts" not in shadow  # 1.0f == 1
+
+    assert by_name["r.Fog"]["conflicts"] == {
+        "description": {HEADERS: "Fog toggle", DOCS: "Enables fog"},
+        "default": {HEADERS: "1", DOCS: "2"},
+    }
+    assert [(c.name, c.field) for c in result.conflicts] == [("r.Fog", "description"), ("r.Fog", "default")]
+    assert by_name["r.DocsOnly"]["sources"] == [DOCS]
+    assert result.stats == {"headers+docs": 2, "headers": 1, "docs": 1}
+
+    docs_first = merge_sources(HEADER_RECORDS, DOC_RECORDS, priority=(DOCS, HEADERS))
+    assert docs_first.records[1]["default"] == "2"
+
+    assert source_view(shadow, HEADERS)["description"] == ""
+    assert source_view(shadow, HEADERS)["range"] == "0-1"
+    assert "provenance" not in source_view(shadow, HEADERS)
+
+
+def test_hash_join_scales() -> None:
+    records = generators.make_cvar_records(20000, seed=1)
+    docs = [dict(r, file="", category="", range="") for r in records[5000:]]
+    result = merge_sources(records[:15000], docs)
+    assert len(result.records) == 20000
+    assert result.stats == {"headers+docs": 10000, "headers": 5000, "docs": 5000}
+    assert not result.conflicts
+
+
+def test_merged_cache_survives_header_updates(tmp_path: Path) -> None:
+    root = tmp_path / "Engine"
+    root.mkdir()
+    (root / "Fog.h").write_text('IConsoleVariable::Register("r.Fog", 1, "Fog toggle");\n')
+    cache = build_cache(tmp_path / "cvar_cache.json", engine_root=root, docs=DOC_RECORDS)
+    assert docs_file(cache).exists()
+    data = {r["name"]: r for r in json.loads(cache.read_text())}
+    assert data["r.Fog"]["sources"] == [HEADERS, DOCS]
+    assert data["r.DocsOnly"]["sources"] == [DOCS]
+    assert "dtype" in data["r.DocsOnly"]
+
+    (root / "Fog.h").write_text('IConsoleVariable::Register("r.Fog", 2, "Fog toggle");\n')
+    st = (root / "Fog.h").stat()
+    os.utime(root / "Fog.h", ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    watcher = HeaderWatcher.from_cache(cache, root)
+    delta = watcher.scan()
+    assert [r["name"] for r in delta.updated] == ["r.Fog"]
+    watcher.write(cache)
+    data = {r["name"]: r for r in json.loads(cache.read_text())}
+    assert data["r.Fog"]["default"] == "2"
+    assert data["r.Fog"]["provenance"]["default"] == HEADERS
+    assert "r.DocsOnly" in data
+
+    build_cache(tmp_path / "cvar_cache.json", engine_root=root)
+    assert not docs_file(cache).exists()
+
+
+def test_merge_keeps_header_macro_type(tmp_path: Path) -> None:
+    root = tmp_path / "Engine"
+    root.mkdir()
+    (root / "Foo.h").write_text('UE_CVAR_STRING("r.Foo", 1, "Foo name");\n')
+    (root / "Bar.h").write_text('UE_CVAR_INTEGER("r.Bar", 1, "Bar");\n')
+    docs = [_rec("r.Foo", "Foo name", "1", range_="0-4")]
+    cache = build_cache(tmp_path / "cvar_cache.json", engine_root=root, docs=docs)
+    foo = {r["name"]: r for r in json.loads(cache.read_text())}["r.Foo"]
+    assert (foo["dtype"], foo["cpp_type"]) == ("str", "FString")
+    assert foo["provenance"]["dtype"] == HEADERS
+    assert source_view(foo, HEADERS)["dtype"] == "str"
+    assert source_view(foo, DOCS)["dtype"] == "int"
+
+    (root / "Bar.h").write_text('UE_CVAR_INTEGER("r.Bar", 2, "Bar");\n')
+    st = (root / "Bar.h").stat()
+    os.utime(root / "Bar.h", ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    watcher = HeaderWatcher.from_cache(cache, root)
+    assert [r["name"] for r in watcher.scan().updated] == ["r.Bar"]
+    watcher.write(cache)
+    foo = {r["name"]: r for r in json.loads(cache.read_text())}["r.Foo"]
+    assert (foo["dtype"], foo["cpp_type"]) == ("str", "FString")
+
+
+def test_guessed_header_type_conflicts_with_docs(tmp_path: Path) -> None:
+    root = tmp_path / "Engine"
+    root.mkdir()
+    (root / "Fog.h").write_text('IConsoleVariable::Register("r.Fog", 1, "Fog toggle");\n')
+    docs = [_rec("r.Fog", "Fog toggle", "Low", range_="Low|High")]
+    cache = build_cache(tmp_path / "cvar_cache.json", engine_root=root, docs=docs)
+    fog = json.loads(cache.read_text())[0]
+    assert "macro" not in fog
+    assert (fog["dtype"], fog["options"]) == ("str", ["Low", "High"])
+    assert fog["provenance"]["dtype"] == DOCS
+    assert fog["conflicts"]["dtype"] == {HEADERS: "int", DOCS: "str"}
+
+    result = merge_sources([dict(fog, macro="INTEGER", dtype="int")], docs)
+    assert result.records[0]["dtype"] == "int"
+    assert result.records[0]["provenance"]["dtype"] == HEADERS
+    assert "dtype" not in result.records[0].get("conflicts", {})
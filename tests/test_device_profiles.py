@@ -0,0 +1,92 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from pathlib import Path
+
+import pytest
+
+from ue_configurator.config_db import ConfigDB
+from ue_configurator.device_profiles import DeviceProfile, DeviceProfileResolver, layers_from_db
+
+PROFILES = """[Android DeviceProfile]
+DeviceType=Android
+BaseProfileName=
++CVars=r.MobileContentScaleFactor=1.0
++CVars=r.Shadow.MaxResolution=1024
+
+[Android_High DeviceProfile]
+BaseProfileName=Android
++CVars=r.Shadow.MaxResolution=2048
+
+[Android_Adreno DeviceProfile]
+BaseProfileName=Android_High
++CVars=r.Bloom=0
+"""
+
+
+def _config(tmp_path: Path) -> Path:
+    cfg = tmp_path / "Config"
+    (cfg / "Android").mkdir(parents=True)
+    (cfg / "DefaultDeviceProfiles.ini").write_text(PROFILES)
+    (cfg / "Android" / "AndroidDeviceProfiles.ini").write_text(
+        "[Android_High DeviceProfile]\n"
+        "-CVars=r.Shadow.MaxResolution=2048\n"
+        "+CVars=r.Shadow.MaxResolution=4096\n"
+    )
+    return cfg
+
+
+def test_inheritance_and_layers(tmp_path: Path):
+    resolver = DeviceProfileResolver.from_config_dir(_config(tmp_path))
+    assert resolver.chain("Android_Adreno") == ["Android_Adreno", "Android_High", "Android"]
+    eff = resolver.effective("Android_Adreno")
+    assert eff["r.shadow.maxresolution"] == ("r.Shadow.MaxResolution", "4096", "Android_High")
+    assert eff["r.mobilecontentscalefactor"][2] == "Android"
+    assert eff["r.bloom"][1] == "0"
+
+    matrix = resolver.matrix(cvars=["r.Shadow.MaxResolution"])
+    assert matrix == {
+        "r.Shadow.MaxResolution": {
+            "Android": ("1024", "Android"),
+            "Android_Adreno": ("4096", "Android_High"),
+            "Android_High": ("4096", "Android_High"),
+        }
+    }
+
+
+def test_changes_invalidate_only_descendants(tmp_path: Path):
+    resolver = DeviceProfileResolver.from_config_dir(_config(tmp_path))
+    for name in resolver.names():
+        resolver.effective(name)
+    android = resolver.effective("Android")
+
+    assert resolver.set_cvar("Android_High", "r.Bloom", "1") == {"Android_High", "Android_Adreno"}
+    assert resolver.effective("Android") is android
+    assert resolver.effective("Android_High")["r.bloom"][1] == "1"
+    # The child still overrides the inherited value.
+    assert resolver.effective("Android_Adreno")["r.bloom"][1] == "0"
+
+    resolver.update_profile(DeviceProfile("Android_Adreno", base="Android"))
+    assert resolver.chain("Android_Adreno") == ["Android_Adreno", "Android"]
+    assert "r.bloom" not in resolver.effective("Android_Adreno")
+
+
+def test_reload_from_db_and_duplicates(tmp_path: Path):
+    cfg = _config(tmp_path)
+    db = ConfigDB()
+    db.load(cfg)
+    # Array operations are not reported as duplicate keys.
+    assert not db.find_duplicates()
+
+    resolver = DeviceProfileResolver.from_db(db)
+    for name in resolver.names():
+        resolver.effective(name)
+    db.insert_setting("Android_Adreno DeviceProfile", "BaseProfileName", "Android", "DefaultDeviceProfiles.ini")
+    assert resolver.reload(layers_from_db(db)) == {"Android_Adreno"}
+    assert resolver.effective("Android_Adreno")["r.shadow.maxresolution"][1] == "1024"
+
+
+def test_cycle_is_reported():
+    resolver = DeviceProfileResolver(
+        {"A": DeviceProfile("A", base="B"), "B": DeviceProfile("B", base="A")}
+    )
+    with pytest.raises(ValueError):
+        resolver.effective("A")
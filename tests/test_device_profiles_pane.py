@@ -0,0 +1,29 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from pathlib import Path
+import pytest
+
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+QApplication = QtWidgets.QApplication
+DeviceProfilesPane = pytest.importorskip("ue_configurator.ui.device_profiles_pane").DeviceProfilesPane
+ConfigDB = pytest.importorskip("ue_configurator.config_db").ConfigDB
+
+
+def test_matrix_updates_after_edit(tmp_path: Path):
+    app = QApplication.instance() or QApplication([])
+    cfg = tmp_path / "Config"
+    cfg.mkdir()
+    (cfg / "DefaultDeviceProfiles.ini").write_text(
+        "[IOS DeviceProfile]\n+CVars=r.Bloom=1\n\n"
+        "[iPhone15 DeviceProfile]\nBaseProfileName=IOS\n"
+    )
+    db = ConfigDB()
+    db.load(cfg)
+    pane = DeviceProfilesPane(db)
+    headers = [pane.model.horizontalHeaderItem(c).text() for c in range(pane.model.columnCount())]
+    assert headers == ["CVar", "IOS", "iPhone15"]
+    assert pane.model.item(0, 2).text() == "1"
+    assert pane.model.item(0, 2).toolTip() == "Inherited from IOS"
+
+    db.insert_setting("iPhone15 DeviceProfile", "BaseProfileName", "", "DefaultDeviceProfiles.ini")
+    assert pane.model.item(0, 2).text() == ""
@@ -0,0 +1,72 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from pathlib import Path
+
+import pytest
+
+from benchmarks import generators
+from ue_configurator.doc_parser import ConsoleVariableTableParser, iter_console_variables, parse_console_variable_page
+
+EDGE_PAGE = """
+<table class="nav"><tr><td>x</td><td>y</td><td>z</td></tr></table>
+<table class="table striped"><thead><tr><th>Variable</th><th>Default</th><th>Description</th></tr></thead><tbody>
+<tr><td><code>r.A</code></td><td> 1 </td><td>Multi
+ line &amp; <b>bold</b> text<!-- note -->more <script>skip()</script>x<br>y &#150; café</td></tr>
+<tr><td>r.Short</td><td>1</td></tr>
+<tr><td><p>r.B</p></td><td><![CDATA[2]]></td><td>  </td></tr>
+</tbody></table>
+"""
+
+
+def _bs4_parse(html: str) -> list:
+    """The previous DOM based implementation."""
+    bs4 = pytest.importorskip("bs4")
+    soup = bs4.BeautifulSoup(html, "html.parser")
+    results = []
+    for table in soup.find_all("table", class_="table"):
+        for row in table.find_all("tr")[1:]:
+            cols = row.find_all("td")
+            if len(cols) < 3:
+                continue
+            name, default, desc = (c.get_text(strip=True) for c in cols[:3])
+            results.append(
+                {"name": name, "description": desc, "default": default, "category": "", "range": "", "file": ""}
+            )
+    return results
+
+
+def _chunked(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def test_edge_cases_match_previous_parser() -> None:
+    expected = _bs4_parse(EDGE_PAGE)
+    assert [r["name"] for r in expected] == ["r.A", "r.B"]
+    assert parse_console_variable_page(EDGE_PAGE) == expected
+    data = EDGE_PAGE.encode("utf-8")
+    for size in (1, 3, 17):
+        # Chunk borders fall inside tags, entities and multi-byte characters.
+        assert list(iter_console_variables(_chunked(data, size), use_lxml=False)) == expected
+        assert list(iter_console_variables(_chunked(EDGE_PAGE, size), use_lxml=False)) == expected
+
+
+def test_generated_page_matches_previous_parser(tmp_path: Path) -> None:
+    html = generators.make_docs_page(tmp_path / "page.html", rows=300, tables=4).read_text(encoding="utf-8")
+    expected = _bs4_parse(html)
+    assert len(expected) == 300
+    assert list(iter_console_variables(_chunked(html.encode(), 4096), use_lxml=False)) == expected
+
+
+def test_lxml_backend_matches(tmp_path: Path) -> None:
+    pytest.importorskip("lxml")
+    html = generators.make_docs_page(tmp_path / "page.html", rows=300, tables=4).read_text(encoding="utf-8")
+    assert list(iter_console_variables(_chunked(html.encode(), 4096), use_lxml=True)) == _bs4_parse(html)
+
+
+def test_rows_are_available_before_the_page_ends() -> None:
+    parser = ConsoleVariableTableParser()
+    head, tail = EDGE_PAGE.split("<tr><td>r.Short")
+    parser.feed(head)
+    assert [r["name"] for r in parser.pop_records()] == ["r.A"]
+    parser.feed("<tr><td>r.Short" + tail)
+    parser.close()
+    assert [r["name"] for r in parser.pop_records()] == ["r.B"]
@@ -0,0 +1,85 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import json
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from ue_configurator.docs_bundle import import_bundle, list_pages, parse_bundle, version_from_path
+
+
+def _page(*rows, head=""):
+    body = "".join(f"<tr><td><code>{n}</code></td><td>{d}</td><td>{t}</td></tr>" for n, d, t in rows)
+    return (
+        f"<html><head>{head}</head><body>"
+        '<a href="?application_version=5.5">5.5</a>'
+        '<table class="table"><tr><th>Variable</th><th>Default</th><th>Description</th></tr>'
+        f"{body}</table></body></html>"
+    )
+
+
+PAGES = {
+    "5.4/page1.html": _page(("r.A", "1", "First"), ("r.B", "0", "Second")),
+    "5.4/page2.htm": _page(("r.B", "9", "Repeated"), ("r.C", "2", "Third")),
+    "reference-5.5.html": _page(("r.A", "0", "Changed")),
+    "saved.html": _page(
+        ("r.Old", "1", "Older"),
+        head="<!-- saved from url=(0090)https://dev.epicgames.com/documentation/en-us/unreal-engine/"
+        "unreal-engine-console-variables-reference?application_version=5.3 -->",
+    ),
+    "notes.txt": "not a page",
+}
+
+
+def _dir_bundle(tmp_path: Path) -> Path:
+    root = tmp_path / "bundle"
+    for name, text in PAGES.items():
+        (root / name).parent.mkdir(parents=True, exist_ok=True)
+        (root / name).write_text(text, encoding="utf-8")
+    return root
+
+
+def _zip_bundle(tmp_path: Path) -> Path:
+    path = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, text in PAGES.items():
+            zf.writestr(f"docs/{name}", text)
+    return path
+
+
+def test_version_from_path() -> None:
+    assert version_from_path("5.4/page1.html") == "5.4"
+    assert version_from_path("UE_5.3/reference-5.5.html") == "5.5"
+    assert version_from_path("page2.html") is None
+    assert version_from_path("5.4.1/page.html") is None
+
+
+@pytest.mark.parametrize("make", [_dir_bundle, _zip_bundle])
+def test_parse_bundle_groups_pages_by_version(tmp_path: Path, make) -> None:
+    bundle = make(tmp_path)
+    assert len(list_pages(bundle)) == 4
+    per_version = parse_bundle(bundle, default_version="5.0", workers=2)
+    assert sorted(per_version) == ["5.3", "5.4", "5.5"]
+    assert [(r["name"], r["default"]) for r in per_version["5.4"]] == [("r.A", "1"), ("r.B", "0"), ("r.C", "2")]
+    assert per_version["5.5"][0]["description"] == "Changed"
+    assert [r["name"] for r in per_version["5.3"]] == ["r.Old"]
+    assert parse_bundle(bundle, workers=1) == per_version
+
+
+def test_import_bundle_merges_into_versioned_cache(tmp_path: Path) -> None:
+    cache = tmp_path / "cvar_cache.json"
+    header = {"name": "r.A", "description": "From header", "default": "1", "category": "", "range": "", "file": "A.h"}
+    docs = {"name": "r.B", "description": "Old docs", "default": "5", "category": "", "range": "", "file": ""}
+    (tmp_path / "cvar_cache-5.4.json").write_text(json.dumps([header, docs]))
+
+    written = import_bundle(_dir_bundle(tmp_path), cache, workers=1)
+    assert sorted(written) == ["5.3", "5.4", "5.5"]
+    data = json.loads(written["5.4"].read_text())
+    assert [(r["name"], r["description"]) for r in data] == [("r.A", "From header"), ("r.B", "Second"), ("r.C", "Third")]
+    assert all("dtype" in r for r in data)
+
+
+def test_rejects_other_paths(tmp_path: Path) -> None:
+    (tmp_path / "page.html").write_text("<html></html>")
+    with pytest.raises(ValueError):
+        list_pages(tmp_path / "page.html")
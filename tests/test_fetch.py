@@ -0,0 +1,110 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from ue_configurator.fetch import Fetcher
+from ue_configurator.indexer import scrape_console_variables
+
+PAGE = """
+<table class="table">
+<tr><th>Variable</th><th>Default Value</th><th>Description</th></tr>
+<tr><td><code>r.Local</code></td><td>1</td><td>Served locally</td></tr>
+</table>
+"""
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):  # noqa: N802 - http.server API
+        server = self.server
+        server.requests.append((self.path, dict(self.headers)))
+        if self.path.startswith("/flaky") and server.failures:
+            server.failures -= 1
+            self.send_response(503)
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            return
+        if self.path.startswith("/missing"):
+            self.send_response(404)
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = PAGE.encode()
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.requests = []
+    httpd.failures = 0
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_unchanged_page_is_served_from_cache(server, tmp_path):
+    fetcher = Fetcher(cache_dir=tmp_path, sleep=lambda _s: None)
+    first = scrape_console_variables("5.4", fetcher, base_url=f"{server.url}/docs")
+    second = fetcher.get(f"{server.url}/docs?application_version=5.4")
+    assert [d["name"] for d in first] == ["r.Local"]
+    assert (second.status, second.from_cache) == (304, True)
+    assert "r.Local" in second.text
+    assert server.requests[1][1].get("If-None-Match") == '"v1"'
+
+    # A new fetcher (next app start) still revalidates instead of downloading.
+    assert Fetcher(cache_dir=tmp_path).get(f"{server.url}/docs?application_version=5.4").from_cache
+
+
+def test_transient_errors_are_retried_with_backoff(server):
+    delays = []
+    server.failures = 2
+    fetcher = Fetcher(cache_dir=None, retries=3, sleep=delays.append)
+    result = fetcher.get(f"{server.url}/flaky")
+    assert result.status == 200
+    assert delays == [0.0, 0.0]  # Retry-After: 0
+
+    server.failures = 5
+    with pytest.raises(requests.HTTPError):
+        Fetcher(cache_dir=None, retries=2, sleep=delays.append).get(f"{server.url}/flaky")
+
+
+def test_backoff_uses_bounded_jitter():
+    fetcher = Fetcher(session=object(), cache_dir=None, backoff=1.0, max_backoff=3.0)
+    delays = [fetcher._delay(attempt, None) for attempt in range(6) for _ in range(20)]
+    assert all(0 <= d <= 3.0 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_client_errors_are_not_retried(server):
+    delays = []
+    with pytest.raises(requests.HTTPError):
+        Fetcher(cache_dir=None, sleep=delays.append).get(f"{server.url}/missing")
+    assert delays == []
+    assert len(server.requests) == 1
+
+
+def test_iter_text_streams_and_caches(server, tmp_path):
+    fetcher = Fetcher(cache_dir=tmp_path)
+    chunks = list(fetcher.iter_text(f"{server.url}/page", chunk_size=16))
+    assert len(chunks) > 1 and "".join(chunks) == PAGE
+
+    assert list(fetcher.iter_text(f"{server.url}/page")) == [PAGE]
+    assert server.requests[-1][1].get("If-None-Match") == '"v1"'
+    with pytest.raises(requests.HTTPError):
+        fetcher.iter_text(f"{server.url}/missing")
@@ -0,0 +1,103 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from pathlib import Path
+
+from ue_configurator.config_db import ConfigDB
+from ue_configurator.file_stats import FileStatsIndex, scan_file, scan_snapshot
+
+
+def _load(tmp_path: Path) -> ConfigDB:
+    cfg = tmp_path / "Config"
+    cfg.mkdir()
+    (cfg / "DefaultEngine.ini").write_text(
+        "[Core]\nA=1\nB=1\n;C=1\n+Paths=x\n+Paths=y\n"
+    )
+    (cfg / "DefaultGame.ini").write_text("[Core]\nA=2\nD=2\n")
+    (cfg / "ProjectEngine.ini").write_text("[Core]\nA=3\nB=3\nD=3\n+Paths=z\n")
+    db = ConfigDB()
+    db.load(cfg)
+    return db
+
+
+def _index(db: ConfigDB) -> FileStatsIndex:
+    index = FileStatsIndex(db.list_files())
+    # Scans may arrive in any order.
+    for ini in reversed(db.files):
+        index.add(scan_file(ini))
+    return index
+
+
+def _counts(index: FileStatsIndex):
+    return {n: (index[n].duplicates, index[n].shadowed) for n in index.names}
+
+
+def test_scan_counts_uncommented_entries(tmp_path):
+    db = _load(tmp_path)
+    scan = scan_file(db.files[0])
+    assert scan.name == "DefaultEngine.ini"
+    assert scan.entries == 4
+    assert scan.keys == {("Core", "a"), ("Core", "b")}
+    assert scan.size == db.files[0].path.stat().st_size
+    assert scan.mtime is not None
+
+
+def test_duplicates_and_shadowed_match_find_duplicates(tmp_path):
+    db = _load(tmp_path)
+    index = _index(db)
+    assert _counts(index) == {
+        "DefaultEngine.ini": (2, 2),
+        "DefaultGame.ini": (2, 2),
+        "ProjectEngine.ini": (3, 0),
+    }
+    dups = db.find_duplicates()
+    for name in index.names:
+        assert index[name].duplicates == sum(
+            1 for files in dups.values() if name in [f.path.name for f in files]
+        )
+
+
+def test_toggling_updates_counts_incrementally(tmp_path):
+    db = _load(tmp_path)
+    index = _index(db)
+    before = _counts(index)
+
+    changed = index.set_enabled("ProjectEngine.ini", False)
+    db.set_file_enabled("ProjectEngine.ini", False)
+    assert changed == set(index.names)
+    assert _counts(index) == {
+        "DefaultEngine.ini": (1, 1),
+        "DefaultGame.ini": (1, 0),
+        "ProjectEngine.ini": (0, 0),
+    }
+    assert index["DefaultGame.ini"].duplicates == len(
+        [k for k, files in db.find_duplicates().items() if db.files[1] in files]
+    )
+
+    index.set_enabled("ProjectEngine.ini", True)
+    assert _counts(index) == before
+    assert index.set_enabled("ProjectEngine.ini", True) == set()
+
+
+def test_rescan_replaces_previous_keys(tmp_path):
+    db = _load(tmp_path)
+    index = _index(db)
+    db.files[2].comment_option("Core", "a")
+    db.files[2].comment_option("Core", "b")
+    db.files[2].comment_option("Core", "d")
+    index.add(scan_file(db.files[2]))
+    assert _counts(index) == {
+        "DefaultEngine.ini": (1, 1),
+        "DefaultGame.ini": (1, 0),
+        "ProjectEngine.ini": (0, 0),
+    }
+    assert index["ProjectEngine.ini"].entries == 1
+
+
+def test_snapshot_scan_matches_live_scan(tmp_path):
+    db = _load(tmp_path)
+    ini = db.files[0]
+    text = ini.snapshot()
+    db.insert_setting("Core", "E", "1", "DefaultEngine.ini")
+    # The snapshot is unaffected by later edits.
+    scan = scan_snapshot(ini.path, text)
+    assert scan.keys == {("Core", "a"), ("Core", "b")}
+    assert scan_snapshot(ini.path, ini.snapshot()) == scan_file(ini)
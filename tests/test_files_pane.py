@@ -8,6 +8,7 @@ QApplication = QtWidgets.QApplication
 FilesPane = pytest.importorskip("ue_configurator.ui.files_pane").FilesPane
 ConfigDB = pytest.importorskip("ue_configurator.config_db").ConfigDB
 QUrl = pytest.importorskip("PySide6.QtCore").QUrl
+Qt = pytest.importorskip("PySide6.QtCore").Qt
 
 
 def _make_db(tmp_path: Path) -> ConfigDB:
@@ -39,3 +40,31 @@ def test_open_item_uses_desktop_services(tmp_path, monkeypatch):
     monkeypatch.setattr("PySide6.QtGui.QDesktopServices.openUrl", fake_open)
     pane._open_item(item)
     assert captured["url"].toLocalFile() == str(db.config_dir / item.text())
+
+
+def test_files_pane_streams_stats_and_updates_on_toggle(tmp_path):
+    app = QApplication.instance() or QApplication([])
+    config_dir = tmp_path / "Config"
+    config_dir.mkdir()
+    (config_dir / "DefaultGame.ini").write_text("[S]\nA=1\nB=1\n")
+    (config_dir / "ProjectGame.ini").write_text("[S]\nA=2\n")
+    db = ConfigDB()
+    db.load(config_dir)
+    pane = FilesPane(db)
+    pane._thread.wait(5000)
+    app.processEvents()
+    stats = pane.stats["DefaultGame.ini"]
+    assert (stats.entries, stats.duplicates, stats.shadowed) == (2, 1, 1)
+    STATS_ROLE = pytest.importorskip("ue_configurator.ui.files_pane").STATS_ROLE
+    assert "1 duplicates" in pane.list.item(0).data(STATS_ROLE)
+
+    generation = pane._generation
+    pane.list.item(1).setCheckState(Qt.Unchecked)
+    app.processEvents()
+    assert not db.files[1].enabled
+    assert (stats.duplicates, stats.shadowed) == (0, 0)
+    assert "0 duplicates" in pane.list.item(0).data(STATS_ROLE)
+    assert pane.list.item(0).text() == "DefaultGame.ini"
+    # Counts were updated without starting another scan.
+    assert pane._generation == generation
+    pane.close()
@@ -0,0 +1,89 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import json
+from pathlib import Path
+
+from ue_configurator.header_watch import HeaderWatcher, watch_cache
+from ue_configurator.indexer import build_cache, header_state_file
+
+
+def _header(path: Path, *cvars: tuple[str, str]) -> None:
+    path.write_text(
+        "\n".join(f'IConsoleVariable::Register("{name}", 0, "{desc}");' for name, desc in cvars)
+    )
+    # Make sure the fingerprint changes even on coarse timestamp filesystems.
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def _engine(tmp_path: Path) -> Path:
+    root = tmp_path / "Engine"
+    (root / "Renderer").mkdir(parents=True)
+    _header(root / "Renderer" / "A.h", ("r.A", "A"), ("r.Gone", "gone"))
+    _header(root / "B.h", ("r.B", "B"))
+    return root
+
+
+def test_scan_reports_row_level_delta(tmp_path: Path, monkeypatch) -> None:
+    root = _engine(tmp_path)
+    watcher = HeaderWatcher(root)
+    first = watcher.scan()
+    assert sorted(r["name"] for r in first.added) == ["r.A", "r.B", "r.Gone"]
+    assert not watcher.scan()
+
+    parsed = []
+    import ue_configurator.header_watch as hw
+
+    real = hw.index_header
+    monkeypatch.setattr(hw, "index_header", lambda p: parsed.append(p.name) or real(p))
+    _header(root / "Renderer" / "A.h", ("r.A", "A changed"), ("r.New", "new"))
+    delta = watcher.scan()
+    assert parsed == ["A.h"]
+    assert [r["name"] for r in delta.added] == ["r.New"]
+    assert [(r["name"], r["description"]) for r in delta.updated] == [("r.A", "A changed")]
+    assert delta.removed == ["r.Gone"]
+
+    # Moving a CVar to another header is an update, deleting a header removes its CVars.
+    _header(root / "B.h", ("r.B", "B"), ("r.New", "new"))
+    _header(root / "Renderer" / "A.h", ("r.A", "A changed"))
+    delta = watcher.scan()
+    assert (delta.added, delta.removed) == ([], [])
+    assert [r["file"] for r in delta.updated] == [str(root / "B.h")]
+    (root / "B.h").unlink()
+    assert sorted(watcher.scan().removed) == ["r.B", "r.New"]
+    assert [r["name"] for r in watcher.records()] == ["r.A"]
+
+
+def test_watch_cache_reuses_build_fingerprints(tmp_path: Path) -> None:
+    root = _engine(tmp_path)
+    target = build_cache(tmp_path / "cache.json", root, "5.4")
+    assert header_state_file(target).exists()
+
+    deltas = []
+    watch_cache(target, root, interval=0, iterations=1, on_delta=deltas.append)
+    assert deltas == []
+
+    _header(root / "B.h", ("r.B", "B"), ("r.C", "C"))
+    watch_cache(target, root, interval=0, iterations=1, on_delta=deltas.append)
+    assert [r["name"] for r in deltas[0].added] == ["r.C"]
+    names = sorted(r["name"] for r in json.loads(target.read_text()))
+    assert names == ["r.A", "r.B", "r.C", "r.Gone"]
+
+
+def test_delta_carries_merged_records(tmp_path: Path) -> None:
+    root = _engine(tmp_path)
+    docs = [
+        {"name": "r.Gone", "description": "Documented", "default": "0"},
+        {"name": "r.New", "description": "New from docs", "default": "0", "range": "0-4"},
+    ]
+    target = build_cache(tmp_path / "cache.json", root, "5.4", docs=docs)
+    _header(root / "Renderer" / "A.h", ("r.A", "A"), ("r.New", "new"))
+
+    deltas = []
+    watch_cache(target, root, interval=0, iterations=1, on_delta=deltas.append)
+    [delta] = deltas
+    [new] = delta.added
+    assert new["sources"] == ["headers", "docs"]
+    assert (new["range"], new["max"]) == ("0-4", 4)
+    gone = {r["name"]: r for r in delta.updated}["r.Gone"]
+    assert (gone["sources"], gone["description"]) == (["docs"], "Documented")
+    assert delta.removed == []
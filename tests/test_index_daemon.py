@@ -0,0 +1,97 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import json
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from ue_configurator.cvar_index import CVarIndex
+from ue_configurator.index_daemon import IndexClient, IndexServer
+
+RECORDS = [
+    {"name": "r.Shadow.MaxResolution", "description": "Max shadow map size", "category": "Rendering"},
+    {"name": "a.Budget", "description": "Animation budget", "category": ""},
+]
+
+
+def _cache(tmp_path: Path) -> Path:
+    cache = tmp_path / "cache.json"
+    cache.with_name("cache-5.4.json").write_text(json.dumps(RECORDS))
+    return cache
+
+
+def test_cvar_index_queries():
+    index = CVarIndex(RECORDS)
+    assert index.lookup("R.SHADOW.MAXRESOLUTION")["name"] == "r.Shadow.MaxResolution"
+    assert [r["name"] for r in index.search("budget")] == ["a.Budget"]
+    assert index.search("shadow", category="Audio") == []
+    assert index.unknown(["a.budget", "r.Nope"]) == ["r.Nope"]
+
+
+def test_client_falls_back_without_daemon(tmp_path: Path):
+    client = IndexClient(_cache(tmp_path), "5.4", path=tmp_path / "missing.sock")
+    assert not client.is_remote
+    assert client.lookup("a.budget")["name"] == "a.Budget"
+
+
+@pytest.mark.skipif(IndexServer is None, reason="AF_UNIX not available")
+def test_client_queries_running_daemon(tmp_path: Path):
+    # Keep the socket path short; AF_UNIX paths are limited to ~100 bytes.
+    sock_path = Path(tempfile.mkdtemp()) / "idx.sock"
+    server = IndexServer(sock_path, CVarIndex(RECORDS))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with IndexClient(tmp_path / "unused.json", "5.4", path=sock_path) as client:
+            assert client.is_remote
+            assert client.search("shadow")[0]["name"] == "r.Shadow.MaxResolution"
+            assert client.validate(["r.Typo", "a.Budget"]) == ["r.Typo"]
+            with pytest.raises(ValueError):
+                client._call({"op": "bogus"})
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert not sock_path.exists()
+
+
+@pytest.mark.skipif(IndexServer is None, reason="AF_UNIX not available")
+def test_server_refuses_to_replace_regular_file(tmp_path: Path):
+    path = tmp_path / "notes.txt"
+    path.write_text("keep me")
+    with pytest.raises(RuntimeError):
+        IndexServer(path, CVarIndex(RECORDS))
+    assert path.read_text() == "keep me"
+
+
+@pytest.mark.skipif(IndexServer is None, reason="AF_UNIX not available")
+def test_server_reloads_changed_cache(tmp_path: Path):
+    cache = _cache(tmp_path)
+    sock_path = Path(tempfile.mkdtemp()) / "idx.sock"
+    server = IndexServer(sock_path, CVarIndex.from_cache(cache, "5.4"), cache, "5.4")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with IndexClient(cache, "5.4", path=sock_path) as client:
+            assert len(client) == 2
+            assert client.lookup("r.New") is None
+            new = [*RECORDS, {"name": "r.New", "description": "Added later", "category": ""}]
+            cache.with_name("cache-5.4.json").write_text(json.dumps(new))
+            assert client.lookup("r.New")["description"] == "Added later"
+            assert sorted(client.names()) == ["a.Budget", "r.New", "r.Shadow.MaxResolution"]
+            assert client.complete("r.sh") == ["r.Shadow.MaxResolution"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_fallback_reloads_changed_cache(tmp_path: Path):
+    cache = _cache(tmp_path)
+    client = IndexClient(cache, "5.4", path=tmp_path / "missing.sock")
+    assert client.lookup("r.New") is None
+    cache.with_name("cache-5.4.json").write_text(json.dumps([*RECORDS, {"name": "r.New"}]))
+    assert client.lookup("r.New") is not None
+
+    local = IndexClient(cache, None, local=lambda: CVarIndex(RECORDS[:1]))
+    assert not local.is_remote
+    assert len(local) == 1
@@ -44,3 +44,17 @@ def test_detect_version(tmp_path: Path):
     proj.mkdir()
     (proj / "Proj.uproject").write_text('{"EngineAssociation": "5.2"}')
     assert detect_version_from_uproject(proj) == "5.2"
+
+
+def test_index_headers_stores_typed_metadata(tmp_path: Path):
+    header = tmp_path / "test.h"
+    header.write_text(
+        "// Range: 0-4\n"
+        'UE_CVAR_FLOAT("r.Scale", 1, "Scale");\n'
+        'IConsoleVariable::Register("r.Mode", 0, "Mode");\n'
+    )
+    items = {r["name"]: r for r in index_headers(tmp_path)}
+    assert items["r.Scale"]["dtype"] == "float"
+    assert (items["r.Scale"]["min"], items["r.Scale"]["max"]) == (0, 4)
+    assert items["r.Scale"]["cpp_type"] == "float"
+    assert items["r.Mode"]["cpp_type"] == "int32"
@@ -0,0 +1,109 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from pathlib import Path
+
+from ue_configurator.config_db import ConfigDB
+
+SECTION = "/Script/Engine.RendererSettings"
+
+
+def _db(tmp_path: Path) -> tuple[ConfigDB, Path]:
+    cfg = tmp_path / "Config"
+    cfg.mkdir()
+    (cfg / "DefaultEngine.ini").write_text(f"[{SECTION}]\nr.Bloom=1\nr.Fog=1\n+CVars=r.A=1\n")
+    (cfg / "DefaultGame.ini").write_text("[/Script/Game]\nKey=1\n")
+    db = ConfigDB()
+    db.load(cfg)
+    return db, cfg
+
+
+def _edit(path: Path, text: str) -> None:
+    path.write_text(text)
+    # Make sure the fingerprint changes even on coarse timestamp filesystems.
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def _value(db: ConfigDB, name: str) -> str | None:
+    setting = db.effective_setting(name)
+    return setting.value if setting else None
+
+
+def test_only_changed_files_are_reloaded(tmp_path: Path) -> None:
+    db, cfg = _db(tmp_path)
+    assert db.changed_files() == []
+    game = db.files[1].updater
+    _edit(cfg / "DefaultEngine.ini", f"[{SECTION}]\nr.Bloom=0\nr.Fog=1\n+CVars=r.A=1\n")
+    assert [ini.path.name for ini in db.changed_files()] == ["DefaultEngine.ini"]
+
+    report = db.reload_changed()
+    assert report.reloaded == ["DefaultEngine.ini"]
+    assert report.conflicts == []
+    assert _value(db, "r.Bloom") == "0"
+    assert db.files[1].updater is game
+    assert db.changed_files() == []
+
+
+def test_touch_without_content_change_is_ignored(tmp_path: Path) -> None:
+    db, cfg = _db(tmp_path)
+    path = cfg / "DefaultGame.ini"
+    _edit(path, path.read_text())
+    assert db.changed_files()
+    assert not db.reload_changed()
+    assert db.changed_files() == []
+
+
+def test_unsaved_edits_survive_external_change(tmp_path: Path) -> None:
+    db, cfg = _db(tmp_path)
+    db.insert_setting(SECTION, "r.Fog", "0", "DefaultEngine.ini")
+    db.apply_changes("DefaultEngine.ini", [(SECTION, "+CVars", "r.B=2")])
+    _edit(cfg / "DefaultEngine.ini", f"; synced\n[{SECTION}]\nr.Bloom=0\nr.Fog=1\n+CVars=r.A=1\nr.New=3\n")
+
+    report = db.reload_changed()
+    assert sorted(key for _f, _s, key in report.kept) == ["+cvars", "r.fog"]
+    assert report.conflicts == []
+    assert _value(db, "r.Bloom") == "0"
+    assert _value(db, "r.New") == "3"
+    assert _value(db, "r.Fog") == "0"
+    assert [s.value for s in db.settings()["+cvars"]] == ["r.A=1", "r.B=2"]
+    assert db.files[0].snapshot().startswith("; synced\n")
+
+
+def test_conflicting_edit_is_reported_and_kept(tmp_path: Path) -> None:
+    db, cfg = _db(tmp_path)
+    db.insert_setting(SECTION, "r.Bloom", "5", "DefaultEngine.ini")
+    db.files[0].comment_option(SECTION, "r.fog")
+    _edit(cfg / "DefaultEngine.ini", f"[{SECTION}]\nr.Bloom=2\nr.Fog=1\n+CVars=r.A=1\n")
+
+    report = db.reload_changed()
+    [conflict] = report.conflicts
+    assert (conflict.key, conflict.base, conflict.mine, conflict.theirs) == ("r.bloom", ("1",), ("5",), ("2",))
+    assert _value(db, "r.Bloom") == "5"
+    assert _value(db, "r.Fog") is None
+
+
+def test_save_refreshes_fingerprints_and_missing_files(tmp_path: Path) -> None:
+    db, cfg = _db(tmp_path)
+    db.insert_setting(SECTION, "r.Fog", "0", "DefaultEngine.ini")
+    db.save(cfg)
+    assert db.changed_files() == []
+
+    (cfg / "DefaultGame.ini").unlink()
+    report = db.reload_changed()
+    assert report.missing == ["DefaultGame.ini"]
+    assert db.changed_files() == []
+
+
+def test_reload_drops_undo_history_of_reloaded_files(tmp_path: Path) -> None:
+    db, cfg = _db(tmp_path)
+    db.insert_setting(SECTION, "r.Bloom", "6", "DefaultEngine.ini")
+    db.insert_setting("/Script/Game", "Key", "2", "DefaultGame.ini")
+    _edit(cfg / "DefaultEngine.ini", f"[{SECTION}]\nr.Bloom=9\nr.Fog=1\n+CVars=r.A=1\n")
+
+    report = db.reload_changed()
+    assert report.undo_dropped == 1
+    assert _value(db, "r.Bloom") == "6"
+    # Only the edit to the untouched file is still undoable.
+    assert db.undo().label == "Set Key"
+    assert db.undo() is None
+    assert _value(db, "r.Bloom") == "6"
+    assert _value(db, "Key") == "1"
@@ -0,0 +1,106 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from pathlib import Path
+
+from ue_configurator.config_db import ConfigDB
+from ue_configurator.journal import read_events
+
+
+def _db(tmp_path: Path) -> tuple[ConfigDB, Path]:
+    cfg = tmp_path / "Config"
+    cfg.mkdir()
+    (cfg / "DefaultEngine.ini").write_text("[/Script/Engine.RendererSettings]\nr.Bloom=1\nr.Fog=1\n")
+    (cfg / "ProjectEngine.ini").write_text("[/Script/Engine.RendererSettings]\nr.Bloom=0\n")
+    db = ConfigDB()
+    db.load(cfg)
+    return db, cfg
+
+
+def _text(db: ConfigDB) -> dict[str, list]:
+    # Values, not raw text: configupdater rewrites edited lines as "key = value".
+    return {ini.path.name: list(ini.iter_options()) for ini in db.files}
+
+
+def test_undo_redo_insert(tmp_path: Path) -> None:
+    db, _cfg = _db(tmp_path)
+    before = _text(db)
+    db.insert_setting("/Script/Engine.RendererSettings", "r.Fog", "0", "DefaultEngine.ini")
+    db.insert_setting("/Script/Engine.RendererSettings", "r.New", "5", "ProjectEngine.ini")
+    after = _text(db)
+    changes = []
+    db.add_listener(changes.append)
+
+    assert db.undo().label == "Set r.New"
+    assert db.effective_setting("r.new") is None
+    assert db.undo().label == "Set r.Fog"
+    assert _text(db) == before
+    assert db.undo() is None
+    assert changes == [{"r.new"}, {"r.fog"}]
+
+    db.redo()
+    db.redo()
+    assert _text(db) == after
+    assert db.redo() is None
+
+
+def test_undo_resolve_and_comment(tmp_path: Path) -> None:
+    db, _cfg = _db(tmp_path)
+    section = "/Script/Engine.RendererSettings"
+    db.resolve_duplicate(section, "r.Bloom", "delete")
+    assert [s.file for s in db.settings()["r.bloom"]] == ["ProjectEngine.ini"]
+    db.undo()
+    assert [s.value for s in db.settings()["r.bloom"]] == ["1", "0"]
+
+    db.comment_lower_priority()
+    assert len(db.settings()["r.bloom"]) == 1
+    db.undo()
+    assert len(db.settings()["r.bloom"]) == 2
+    db.redo()
+    assert len(db.settings()["r.bloom"]) == 1
+
+
+def test_undo_merge_removes_array_entries(tmp_path: Path) -> None:
+    db, _cfg = _db(tmp_path)
+    preset = tmp_path / "Low.ini"
+    preset.write_text("[/Script/Engine.RendererSettings]\nr.Bloom=2\n+CVars=r.Shadow=0\n")
+    before = _text(db)
+    db.merge_preset(preset)
+    assert "+cvars" in db.settings()
+    assert db.undo().label == "Merge preset Low.ini"
+    assert _text(db) == before
+
+
+def test_new_edit_clears_redo_and_limit(tmp_path: Path) -> None:
+    db, _cfg = _db(tmp_path)
+    db.journal._undo = type(db.journal._undo)(maxlen=2)
+    for value in ("2", "3", "4"):
+        db.insert_setting("/Script/Engine.RendererSettings", "r.Fog", value, "DefaultEngine.ini")
+    db.undo()
+    db.undo()
+    assert not db.journal.can_undo()
+    assert db.effective_setting("r.fog").value == "2"
+    db.insert_setting("/Script/Engine.RendererSettings", "r.Fog", "9", "DefaultEngine.ini")
+    assert not db.journal.can_redo()
+
+
+def test_persisted_journal_replays_after_crash(tmp_path: Path) -> None:
+    db, cfg = _db(tmp_path)
+    journal = tmp_path / "Saved" / "journal.jsonl"
+    db.journal.attach(journal)
+    db.insert_setting("/Script/Engine.RendererSettings", "r.Fog", "0", "DefaultEngine.ini")
+    db.resolve_duplicate("/Script/Engine.RendererSettings", "r.Bloom", "comment")
+    db.insert_setting("/Script/Engine.RendererSettings", "r.New", "1", "ProjectEngine.ini")
+    db.undo()
+    expected = _text(db)
+    with journal.open("a") as f:
+        f.write('{"event": "do", "ops": [')  # cut short by the crash
+    assert [e[0] for e in read_events(journal)] == ["do", "do", "do", "undo"]
+
+    fresh = ConfigDB()
+    fresh.load(cfg)
+    assert fresh.replay(journal) == 4
+    assert _text(fresh) == expected
+    assert fresh.undo().label == "Comment duplicate r.Bloom"
+
+    db.save(cfg)
+    assert read_events(journal) == []
+    assert db.journal.can_undo()
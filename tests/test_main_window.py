@@ -34,3 +34,57 @@ def test_row_selection_triggers_details(tmp_path):
     window.search.table.selectRow(0)
     QApplication.processEvents()
     assert captured["item"]["name"] == "r.Test"
+
+
+def test_undo_redo_actions_use_journal(tmp_path):
+    app = QApplication.instance() or QApplication([])
+    project_dir = tmp_path / "Proj"
+    (project_dir / "Config").mkdir(parents=True)
+    (project_dir / "Config" / "DefaultEngine.ini").write_text("[S]\nr.Bloom=1\n")
+    cache_file = tmp_path / "cache.json"
+    cache_file.with_name("cache-5.4.json").write_text("[]")
+
+    window = MainWindow(cache_file, project_dir)
+    window.db.insert_setting("S", "r.Bloom", "0")
+    journal = window.journal_file()
+    assert journal.read_text().count("\n") == 1
+
+    window.undo()
+    assert window.db.effective_setting("r.Bloom").value == "1"
+    window.redo()
+    assert window.db.effective_setting("r.Bloom").value == "0"
+    assert [a.shortcut().toString() for a in window.menuBar().actions() if a.text() in ("Undo", "Redo")] == [
+        "Ctrl+Z",
+        "Ctrl+Y",
+    ]
+
+
+def test_details_add_rejects_unknown_typed_name(tmp_path, monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    project_dir = tmp_path / "Proj"
+    (project_dir / "Config").mkdir(parents=True)
+    (project_dir / "Config" / "DefaultEngine.ini").write_text("[ConsoleVariables]\n")
+    cache_file = tmp_path / "cache.json"
+    data = [
+        {"name": "r.Bloom", "description": "", "default": "1", "category": "", "range": "0-1", "file": ""},
+        {"name": "r.Fog", "description": "", "default": "fast", "category": "", "range": "", "file": ""},
+    ]
+    cache_file.with_name("cache-5.4.json").write_text(json.dumps(data))
+    window = MainWindow(cache_file, project_dir)
+    warnings = []
+    monkeypatch.setattr(QtWidgets.QMessageBox, "warning", lambda *args: warnings.append(args[2]))
+    details = window.details
+    details.show_details(data[0])
+
+    details.name_edit.setText("r.Blom")
+    details._add()
+    assert "r.Bloom" in warnings[0]
+    assert window.db.settings() == {}
+
+    # A known name switches the editor before anything is written.
+    details.name_edit.setText("r.fog")
+    details._add()
+    assert details.current_item["name"] == "r.Fog"
+    assert window.db.settings() == {}
+    details._add()
+    assert window.db.effective_setting("r.Fog").value == "fast"
@@ -0,0 +1,57 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from benchmarks import generators
+from ue_configurator.namespace_tree import NamespaceTree
+
+
+def _rec(name, description=""):
+    return {"name": name, "description": description}
+
+
+RECORDS = [
+    _rec("r.Shadow.MaxResolution", "Max shadow map size"),
+    _rec("r.Shadow", "Enables shadows"),
+    _rec("r.shadow.CSM.MaxCascades", "Cascades"),
+    _rec("sg.ShadowQuality", "Scalability shadow level"),
+    _rec("r.Bloom", "Bloom"),
+    _rec("a.Anim"),
+    _rec("Solo"),
+    _rec(""),
+]
+
+
+def test_nodes_cover_contiguous_ranges() -> None:
+    tree = NamespaceTree(RECORDS)
+    assert len(tree) == 7
+    assert [(c.segment, c.total) for c in tree.root.children()] == [("a", 1), ("r", 4), ("sg", 1), ("Solo", 1)]
+
+    shadow = tree.find("R.SHADOW")
+    assert shadow.path == "r.Shadow"
+    assert shadow.record["description"] == "Enables shadows"
+    assert [c.path for c in shadow.children()] == ["r.Shadow.CSM", "r.Shadow.MaxResolution"]
+    leaf = tree.find("r.shadow.maxresolution")
+    assert leaf.record["name"] == "r.Shadow.MaxResolution" and leaf.children() == []
+    assert tree.find("r.Missing") is None
+
+
+def test_counts_follow_text_filter() -> None:
+    tree = NamespaceTree(RECORDS)
+    bits = tree.match("shadow")
+    assert bits is tree.match("SHADOW")
+    counts = {c.segment: c.count(bits) for c in tree.root.children()}
+    assert counts == {"a": 0, "r": 3, "Solo": 0, "sg": 1}
+    assert tree.find("r.Shadow").count(bits) == 3
+    assert tree.root.count(tree.match("")) == 7
+
+    named_max = tree.bits(lambda r: "Max" in r["name"])
+    assert tree.find("r.Shadow").count(bits & named_max) == 2
+
+
+def test_lazy_children_on_large_input() -> None:
+    records = generators.make_cvar_records(5000, seed=2)
+    tree = NamespaceTree(records)
+    top = tree.root.children()
+    assert sum(c.total for c in top) == 5000
+    assert all(not c.loaded for c in top)
+    bits = tree.match("shadow")
+    expected = sum("shadow" in r["name"].lower() or "shadow" in r["description"].lower() for r in records)
+    assert sum(c.count(bits) for c in top) == expected
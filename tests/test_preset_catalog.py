@@ -0,0 +1,56 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from pathlib import Path
+
+from ue_configurator import preset_catalog
+from ue_configurator.preset_catalog import PresetCatalog
+
+
+def _library(tmp_path: Path) -> Path:
+    lib = tmp_path / "Presets"
+    lib.mkdir()
+    (lib / "Low.ini").write_text("[SystemSettings]\nr.ScreenPercentage=50\nr.Bloom=0\n")
+    (lib / "High.ini").write_text("[SystemSettings]\nr.ScreenPercentage=100\nr.Bloom=0\n")
+    (lib / "Mobile.ini").write_text("[Android DeviceProfile]\n+CVars=r.ScreenPercentage=70\n")
+    return lib
+
+
+def test_search_and_overlaps(tmp_path: Path):
+    catalog = PresetCatalog(_library(tmp_path), tmp_path / "cache.json")
+    assert catalog.refresh() == {"Low.ini", "High.ini", "Mobile.ini"}
+    assert catalog.presets["Low.ini"].key_count == 2
+    assert catalog.presets_setting("R.SCREENPERCENTAGE") == ["High.ini", "Low.ini", "Mobile.ini"]
+    assert [(m.preset, m.value) for m in catalog.search("=5")] == [("Low.ini", "50")]
+    assert catalog.overlaps() == {("High.ini", "Low.ini"): (2, 1)}
+    assert catalog.overlaps_with("Low.ini") == [("High.ini", 2, 1)]
+
+
+def test_refresh_reparses_only_changed_presets(tmp_path: Path, monkeypatch):
+    lib = _library(tmp_path)
+    PresetCatalog(lib, tmp_path / "cache.json").refresh()
+
+    parsed = []
+    original = preset_catalog.parse_preset
+    monkeypatch.setattr(preset_catalog, "parse_preset", lambda p, d=None: parsed.append(p.name) or original(p, d))
+    catalog = PresetCatalog(lib, tmp_path / "cache.json")
+    assert catalog.refresh() == set()
+    assert parsed == []
+
+    (lib / "Low.ini").write_text("[SystemSettings]\nr.ScreenPercentage=25\n")
+    (lib / "Mobile.ini").unlink()
+    assert catalog.refresh() == {"Low.ini", "Mobile.ini"}
+    assert parsed == ["Low.ini"]
+    assert catalog.names() == ["High.ini", "Low.ini"]
+
+
+def test_search_by_preset_is_not_cut_off(tmp_path: Path):
+    lib = tmp_path / "Presets"
+    lib.mkdir()
+    lines = "".join(f"r.Bloom{i}=1\n" for i in range(600))
+    (lib / "A_Big.ini").write_text(f"[SystemSettings]\n{lines}")
+    (lib / "Z_Small.ini").write_text("[SystemSettings]\nr.BloomQuality=2\n")
+    catalog = PresetCatalog(lib, tmp_path / "cache.json")
+    catalog.refresh()
+    assert {m.preset for m in catalog.search("bloom")} == {"A_Big.ini"}
+    found = catalog.search_by_preset("bloom", per_preset=5)
+    assert sorted(found) == ["A_Big.ini", "Z_Small.ini"]
+    assert len(found["A_Big.ini"]) == 5
@@ -0,0 +1,59 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from pathlib import Path
+
+from ue_configurator.config_db import ConfigDB
+from ue_configurator.preset_diff import ADD, CHANGE, CONFLICT, NOOP, apply_diff, diff_preset
+
+
+def _db(tmp_path: Path) -> ConfigDB:
+    cfg = tmp_path / "Config"
+    cfg.mkdir()
+    (cfg / "DefaultEngine.ini").write_text(
+        "[SystemSettings]\nr.Bloom=1\nr.Fog=1\nr.Tonemapper=0\n\n"
+        "[Android DeviceProfile]\n+CVars=r.A=1\n"
+    )
+    (cfg / "ProjectEngine.ini").write_text("[SystemSettings]\nr.Tonemapper=1\n")
+    db = ConfigDB()
+    db.load(cfg)
+    return db
+
+
+def _preset(tmp_path: Path) -> Path:
+    preset = tmp_path / "preset.ini"
+    preset.write_text(
+        "[SystemSettings]\nr.Bloom=1\nr.Fog=0\nr.Tonemapper=2\nr.New=5\n\n"
+        "[Android DeviceProfile]\n+CVars=r.A=1\n+CVars=r.B=2\n"
+    )
+    return preset
+
+
+def test_diff_classifies_entries(tmp_path: Path):
+    db = _db(tmp_path)
+    diff = diff_preset(db, _preset(tmp_path))
+    kinds = {(c.key, c.value): c.kind for c in diff.changes}
+    assert kinds == {
+        ("r.bloom", "1"): NOOP,
+        ("r.fog", "0"): CHANGE,
+        ("r.tonemapper", "2"): CONFLICT,
+        ("r.new", "5"): ADD,
+        ("+cvars", "r.A=1"): NOOP,
+        ("+cvars", "r.B=2"): ADD,
+    }
+    assert diff.target == "ProjectEngine.ini"
+    assert diff.counts() == {ADD: 2, CHANGE: 1, NOOP: 2, CONFLICT: 1}
+
+
+def test_apply_writes_only_the_delta(tmp_path: Path):
+    db = _db(tmp_path)
+    changes = []
+    db.add_listener(changes.append)
+    applied = apply_diff(db, diff_preset(db, _preset(tmp_path)), include_conflicts=False)
+    assert {(c.key, c.value) for c in applied} == {("r.fog", "0"), ("r.new", "5"), ("+cvars", "r.B=2")}
+    assert changes == [{"r.fog", "r.new", "+cvars"}]
+
+    db.save(db.config_dir)
+    text = (db.config_dir / "ProjectEngine.ini").read_text()
+    assert "r.bloom" not in text.lower()
+    assert "r.B=2" in text
+    # The diff is now empty apart from the conflict that was skipped.
+    assert diff_preset(db, _preset(tmp_path)).delta(include_conflicts=False) == []
@@ -0,0 +1,51 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from pathlib import Path
+import pytest
+
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+QApplication = QtWidgets.QApplication
+PresetPane = pytest.importorskip("ue_configurator.ui.preset_pane").PresetPane
+ConfigDB = pytest.importorskip("ue_configurator.config_db").ConfigDB
+
+
+def test_preview_then_apply(tmp_path: Path, monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    cfg = tmp_path / "Config"
+    cfg.mkdir()
+    (cfg / "DefaultEngine.ini").write_text("[SystemSettings]\nr.Bloom=1\n")
+    presets = tmp_path / "Presets"
+    presets.mkdir()
+    (presets / "low.ini").write_text("[SystemSettings]\nr.Bloom=1\nr.Fog=0\n")
+    db = ConfigDB()
+    db.load(cfg)
+    monkeypatch.setattr(QtWidgets.QMessageBox, "information", lambda *a, **k: None)
+
+    pane = PresetPane(presets, db, tmp_path / "catalog.json")
+    pane.preview_preset(presets / "low.ini")
+    assert pane.preview.rowCount() == 1
+    assert [pane.preview.item(0, c).text() for c in range(5)] == ["add", "SystemSettings", "r.fog", "", "0"]
+    assert db.effective_setting("r.fog") is None
+
+    pane.show_noop_btn.setChecked(True)
+    assert pane.preview.rowCount() == 2
+
+    pane.apply_preview()
+    assert db.effective_setting("r.fog").value == "0"
+    assert not pane.apply_btn.isEnabled()
+
+
+def test_search_filters_presets(tmp_path: Path):
+    app = QApplication.instance() or QApplication([])
+    presets = tmp_path / "Presets"
+    presets.mkdir()
+    (presets / "a.ini").write_text("[SystemSettings]\nr.ScreenPercentage=50\n")
+    (presets / "b.ini").write_text("[SystemSettings]\nr.ScreenPercentage=100\nr.Bloom=0\n")
+    db = ConfigDB()
+    pane = PresetPane(presets, db, tmp_path / "catalog.json")
+    pane.search_box.setText("bloom")
+    assert [pane.list.item(r).isHidden() for r in range(pane.list.count())] == [True, False]
+    assert "r.Bloom=0" in pane.list.item(1).toolTip()
+
+    pane.list.setCurrentRow(0)
+    assert pane.overlap_label.text() == "Overlaps with b.ini: 1 shared, 1 conflicting"
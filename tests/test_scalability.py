@@ -0,0 +1,61 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from pathlib import Path
+
+from ue_configurator import scalability
+from ue_configurator.scalability import ScalabilityMatrix
+
+BASE = """[ScalabilitySettings]
+PerfIndexThresholds_ResolutionQuality=GPU 18 42 115
+
+[ShadowQuality@0]
+r.ShadowQuality=0
+r.Shadow.MaxResolution=512
+
+[ShadowQuality@2]
+r.ShadowQuality=3
+r.Shadow.MaxResolution=1024
+
+[ShadowQuality@Cine]
+r.ShadowQuality=5
+r.Shadow.MaxResolution=4096
+
+[ViewDistanceQuality@2]
+r.ViewDistanceScale=0.8
+"""
+
+
+def _layers(tmp_path: Path):
+    engine = tmp_path / "UE"
+    (engine / "Engine" / "Config").mkdir(parents=True)
+    (engine / "Engine" / "Config" / "BaseScalability.ini").write_text(BASE)
+    cfg = tmp_path / "Proj" / "Config"
+    cfg.mkdir(parents=True)
+    (cfg / "DefaultScalability.ini").write_text("[ShadowQuality@2]\nr.Shadow.MaxResolution=2048\n")
+    return cfg, engine
+
+
+def test_layers_override_individual_keys(tmp_path: Path):
+    cfg, engine = _layers(tmp_path)
+    matrix = ScalabilityMatrix.for_project(cfg, engine)
+    assert matrix.groups() == ["sg.ShadowQuality", "sg.ViewDistanceQuality"]
+    assert matrix.value("sg.ShadowQuality", 2, "r.Shadow.MaxResolution") == "2048"
+    assert matrix.value("ShadowQuality", "2", "r.ShadowQuality") == "3"
+    assert matrix.cvars("sg.shadowquality", 4)["r.shadowquality"] == ("r.ShadowQuality", "5", "BaseScalability.ini")
+    assert matrix.table("sg.ShadowQuality")["r.Shadow.MaxResolution"] == {"0": "512", "2": "2048", "Cine": "4096"}
+    assert matrix.groups_setting("r.ViewDistanceScale") == [("sg.ViewDistanceQuality", "2", "0.8")]
+
+
+def test_refresh_rereads_only_changed_files(tmp_path: Path, monkeypatch):
+    cfg, engine = _layers(tmp_path)
+    matrix = ScalabilityMatrix.for_project(cfg, engine)
+    parsed = []
+    original = scalability.parse_file
+    monkeypatch.setattr(scalability, "parse_file", lambda p: parsed.append(p.name) or original(p))
+    assert matrix.refresh() == set()
+
+    project = cfg / "DefaultScalability.ini"
+    project.write_text("[ShadowQuality@0]\nr.Shadow.MaxResolution=256\n")
+    assert matrix.refresh() == {("shadowquality", "0"), ("shadowquality", "2")}
+    assert parsed == ["DefaultScalability.ini"]
+    assert matrix.value("sg.ShadowQuality", 0, "r.Shadow.MaxResolution") == "256"
+    assert matrix.value("sg.ShadowQuality", 2, "r.Shadow.MaxResolution") == "1024"
@@ -0,0 +1,25 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from pathlib import Path
+import pytest
+
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+QApplication = QtWidgets.QApplication
+ScalabilityPane = pytest.importorskip("ue_configurator.ui.scalability_pane").ScalabilityPane
+
+
+def test_reload_picks_up_file_changes(tmp_path: Path):
+    app = QApplication.instance() or QApplication([])
+    cfg = tmp_path / "Config"
+    cfg.mkdir()
+    ini = cfg / "DefaultScalability.ini"
+    ini.write_text("[ShadowQuality@0]\nr.ShadowQuality=0\n\n[ShadowQuality@Cine]\nr.ShadowQuality=5\n")
+    pane = ScalabilityPane(cfg)
+    assert pane.group_box.currentText() == "sg.ShadowQuality"
+    row = [pane.model.item(0, c).text() for c in range(pane.model.columnCount())]
+    assert row == ["r.ShadowQuality", "0", "", "", "", "5"]
+
+    ini.write_text("[ShadowQuality@0]\nr.ShadowQuality=1\n")
+    pane.reload()
+    assert pane.model.item(0, 1).text() == "1"
+    assert pane.model.item(0, 5).text() == ""
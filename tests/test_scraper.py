@@ -2,6 +2,7 @@ import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(
 import json
 import types
 from pathlib import Path
+from ue_configurator.fetch import Fetcher
 from ue_configurator.indexer import parse_console_variable_page, scrape_console_variables, build_cache
 
 SAMPLE_HTML = """
@@ -26,57 +27,45 @@ def test_parse_console_variable_page():
     assert data[1]["name"] == "r.Test2"
     assert data[1]["description"] == "Second test variable"
 
-def test_scrape_console_variables(monkeypatch):
-    class DummyResp:
-        status_code = 200
-        text = SAMPLE_HTML
+class DummySession:
+    def __init__(self, status_code=200, text=SAMPLE_HTML):
+        self.status_code = status_code
+        self.text = text
+        self.captured = {}
 
-        def raise_for_status(self):
-            return None
-    captured = {}
-    def fake_get(url, headers, timeout):
-        captured.update(headers)
-        return DummyResp()
-    monkeypatch.setattr("ue_configurator.indexer.requests.get", fake_get)
-    data = scrape_console_variables("5.6")
-    assert [d["name"] for d in data] == ["r.Test", "r.Test2"]
-    # Ensure that our request includes the additional browser-like headers
-    assert captured.get("Referer") == "https://dev.epicgames.com/documentation/"
+    def get(self, url, headers, timeout, stream=False):
+        self.captured.update(headers)
+        return self
 
+    headers = {}
 
-def test_scrape_console_variables_cloudflare(monkeypatch):
-    class ForbiddenResp:
-        status_code = 403
-        text = ""
-
-        def raise_for_status(self):
-            return None
+    def raise_for_status(self):
+        return None
 
-    class DummyResp:
-        status_code = 200
-        text = SAMPLE_HTML
 
-        def raise_for_status(self):
-            return None
+def test_scrape_console_variables():
+    session = DummySession()
+    data = scrape_console_variables("5.6", Fetcher(session, cache_dir=None))
+    assert [d["name"] for d in data] == ["r.Test", "r.Test2"]
+    # Ensure that our request includes the additional browser-like headers
+    assert session.captured.get("Referer") == "https://dev.epicgames.com/documentation/"
 
-    def fake_requests_get(url, headers, timeout):
-        return ForbiddenResp()
 
+def test_scrape_console_variables_cloudflare(monkeypatch):
     called = {}
 
     class DummyScraper:
-        def get(self, url, headers, timeout):
+        def get(self, url, headers, timeout, stream=False):
             called["used"] = True
-            return DummyResp()
+            return DummySession()
 
-    # Patch requests.get to simulate a 403 response
-    monkeypatch.setattr("ue_configurator.indexer.requests.get", fake_requests_get)
     # Patch cloudscraper.create_scraper to return our dummy scraper
     monkeypatch.setattr(
-        "ue_configurator.indexer.cloudscraper",
+        "ue_configurator.fetch.cloudscraper",
         types.SimpleNamespace(create_scraper=lambda: DummyScraper()),
     )
-    data = scrape_console_variables("5.6")
+    # The plain session simulates a 403 response
+    data = scrape_console_variables("5.6", Fetcher(DummySession(403, ""), cache_dir=None))
     assert called.get("used") is True
     assert [d["name"] for d in data] == ["r.Test", "r.Test2"]
 
@@ -38,3 +38,152 @@ def test_search_pane_appends_version(tmp_path, monkeypatch):
     cache_file = tmp_path / "cache.json"
     pane = SearchPane(cache_file, project_dir)
     assert pane.cache_file.name == "cache-5.1.json"
+
+
+def test_search_box_suggests_names(tmp_path):
+    app = QApplication.instance() or QApplication([])
+    QTest = pytest.importorskip("PySide6.QtTest").QTest
+    cache_file = tmp_path / "cache.json"
+    data = [
+        {"name": "r.Shadow.MaxResolution", "description": "", "default": "0", "category": "", "range": "", "file": ""},
+        {"name": "r.Bloom", "description": "", "default": "0", "category": "", "range": "", "file": ""},
+    ]
+    cache_file.with_name("cache-5.4.json").write_text(json.dumps(data))
+    pane = SearchPane(cache_file)
+    QTest.keyClicks(pane.search_box, "r.Shadow.MaxResoluton")
+    model = pane.search_box.completer().model()
+    assert model.stringList() == ["r.Shadow.MaxResolution"]
+
+
+def test_apply_usage_fills_usage_column(tmp_path):
+    app = QApplication.instance() or QApplication([])
+    cache_file = tmp_path / "cache.json"
+    data = [{"name": "r.Bloom", "description": "", "default": "0", "category": "", "range": "", "file": ""}]
+    cache_file.with_name("cache-5.4.json").write_text(json.dumps(data))
+    pane = SearchPane(cache_file)
+    pane.apply_usage({"r.bloom": [{"file": "Config/DefaultEngine.ini", "line": 3, "kind": "config"}]})
+    item = pane.model.item(0, 3)
+    assert item.text() == "1"
+    assert item.toolTip() == "Config/DefaultEngine.ini:3 (config)"
+
+
+def test_value_columns_follow_config_db(tmp_path):
+    app = QApplication.instance() or QApplication([])
+    from ue_configurator.config_db import ConfigDB
+
+    cache_file = tmp_path / "cache.json"
+    data = [
+        {"name": "r.Bloom", "description": "", "default": "0", "category": "", "range": "", "file": ""},
+        {"name": "r.Fog", "description": "", "default": "0", "category": "", "range": "", "file": ""},
+    ]
+    cache_file.with_name("cache-5.4.json").write_text(json.dumps(data))
+    cfg = tmp_path / "Config"
+    cfg.mkdir()
+    (cfg / "DefaultEngine.ini").write_text("[SystemSettings]\nr.Bloom=1\n")
+    db = ConfigDB()
+    db.load(cfg)
+
+    pane = SearchPane(cache_file)
+    pane.set_db(db)
+    assert pane.model.item(0, 4).text() == "1"
+    assert pane.model.item(0, 5).text() == "DefaultEngine.ini"
+    assert pane.model.item(1, 4).text() == ""
+
+    pane.only_set_box.setChecked(True)
+    assert pane.proxy_model.rowCount() == 1
+
+    db.insert_setting("ConsoleVariables", "r.Fog", "2", "DefaultEngine.ini")
+    assert pane.model.item(1, 4).text() == "2"
+    assert pane.proxy_model.rowCount() == 2
+
+
+def test_index_delta_updates_rows_in_place(tmp_path):
+    app = QApplication.instance() or QApplication([])
+    from ue_configurator.header_watch import IndexDelta
+
+    cache_file = tmp_path / "cache.json"
+    data = [
+        {"name": f"r.{n}", "description": n, "category": "", "file": "A.h"}
+        for n in ("One", "Two", "Three")
+    ]
+    cache_file.with_name("cache-5.4.json").write_text(json.dumps(data))
+    pane = SearchPane(cache_file)
+    resets = []
+    pane.model.modelReset.connect(lambda: resets.append(1))
+    index = pane.cvar_index()
+
+    pane.apply_index_delta(
+        IndexDelta(
+            added=[{"name": "r.Four", "description": "Four", "category": "New", "file": "B.h"}],
+            updated=[{"name": "r.Three", "description": "Three!", "category": "", "file": "A.h"}],
+            removed=["r.One"],
+        )
+    )
+    assert resets == []
+    names = [pane.model.item(r, 0).text() for r in range(pane.model.rowCount())]
+    assert names == ["r.Two", "r.Three", "r.Four"]
+    assert [d["name"] for d in pane.data] == names
+    assert pane.model.item(1, 1).text() == "Three!"
+    assert pane._rows == {"r.two": 0, "r.three": 1, "r.four": 2}
+    assert pane.category_box.findText("New") != -1
+    assert pane.cvar_index() is not index and "r.Four" in pane.cvar_index()
+
+    # A header CVar that already has a row (e.g. from the docs) updates it.
+    pane.apply_index_delta(IndexDelta(added=[{"name": "r.Two", "description": "Two!", "category": "", "file": "C.h"}]))
+    assert pane.model.rowCount() == 3
+    assert pane.model.item(0, 1).text() == "Two!"
+
+
+def test_header_watch_pushes_new_cvars(tmp_path):
+    app = QApplication.instance() or QApplication([])
+    QTest = pytest.importorskip("PySide6.QtTest").QTest
+    engine = tmp_path / "Engine"
+    engine.mkdir()
+    (engine / "A.h").write_text('IConsoleVariable::Register("r.Live", 0, "Live");')
+    cache_file = tmp_path / "cache.json"
+    cache_file.with_name("cache-5.4.json").write_text("[]")
+    pane = SearchPane(cache_file, use_local_engine=True)
+    pane.engine_root = engine
+
+    pane.watch_box.setChecked(True)
+    for _ in range(100):
+        if pane.data:
+            break
+        QTest.qWait(20)
+    pane.watch_box.setChecked(False)
+    assert [d["name"] for d in pane.data] == ["r.Live"]
+    assert pane._watch_thread is None
+
+
+def test_namespace_tree_counts_and_filters_table(tmp_path):
+    app = QApplication.instance() or QApplication([])
+    cache_file = tmp_path / "cache.json"
+    data = [
+        {"name": n, "description": d, "default": "0", "category": "", "range": "", "file": ""}
+        for n, d in [
+            ("r.Shadow.MaxResolution", "Shadow map size"),
+            ("r.Shadow.Virtual", "Virtual shadow maps"),
+            ("r.Bloom", "Bloom"),
+            ("sg.ShadowQuality", "Shadow level"),
+        ]
+    ]
+    cache_file.with_name("cache-5.4.json").write_text(json.dumps(data))
+    pane = SearchPane(cache_file)
+    model = pane.ns_model
+    top = [model.index(row, 0) for row in range(model.rowCount())]
+    assert [i.data() for i in top] == ["r", "sg"]
+    assert model.index(0, 1).data() == "3"
+    # Children are only inserted when fetched.
+    assert model.rowCount(top[0]) == 0 and model.canFetchMore(top[0])
+
+    pane.search_box.setText("virtual")
+    assert model.index(0, 1).data() == "1 / 3"
+    assert model.index(1, 1).data() == "0 / 1"
+    pane.search_box.setText("")
+
+    pane.set_namespace("r.shadow")
+    assert pane.ns_tree.currentIndex().data() == "Shadow"
+    names = sorted(pane.proxy_model.index(r, 0).data() for r in range(pane.proxy_model.rowCount()))
+    assert names == ["r.Shadow.MaxResolution", "r.Shadow.Virtual"]
+    pane.set_namespace("")
+    assert pane.proxy_model.rowCount() == 4
@@ -0,0 +1,32 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from ue_configurator.suggest import Suggester, edit_distance
+
+NAMES = [
+    "r.Shadow.MaxResolution",
+    "r.Shadow.MinResolution",
+    "r.Shadow.MaxCSMResolution",
+    "r.ScreenPercentage",
+    "sg.ShadowQuality",
+]
+
+
+def test_suggest_finds_typos():
+    s = Suggester(NAMES)
+    assert s.suggest("r.Shadow.MaxResoluton")[0] == "r.Shadow.MaxResolution"
+    assert s.suggest("R.SCREENPERCENTAGES") == ["r.ScreenPercentage"]
+    assert s.suggest("completely.different") == []
+
+
+def test_complete_prefers_prefix_matches():
+    s = Suggester(NAMES)
+    assert s.complete("r.shadow.m", k=3) == [
+        "r.Shadow.MaxCSMResolution",
+        "r.Shadow.MaxResolution",
+        "r.Shadow.MinResolution",
+    ]
+    assert s.complete("sg.ShadowQualty") == ["sg.ShadowQuality"]
+
+
+def test_edit_distance_is_capped():
+    assert edit_distance("kitten", "sitting", 5) == 3
+    assert edit_distance("kitten", "sitting", 1) == 2
@@ -0,0 +1,67 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from pathlib import Path
+
+from ue_configurator import usage_scan
+from ue_configurator.usage_scan import scan_project
+
+
+def _project(tmp_path: Path) -> Path:
+    proj = tmp_path / "Proj"
+    (proj / "Source" / "Game").mkdir(parents=True)
+    (proj / "Config").mkdir()
+    (proj / "Source" / "Game" / "Game.cpp").write_text(
+        "// setup\n"
+        'auto* Var = IConsoleManager::Get().FindConsoleVariable(TEXT("r.Bloom"));\n'
+        "const int32 X = r_bloom_unrelated;\n"
+    )
+    (proj / "Config" / "DefaultEngine.ini").write_text(
+        "[SystemSettings]\nr.Shadow.MaxResolution=2048\n"
+    )
+    (proj / "Config" / "DefaultDeviceProfiles.ini").write_text(
+        "[Android DeviceProfile]\n+CVars=r.Bloom=0\n"
+    )
+    (proj / "Config" / "DefaultScalability.ini").write_text(
+        "[ShadowQuality@0]\nr.shadow.maxresolution=512\n"
+    )
+    (proj / "Source" / "Game" / "run.bat").write_text(
+        "Game.exe -ExecCmds=\"r.Bloom 0\"\n"
+    )
+    return proj
+
+
+def test_scan_reports_lines_and_kinds(tmp_path: Path):
+    proj = _project(tmp_path)
+    usage = scan_project(proj, ["r.Bloom", "r.Shadow.MaxResolution"], tmp_path / "cache.json", workers=1)
+    bloom = sorted((h["file"], h["line"], h["kind"]) for h in usage["r.bloom"])
+    assert bloom == [
+        (os.path.join("Config", "DefaultDeviceProfiles.ini"), 2, "device_profile"),
+        (os.path.join("Source", "Game", "Game.cpp"), 2, "lookup"),
+        (os.path.join("Source", "Game", "run.bat"), 1, "exec_cmds"),
+    ]
+    shadow = sorted((h["file"], h["kind"]) for h in usage["r.shadow.maxresolution"])
+    assert shadow == [
+        (os.path.join("Config", "DefaultEngine.ini"), "config"),
+        (os.path.join("Config", "DefaultScalability.ini"), "scalability"),
+    ]
+
+
+def test_unchanged_files_are_not_rescanned(tmp_path: Path, monkeypatch):
+    proj = _project(tmp_path)
+    cache = tmp_path / "cache.json"
+    scan_project(proj, ["r.Bloom"], cache, workers=1)
+
+    ini = proj / "Config" / "DefaultEngine.ini"
+    ini.write_text("[SystemSettings]\nr.Bloom=1\n")
+    scanned = []
+    original = usage_scan.scan_bytes
+    monkeypatch.setattr(
+        usage_scan, "scan_bytes", lambda path, data, names: scanned.append(path) or original(path, data, names)
+    )
+    usage = scan_project(proj, ["r.Bloom"], cache, workers=1)
+    assert scanned == [ini]
+    assert len(usage["r.bloom"]) == 4
+
+    # A different name set invalidates the whole cache.
+    scanned.clear()
+    scan_project(proj, ["r.Bloom", "r.Other"], cache, workers=1)
+    assert len(scanned) == 5
@@ -15,3 +15,15 @@ def test_infer_enum_string():
     dtype, vmin, vmax, options = infer_cvar_type("Low|High", "Low")
     assert dtype == "str" and options == ["Low", "High"]
 
+
+
+def test_cvar_metadata_prefers_precomputed_fields():
+    from ue_configurator.cvar_types import cvar_metadata
+
+    stored = {"range": "0-1", "default": "0", "dtype": "float", "min": 0.0, "max": 1.0,
+              "options": None, "cpp_type": "float"}
+    assert cvar_metadata(stored)["dtype"] == "float"
+    legacy = {"range": "Low|High", "default": "Low"}
+    assert cvar_metadata(legacy) == {
+        "dtype": "str", "min": None, "max": None, "options": ["Low", "High"], "cpp_type": "FString",
+    }
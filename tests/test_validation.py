@@ -0,0 +1,81 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from pathlib import Path
+
+from ue_configurator.config_db import ConfigDB
+from ue_configurator.cvar_index import CVarIndex
+from ue_configurator.validation import (
+    OUT_OF_RANGE,
+    UNKNOWN_CVAR,
+    WRONG_TYPE,
+    add_suggestions,
+    check_rows,
+    validate_cvars,
+)
+
+INDEX = CVarIndex(
+    [
+        {"name": "r.Shadow.MaxResolution", "range": "32-4096", "default": "2048"},
+        {"name": "r.Scale", "range": "", "default": "1.0"},
+        {"name": "r.Mode", "range": "Low|High", "default": "Low"},
+    ]
+)
+
+
+def test_validate_cvars_reports_file_and_line(tmp_path: Path):
+    cfg = tmp_path / "Config"
+    cfg.mkdir()
+    (cfg / "DefaultEngine.ini").write_text(
+        "[ConsoleVariables]\n"
+        "r.Shadow.MaxResolution=8192\n"
+        "; r.Scale=abc\n"
+        "r.Scale=abc\n"
+        "r.Mode=high\n"
+        "r.Shadow.MaxResoluton=512\n"
+        "\n"
+        "[/Script/Engine.Engine]\n"
+        "NotACVar=1\n"
+    )
+    db = ConfigDB()
+    db.load(cfg)
+    diags = validate_cvars(db, INDEX)
+    found = [(d.code, d.line, d.key) for d in diags]
+    assert found == [
+        (OUT_OF_RANGE, 2, "r.shadow.maxresolution"),
+        (WRONG_TYPE, 4, "r.scale"),
+        (UNKNOWN_CVAR, 6, "r.shadow.maxresoluton"),
+    ]
+    assert diags[0].file == "DefaultEngine.ini"
+
+
+def test_validate_cvars_skips_without_index(tmp_path: Path):
+    cfg = tmp_path / "Config"
+    cfg.mkdir()
+    (cfg / "DefaultEngine.ini").write_text("[ConsoleVariables]\nr.Anything=1\n")
+    db = ConfigDB()
+    db.load(cfg)
+    assert validate_cvars(db, CVarIndex([])) == []
+
+
+def test_unknown_cvar_includes_suggestions(tmp_path: Path):
+    cfg = tmp_path / "Config"
+    cfg.mkdir()
+    (cfg / "DefaultEngine.ini").write_text("[ConsoleVariables]\nr.Shadow.MaxResoluton=512\n")
+    db = ConfigDB()
+    db.load(cfg)
+    [diag] = validate_cvars(db, INDEX)
+    assert diag.suggestions == []
+    add_suggestions([diag], INDEX)
+    assert diag.suggestions == ["r.Shadow.MaxResolution"]
+    assert "did you mean r.Shadow.MaxResolution" in diag.message
+
+
+def test_suggestions_are_looked_up_once_and_capped(monkeypatch):
+    calls = []
+    monkeypatch.setattr(INDEX, "suggest", lambda name, k: calls.append(name) or ["r.Shadow.MaxResolution"])
+    keys = ["r.Typo", "R.TYPO", "r.Other", "r.Third"]
+    rows = [("DefaultEngine.ini", line, "ConsoleVariables", key, "1") for line, key in enumerate(keys, start=1)]
+    diags = check_rows(rows, INDEX)
+    assert calls == []
+    add_suggestions(diags, INDEX, limit=2)
+    assert calls == ["r.typo", "r.other"]
+    assert [d.suggestions for d in diags] == [["r.Shadow.MaxResolution"]] * 3 + [[]]
@@ -0,0 +1,106 @@
+import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from ue_configurator import cli
+from ue_configurator import version_index as vi
+from ue_configurator.version_index import VersionIndex, scrape_versions
+
+PAGES = {
+    "5.3": [
+        {"name": "r.Bloom", "default": "1", "description": "Bloom"},
+        {"name": "r.Old", "default": "0", "description": "Legacy"},
+    ],
+    "5.4": [
+        {"name": "r.Bloom", "default": "1", "description": "Bloom"},
+        {"name": "r.Old", "default": "0", "description": "Legacy"},
+        {"name": "r.Nanite", "default": "1", "description": "Nanite"},
+    ],
+    "5.5": [
+        {"name": "r.Bloom", "default": "0", "description": "Bloom"},
+        {"name": "r.Nanite", "default": "1", "description": "Nanite"},
+        {"name": "r.nanite", "default": "1", "description": "Nanite"},
+    ],
+}
+
+
+def test_scrape_versions_caps_concurrency_and_collects_errors() -> None:
+    lock = threading.Lock()
+    active = peak = 0
+
+    def scrape(version, fetcher):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        if version == "5.0":
+            raise RuntimeError("no table")
+        return PAGES[version]
+
+    results, errors = scrape_versions(["5.3", "5.4", "5.5", "5.0", "5.4"], fetcher=object(), max_workers=2, scrape=scrape)
+    assert sorted(results) == ["5.3", "5.4", "5.5"]
+    assert errors == {"5.0": "no table"}
+    assert peak == 2
+
+
+def test_index_deduplicates_and_tracks_changes() -> None:
+    index = VersionIndex.build(PAGES)
+    assert index.versions == ["5.3", "5.4", "5.5"]
+    assert index.versions_of("R.NANITE") == ["5.4", "5.5"]
+    assert [r["version"] for r in index.history("r.Bloom")] == ["5.3", "5.5"]
+    assert index.value_at("r.Bloom", "5.4") == {"default": "1", "description": "Bloom"}
+    assert index.value_at("r.Old", "5.5") is None
+
+    assert index.changed_in("5.4") == {"added": ["r.Nanite"], "removed": [], "changed": []}
+    assert index.changed_in("5.5") == {
+        "added": [],
+        "removed": ["r.Old"],
+        "changed": [{"name": "r.Bloom", "field": "default", "old": "1", "new": "0"}],
+    }
+    with pytest.raises(KeyError):
+        index.changed_in("4.27")
+
+
+def test_save_load_and_merge(tmp_path: Path) -> None:
+    path = tmp_path / "versions.json"
+    VersionIndex.build({v: PAGES[v] for v in ("5.3", "5.5")}).save(path)
+    index = VersionIndex.load(path)
+    assert index.changed_in("5.5")["changed"][0]["name"] == "r.Bloom"
+
+    index = index.merged({"5.4": PAGES["5.4"]})
+    assert index.versions == ["5.3", "5.4", "5.5"]
+    assert index.changed_in("5.4")["added"] == ["r.Nanite"]
+    assert index.changed_in("5.5")["changed"][0]["old"] == "1"
+
+    path.write_text(json.dumps({"version": 0}))
+    with pytest.raises(ValueError):
+        VersionIndex.load(path)
+
+
+def test_cli_versions(tmp_path: Path, monkeypatch, capsys) -> None:
+    def fake_scrape(versions, max_workers=4):
+        return {v: PAGES[v] for v in versions if v in PAGES}, {v: "HTTP 404" for v in versions if v not in PAGES}
+
+    monkeypatch.setattr(vi, "scrape_versions", fake_scrape)
+    index_file = tmp_path / "versions.json"
+    code = cli.main(["versions", "5.3", "5.4", "9.9", "--index", str(index_file)])
+    out = json.loads(capsys.readouterr().out)
+    assert code == cli.EXIT_FAILED
+    assert out["versions"] == ["5.3", "5.4"] and out["errors"] == {"9.9": "HTTP 404"}
+
+    cli.main(["versions", "5.5", "--index", str(index_file)])
+    capsys.readouterr()
+    code = cli.main(["versions", "--index", str(index_file), "--changed-in", "5.5", "--cvar", "r.bloom"])
+    out = json.loads(capsys.readouterr().out)
+    assert code == cli.EXIT_OK
+    assert out["changed_in"]["5.5"]["removed"] == ["r.Old"]
+    assert out["cvar"]["versions"] == ["5.3", "5.4", "5.5"]
+
+    assert cli.main(["versions", "--index", str(index_file), "--changed-in", "4.0"]) == cli.EXIT_ERROR
@@ -0,0 +1,7 @@
+"""Allow ``python -m ue_configurator`` to run the headless CLI."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
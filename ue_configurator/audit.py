@@ -0,0 +1,138 @@
+"""Batch audit of many Unreal projects across a process pool."""
+
+from __future__ import annotations
+
+import csv
+import glob
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+from .config_db import ConfigDB
+from .index_daemon import IndexClient
+from .validation import UNKNOWN_CVAR, validate_cvars
+
+DEFAULT_CACHE = Path.home() / ".ue5_config_assistant" / "cvar_cache.json"
+
+CSV_FIELDS = [
+    "project",
+    "engine_version",
+    "files",
+    "ok",
+    "message",
+    "duplicates",
+    "unknown_cvars",
+    "cvar_index",
+    "error",
+]
+
+
+def expand_projects(patterns: Iterable[str]) -> List[Path]:
+    """Expand ``.uproject`` paths, globs and folders into a sorted list.
+
+    A folder is searched recursively for ``*.uproject`` files.
+    """
+    found: set[Path] = set()
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            found.update(p.resolve() for p in path.rglob("*.uproject"))
+            continue
+        matches = glob.glob(pattern, recursive=True) or ([pattern] if path.exists() else [])
+        found.update(Path(m).resolve() for m in matches if m.endswith(".uproject"))
+    return sorted(found)
+
+
+@lru_cache(maxsize=None)
+def _index_client(cache_file: str, version: str | None) -> IndexClient:
+    """Return a client for the CVar cache of ``version``.
+
+    Cached per worker process so each process connects to the daemon (or,
+    without one, parses the cache for an engine version) only once no
+    matter how many projects use it.
+    """
+    return IndexClient(Path(cache_file), version)
+
+
+def audit_project(uproject: Path, cache_file: Path = DEFAULT_CACHE) -> Dict[str, Any]:
+    """Load, check duplicates, validate and check CVars for one project."""
+    from .indexer import detect_version_from_uproject
+
+    project_dir = uproject.parent
+    result: Dict[str, Any] = {
+        "project": str(uproject),
+        "engine_version": None,
+        "files": 0,
+        "ok": False,
+        "message": None,
+        "duplicates": [],
+        "unknown_cvars": [],
+        "cvar_index": False,
+        "error": None,
+    }
+    try:
+        version = detect_version_from_uproject(project_dir)
+        result["engine_version"] = version
+        db = ConfigDB()
+        db.load(project_dir / "Config")
+        result["files"] = len(db.files)
+        ok, msg = db.validate()
+        result["ok"], result["message"] = ok, msg
+        result["duplicates"] = [
+            {"section": s, "key": k, "files": [ini.path.name for ini in files]}
+            for (s, k), files in db.find_duplicates().items()
+        ]
+        index = _index_client(str(cache_file), version)
+        result["cvar_index"] = bool(len(index))
+        unknown: Dict[Tuple[str, str], List[str]] = {}
+        for diag in validate_cvars(db, index):
+            if diag.code == UNKNOWN_CVAR:
+                files = unknown.setdefault((diag.section, diag.key), [])
+                if diag.file not in files:
+                    files.append(diag.file)
+        result["unknown_cvars"] = [
+            {"section": s, "key": k, "files": files} for (s, k), files in unknown.items()
+        ]
+    except Exception as exc:  # keep auditing the remaining projects
+        result["error"] = str(exc)
+    return result
+
+
+def audit_projects(
+    projects: Iterable[Path],
+    cache_file: Path = DEFAULT_CACHE,
+    workers: int | None = None,
+) -> List[Dict[str, Any]]:
+    """Audit ``projects`` in parallel and return results in input order.
+
+    ``workers`` defaults to the number of CPUs.  Use ``workers=1`` to run in
+    the current process, which avoids pool start-up cost for small batches.
+    """
+    projects = list(projects)
+    if workers == 1 or len(projects) <= 1:
+        return [audit_project(p, cache_file) for p in projects]
+    workers = min(workers or os.cpu_count() or 1, len(projects))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(audit_project, projects, [cache_file] * len(projects)))
+
+
+def has_issues(result: Dict[str, Any]) -> bool:
+    return bool(
+        result["error"] or not result["ok"] or result["duplicates"] or result["unknown_cvars"]
+    )
+
+
+def format_csv(results: List[Dict[str, Any]]) -> str:
+    """Flatten ``results`` to CSV with one row per project."""
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=CSV_FIELDS)
+    writer.writeheader()
+    for res in results:
+        row = dict(res)
+        row["duplicates"] = ";".join(f"[{d['section']}]{d['key']}" for d in res["duplicates"])
+        row["unknown_cvars"] = ";".join(d["key"] for d in res["unknown_cvars"])
+        writer.writerow({k: row.get(k) for k in CSV_FIELDS})
+    return buf.getvalue()
@@ -0,0 +1,106 @@
+"""Apply many settings from a CSV or JSON file in one transaction.
+
+CSV files need a header row with at least ``key`` (or ``name``) and
+``value`` columns.  Optional columns are ``section`` (defaults to
+``ConsoleVariables``), ``target`` (ini file name) and ``action``
+(``set``/``insert``, ``delete`` or ``comment``).
+
+JSON files contain either a list of objects with the same fields or a
+mapping ``{section: {key: value}}``.
+
+All rows are validated before anything is changed, and the edits are
+applied through :meth:`ConfigDB.transaction`, so a failing file leaves the
+config untouched.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+from .config_db import COMMENT, DELETE, INSERT, ConfigDB, Operation
+
+DEFAULT_SECTION = "ConsoleVariables"
+ACTIONS = {"set": INSERT, "insert": INSERT, "": INSERT, "delete": DELETE, "comment": COMMENT}
+
+
+@dataclass
+class BulkRow:
+    action: str
+    section: str
+    key: str
+    value: str | None
+    target: str | None
+    #: Row number in the source file for error messages.
+    line: int
+
+
+def _row(raw: Any, line: int, default_target: str | None) -> BulkRow:
+    if not isinstance(raw, dict):
+        raise ValueError(f"Row {line}: expected an object, got {type(raw).__name__}")
+    fields = {str(k).strip().lower(): v for k, v in raw.items() if k is not None}
+    key = str(fields.get("key") or fields.get("name") or "").strip()
+    if not key:
+        raise ValueError(f"Row {line}: missing key")
+    action_text = str(fields.get("action") or "").strip().lower()
+    if action_text not in ACTIONS:
+        raise ValueError(f"Row {line}: unknown action {action_text!r}")
+    action = ACTIONS[action_text]
+    value = fields.get("value")
+    if action == INSERT and value is None:
+        raise ValueError(f"Row {line}: missing value for {key}")
+    section = str(fields.get("section") or DEFAULT_SECTION).strip()
+    target = str(fields.get("target") or "").strip() or default_target
+    return BulkRow(action, section, key, None if value is None else str(value).strip(), target, line)
+
+
+def read_rows(path: Path, target: str | None = None) -> List[BulkRow]:
+    """Parse ``path`` (``.csv`` or ``.json``) into validated rows."""
+    if path.suffix.lower() == ".json":
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if isinstance(data, dict):
+            for section, values in data.items():
+                if not isinstance(values, dict):
+                    raise ValueError(f"Section {section!r}: expected an object of key/value pairs")
+            items: Iterable[Any] = [
+                {"section": section, "key": key, "value": value}
+                for section, values in data.items()
+                for key, value in values.items()
+            ]
+        elif isinstance(data, list):
+            items = data
+        else:
+            raise ValueError("JSON bulk file must be a list or an object")
+        return [_row(item, idx, target) for idx, item in enumerate(items, start=1)]
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        if not reader.fieldnames or not {"key", "name"} & {n.strip().lower() for n in reader.fieldnames}:
+            raise ValueError("CSV bulk file needs a 'key' column")
+        # Header is line 1, so data starts at line 2.
+        return [_row(raw, idx, target) for idx, raw in enumerate(reader, start=2)]
+
+
+def apply_rows(db: ConfigDB, rows: List[BulkRow], label: str = "Bulk import") -> List[Operation]:
+    """Apply ``rows`` in a single transaction (one undo step) and return the applied edits."""
+    active = set(db.available_targets())
+    for row in rows:
+        if row.target is not None and row.target not in active:
+            raise ValueError(f"Row {row.line}: not an active config file: {row.target}")
+    with db.transaction(label) as tx:
+        for row in rows:
+            if row.action == INSERT:
+                assert row.value is not None
+                tx.insert(row.section, row.key, row.value, row.target)
+            elif row.action == DELETE:
+                tx.delete(row.section, row.key, row.target)
+            else:
+                tx.comment(row.section, row.key, row.target)
+    return tx.applied
+
+
+def bulk_import(db: ConfigDB, path: Path, target: str | None = None) -> List[Operation]:
+    """Read ``path`` and apply it to ``db``; ``target`` is the default file."""
+    return apply_rows(db, read_rows(path, target), f"Bulk import {path.name}")
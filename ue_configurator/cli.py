@@ -0,0 +1,500 @@
+"""Headless command-line interface for config operations.
+
+Run as ``python -m ue_configurator <command> PROJECT ...``.  ``PROJECT`` may
+be a ``.uproject`` file, a project folder or a ``Config`` folder.  Every
+command prints JSON to stdout and exits with one of:
+
+``0``
+    success / no problems found
+``1``
+    the check failed (duplicates present, validation errors, ...)
+``2``
+    usage or I/O error
+
+Nothing in this module imports Qt, so it is safe to use on build machines and
+in pre-commit hooks.
+"""
+
+from __future__ import annotations
+
+import argparse
+import configparser
+import json
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from .config_db import ConfigDB
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_ERROR = 2
+
+
+def resolve_config_dir(project: Path) -> Path:
+    """Return the ``Config`` folder for ``project``.
+
+    ``project`` may point at a ``.uproject`` file, the project folder or the
+    ``Config`` folder itself.
+    """
+    if project.suffix == ".uproject":
+        project = project.parent
+    if (project / "Config").is_dir():
+        return project / "Config"
+    if project.is_dir():
+        return project
+    raise FileNotFoundError(f"No Config folder found for {project}")
+
+
+def _load_db(args: argparse.Namespace) -> ConfigDB:
+    db = ConfigDB()
+    db.load(resolve_config_dir(args.project))
+    for name in args.disable or []:
+        db.set_file_enabled(name, False)
+    return db
+
+
+def _emit(args: argparse.Namespace, payload: Any) -> None:
+    json.dump(payload, sys.stdout, indent=args.indent)
+    sys.stdout.write("\n")
+
+
+def _save(args: argparse.Namespace, db: ConfigDB) -> str | None:
+    if getattr(args, "dry_run", False):
+        return None
+    assert db.config_dir is not None
+    return str(db.save(db.config_dir))
+
+
+def _duplicates_payload(db: ConfigDB) -> List[Dict[str, Any]]:
+    return [
+        {"section": section, "key": option, "files": [ini.path.name for ini in files]}
+        for (section, option), files in db.find_duplicates().items()
+    ]
+
+
+def cmd_files(args: argparse.Namespace) -> int:
+    db = _load_db(args)
+    _emit(
+        args,
+        [
+            {"name": ini.path.name, "enabled": ini.enabled, "path": str(ini.path)}
+            for ini in db.files
+        ],
+    )
+    return EXIT_OK
+
+
+def cmd_duplicates(args: argparse.Namespace) -> int:
+    db = _load_db(args)
+    dups = _duplicates_payload(db)
+    _emit(args, dups)
+    return EXIT_FAILED if dups else EXIT_OK
+
+
+def cmd_resolve(args: argparse.Namespace) -> int:
+    db = _load_db(args)
+    if args.key:
+        targets = [(args.section, args.key.lower())]
+    else:
+        targets = list(db.find_duplicates())
+    for section, option in targets:
+        db.resolve_duplicate(section, option, args.action)
+    _emit(
+        args,
+        {
+            "resolved": [{"section": s, "key": o} for s, o in targets],
+            "action": args.action,
+            "backup": _save(args, db),
+        },
+    )
+    return EXIT_OK
+
+
+def cmd_insert(args: argparse.Namespace) -> int:
+    db = _load_db(args)
+    db.insert_setting(args.section, args.key, args.value, args.target)
+    files = db.entries().get((args.section, args.key.lower()), [])
+    _emit(
+        args,
+        {
+            "section": args.section,
+            "key": args.key.lower(),
+            "value": args.value,
+            "files": [ini.path.name for ini in files],
+            "backup": _save(args, db),
+        },
+    )
+    return EXIT_OK
+
+
+def cmd_bulk_import(args: argparse.Namespace) -> int:
+    from .bulk_import import bulk_import
+
+    if not args.file.is_file():
+        raise FileNotFoundError(f"Bulk file not found: {args.file}")
+    db = _load_db(args)
+    applied = bulk_import(db, args.file, args.target)
+    _emit(
+        args,
+        {
+            "applied": [
+                {"action": op.action, "section": op.section, "key": op.option, "value": op.value, "file": op.file}
+                for op in applied
+            ],
+            "backup": _save(args, db),
+        },
+    )
+    return EXIT_OK
+
+
+def cmd_merge_preset(args: argparse.Namespace) -> int:
+    if not args.preset.is_file():
+        raise FileNotFoundError(f"Preset not found: {args.preset}")
+    from .preset_diff import apply_diff, diff_preset
+
+    db = _load_db(args)
+    diff = diff_preset(db, args.preset, args.target)
+    if not args.dry_run:
+        apply_diff(db, diff)
+    _emit(
+        args,
+        {
+            "preset": str(args.preset),
+            "target": diff.target,
+            "counts": diff.counts(),
+            "changes": [c.to_dict() for c in diff.delta()],
+            "backup": _save(args, db),
+        },
+    )
+    return EXIT_OK
+
+
+def cmd_export_preset(args: argparse.Namespace) -> int:
+    db = _load_db(args)
+    db.export_preset(args.output)
+    _emit(args, {"output": str(args.output)})
+    return EXIT_OK
+
+
+def cmd_validate(args: argparse.Namespace) -> int:
+    db = _load_db(args)
+    ok, msg = db.validate()
+    payload: Dict[str, Any] = {"ok": ok, "message": msg, "duplicates": _duplicates_payload(db)}
+    if args.check_cvars:
+        from .audit import DEFAULT_CACHE
+        from .index_daemon import IndexClient
+        from .indexer import detect_version_from_uproject
+        from .validation import add_suggestions, validate_cvars
+
+        assert db.config_dir is not None
+        version = args.version or detect_version_from_uproject(db.config_dir.parent) or "5.4"
+        with IndexClient(args.cache or DEFAULT_CACHE, version) as index:
+            diagnostics = validate_cvars(db, index)
+            add_suggestions(diagnostics, index)
+            payload["cvar_index"] = bool(len(index))
+        payload["cvars"] = [d.to_dict() for d in diagnostics]
+        ok = ok and not diagnostics
+        payload["ok"] = ok
+    _emit(args, payload)
+    return EXIT_OK if ok else EXIT_FAILED
+
+
+def cmd_save(args: argparse.Namespace) -> int:
+    db = _load_db(args)
+    _emit(args, {"backup": _save(args, db)})
+    return EXIT_OK
+
+
+def cmd_device_profiles(args: argparse.Namespace) -> int:
+    from .device_profiles import DeviceProfileResolver
+
+    db = _load_db(args)
+    resolver = DeviceProfileResolver.from_db(db, args.engine_dir)
+    names = args.profile or resolver.names()
+    unknown = [n for n in names if n not in resolver.profiles]
+    if unknown:
+        raise ValueError(f"Unknown device profile(s): {', '.join(unknown)}")
+    matrix = resolver.matrix(names, args.cvar)
+    _emit(
+        args,
+        {
+            "profiles": {n: resolver.chain(n) for n in names},
+            "cvars": {
+                cvar: {p: {"value": v, "from": src} for p, (v, src) in row.items()}
+                for cvar, row in matrix.items()
+            },
+        },
+    )
+    return EXIT_OK
+
+
+def cmd_scalability(args: argparse.Namespace) -> int:
+    from .indexer import detect_engine_from_uproject
+    from .scalability import LEVELS, ScalabilityMatrix, parse_level
+
+    config_dir = resolve_config_dir(args.project)
+    engine_dir = args.engine_dir or detect_engine_from_uproject(config_dir.parent)
+    matrix = ScalabilityMatrix.for_project(config_dir, engine_dir, args.platform)
+    if args.cvar:
+        payload: Any = [
+            {"group": g, "level": level, "value": value}
+            for g, level, value in matrix.groups_setting(args.cvar)
+        ]
+    else:
+        groups = [args.group] if args.group else matrix.groups()
+        levels = [parse_level(args.level)] if args.level is not None else list(LEVELS)
+        payload = {
+            "files": [str(p) for p in matrix.files],
+            "groups": {
+                g: {
+                    level: {name: value for name, value, _f in matrix.cvars(g, level).values()}
+                    for level in levels
+                }
+                for g in groups
+            },
+        }
+    _emit(args, payload)
+    return EXIT_OK
+
+
+def cmd_presets(args: argparse.Namespace) -> int:
+    from .preset_catalog import PresetCatalog
+
+    if not args.presets_dir.is_dir():
+        raise FileNotFoundError(f"Preset folder not found: {args.presets_dir}")
+    catalog = PresetCatalog(args.presets_dir)
+    catalog.refresh()
+    payload: Dict[str, Any] = {}
+    if args.search:
+        payload["matches"] = [vars(m) for m in catalog.search(args.search)]
+    if args.key:
+        payload["presets"] = catalog.presets_setting(args.key)
+    if args.overlaps:
+        payload["overlaps"] = [
+            {"presets": [a, b], "shared": shared, "conflicts": conflicts}
+            for (a, b), (shared, conflicts) in sorted(catalog.overlaps().items())
+        ]
+    if not payload:
+        payload["presets"] = [
+            {"name": info.name, "keys": info.key_count, "sections": info.sections, "sha1": info.sha1}
+            for info in (catalog.presets[n] for n in catalog.names())
+        ]
+    _emit(args, payload)
+    return EXIT_OK
+
+
+def cmd_audit(args: argparse.Namespace) -> int:
+    from .audit import DEFAULT_CACHE, audit_projects, expand_projects, format_csv, has_issues
+
+    projects = expand_projects(args.projects)
+    if not projects:
+        raise FileNotFoundError("No .uproject files matched")
+    results = audit_projects(projects, args.cache or DEFAULT_CACHE, args.workers)
+    if args.format == "csv":
+        text = format_csv(results)
+    else:
+        text = json.dumps(results, indent=args.indent) + "\n"
+    if args.output:
+        args.output.write_text(text)
+    else:
+        sys.stdout.write(text)
+    return EXIT_FAILED if any(has_issues(r) for r in results) else EXIT_OK
+
+
+def cmd_daemon(args: argparse.Namespace) -> int:
+    from .audit import DEFAULT_CACHE
+    from .index_daemon import serve
+
+    try:
+        serve(args.cache or DEFAULT_CACHE, args.version, args.socket)
+    except RuntimeError as exc:
+        raise OSError(str(exc)) from exc
+    return EXIT_OK
+
+
+def cmd_usage(args: argparse.Namespace) -> int:
+    from .audit import DEFAULT_CACHE
+    from .index_daemon import IndexClient
+    from .indexer import detect_version_from_uproject
+    from .usage_scan import scan_project
+
+    project_dir = resolve_config_dir(args.project).parent
+    version = args.version or detect_version_from_uproject(project_dir) or "5.4"
+    if args.names:
+        names = args.names
+    else:
+        with IndexClient(args.cache or DEFAULT_CACHE, version) as index:
+            names = index.names()
+    usage = scan_project(project_dir, names, workers=args.workers)
+    _emit(args, {name: usage[name] for name in sorted(usage)})
+    return EXIT_OK
+
+
+def cmd_versions(args: argparse.Namespace) -> int:
+    from .audit import DEFAULT_CACHE
+    from .version_index import VersionIndex, scrape_versions
+
+    index_file = args.index or DEFAULT_CACHE.with_name("cvar_versions.json")
+    index = VersionIndex.load(index_file) if index_file.exists() else None
+    errors: Dict[str, str] = {}
+    if args.versions:
+        results, errors = scrape_versions(args.versions, max_workers=args.workers)
+        if results:
+            index = index.merged(results) if index else VersionIndex.build(results)
+            index.save(index_file)
+    if index is None:
+        raise FileNotFoundError(f"No version index at {index_file}; pass versions to fetch")
+
+    payload: Dict[str, Any] = {"versions": index.versions, "cvars": len(index.cvars)}
+    if errors:
+        payload["errors"] = errors
+    if args.changed_in:
+        if args.changed_in not in index.versions:
+            raise ValueError(f"Version not indexed: {args.changed_in}")
+        payload["changed_in"] = {args.changed_in: index.changed_in(args.changed_in)}
+    if args.cvar:
+        payload["cvar"] = {
+            "name": args.cvar,
+            "versions": index.versions_of(args.cvar),
+            "history": index.history(args.cvar),
+        }
+    _emit(args, payload)
+    return EXIT_FAILED if errors else EXIT_OK
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m ue_configurator",
+        description="Inspect and edit Unreal Engine config files without the GUI",
+        fromfile_prefix_chars="@",
+    )
+    parser.add_argument(
+        "--indent", type=int, default=2, help="JSON indentation (0 for compact output)"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add(name: str, func: Callable[[argparse.Namespace], int], help_text: str) -> argparse.ArgumentParser:
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("project", type=Path, help=".uproject file, project folder or Config folder")
+        p.add_argument(
+            "--disable",
+            action="append",
+            metavar="FILE",
+            help="Exclude an ini file from the operation (repeatable)",
+        )
+        p.set_defaults(func=func)
+        return p
+
+    def add_dry_run(p: argparse.ArgumentParser) -> None:
+        p.add_argument("--dry-run", action="store_true", help="Do not write changes to disk")
+
+    add("files", cmd_files, "List discovered ini files")
+    add("duplicates", cmd_duplicates, "List duplicate keys (exit 1 if any)")
+
+    p = add("resolve", cmd_resolve, "Resolve duplicates, keeping the highest priority entry")
+    p.add_argument("--action", choices=["comment", "delete"], default="comment")
+    p.add_argument("--section", help="Only resolve this section (requires --key)")
+    p.add_argument("--key", help="Only resolve this key (requires --section)")
+    add_dry_run(p)
+
+    p = add("insert", cmd_insert, "Insert or update a setting")
+    p.add_argument("section")
+    p.add_argument("key")
+    p.add_argument("value")
+    p.add_argument("--target", help="Target ini filename (defaults to the best candidate)")
+    add_dry_run(p)
+
+    p = add("bulk-import", cmd_bulk_import, "Apply many settings from a CSV or JSON file at once")
+    p.add_argument("file", type=Path, help="CSV (section,key,value[,target,action]) or JSON file")
+    p.add_argument("--target", help="Default target ini filename for rows without one")
+    add_dry_run(p)
+
+    p = add("merge-preset", cmd_merge_preset, "Merge a preset .ini into the project")
+    p.add_argument("preset", type=Path)
+    p.add_argument("--target", help="Target ini filename (defaults to the highest priority file)")
+    add_dry_run(p)
+
+    p = add("export-preset", cmd_export_preset, "Export the merged config as a preset")
+    p.add_argument("output", type=Path)
+
+    p = add("validate", cmd_validate, "Check syntax and duplicates (exit 1 on failure)")
+    p.add_argument(
+        "--check-cvars",
+        action="store_true",
+        help="Also check [ConsoleVariables]/[SystemSettings] keys against the CVar cache",
+    )
+    p.add_argument("--cache", type=Path, default=None, help="CVar cache file (version suffix is added)")
+    p.add_argument("--version", help="Engine version (default: detected from the .uproject)")
+
+    p = add("save", cmd_save, "Rewrite active ini files, keeping a backup")
+    add_dry_run(p)
+
+    p = add("usage", cmd_usage, "Report where CVars are used in Source, Config and Plugins")
+    p.add_argument("names", nargs="*", help="Only report these CVars (default: all indexed)")
+    p.add_argument("--cache", type=Path, default=None, help="CVar cache file (version suffix is added)")
+    p.add_argument("--version", help="Engine version (default: detected from the .uproject)")
+    p.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+
+    p = add("device-profiles", cmd_device_profiles, "Compare effective CVars across device profiles")
+    p.add_argument("--profile", action="append", help="Only include this profile (repeatable)")
+    p.add_argument("--cvar", action="append", help="Only include this CVar (repeatable)")
+    p.add_argument("--engine-dir", type=Path, help="Engine root providing BaseDeviceProfiles.ini")
+
+    p = sub.add_parser("scalability", help="Show CVars set by scalability groups per level")
+    p.add_argument("project", type=Path, help=".uproject file, project folder or Config folder")
+    p.add_argument("--group", help="Only this group, e.g. sg.ShadowQuality")
+    p.add_argument("--level", help="Only this level (0-3 or Cine)")
+    p.add_argument("--cvar", help="List the groups and levels that set this CVar instead")
+    p.add_argument("--platform", help="Apply <Platform>Scalability.ini overrides")
+    p.add_argument("--engine-dir", type=Path, help="Engine root providing BaseScalability.ini")
+    p.set_defaults(func=cmd_scalability)
+
+    p = sub.add_parser("presets", help="List and search a preset library")
+    p.add_argument("presets_dir", type=Path, help="Folder of preset .ini files")
+    p.add_argument("--search", help="Entries whose key=value contains this text")
+    p.add_argument("--key", help="Presets that set this key or CVar")
+    p.add_argument("--overlaps", action="store_true", help="Shared and conflicting keys per preset pair")
+    p.set_defaults(func=cmd_presets)
+
+    p = sub.add_parser(
+        "audit",
+        help="Audit many projects in parallel (exit 1 if any has issues)",
+        description="Arguments may also be read from a file with @list.txt",
+    )
+    p.add_argument("projects", nargs="+", help=".uproject files, globs or folders to search")
+    p.add_argument("--cache", type=Path, default=None, help="CVar cache file (version suffix is added)")
+    p.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    p.add_argument("--format", choices=["json", "csv"], default="json")
+    p.add_argument("--output", type=Path, help="Write the report to a file instead of stdout")
+    p.set_defaults(func=cmd_audit)
+
+    p = sub.add_parser("daemon", help="Serve the CVar index over a local Unix socket")
+    p.add_argument("--version", default="5.4", help="Engine version of the cache to serve")
+    p.add_argument("--cache", type=Path, default=None, help="CVar cache file (version suffix is added)")
+    p.add_argument("--socket", type=Path, default=None, help="Socket path (default: per-version path)")
+    p.set_defaults(func=cmd_daemon)
+
+    p = sub.add_parser("versions", help="Compare CVars across engine versions (exit 1 if a fetch failed)")
+    p.add_argument("versions", nargs="*", help="Versions to fetch from the online docs and add to the index")
+    p.add_argument("--workers", type=int, default=4, help="Versions fetched at the same time")
+    p.add_argument("--index", type=Path, default=None, help="Version index file")
+    p.add_argument("--changed-in", help="CVars added, removed or changed in this version")
+    p.add_argument("--cvar", help="Versions and default/description history of this CVar")
+    p.set_defaults(func=cmd_versions)
+    return parser
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "resolve" and bool(args.section) != bool(args.key):
+        parser.error("resolve: --section and --key must be given together")
+    if args.indent == 0:
+        args.indent = None
+    try:
+        return args.func(args)
+    except (OSError, ValueError, configparser.Error) as exc:
+        json.dump({"error": str(exc)}, sys.stdout)
+        sys.stdout.write("\n")
+        return EXIT_ERROR
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import shutil
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, NamedTuple, Set, Tuple
 
 try:  # pragma: no cover - exercised when optional dependency missing
     from configupdater import ConfigUpdater
@@ -16,6 +18,51 @@ except ModuleNotFoundError:  # pragma: no cover - fallback for minimal environme
     # very small subset implementation in ``_configupdater``.
     from ._configupdater import ConfigUpdater
 
+from .journal import Entry, Journal, read_events
+
+if TYPE_CHECKING:  # pragma: no cover - import cycle at runtime
+    from .ini_merge import ReloadReport
+
+
+#: Key prefixes of Unreal ini array operations (add unique, remove, add, clear).
+ARRAY_OPS = ("+", "-", ".", "!")
+
+
+class Setting(NamedTuple):
+    """Where and to what an option is set."""
+
+    file: str
+    section: str
+    value: str
+
+
+#: Called with the lowercased option names that changed, or ``None`` when
+#: anything may have changed (load, enabling files, merging presets).
+Listener = Callable[[Set[str] | None], None]
+
+
+def _is_commented(option) -> bool:
+    # Options added in memory have no raw lines until they are written.
+    return bool(option.lines) and option.lines[0].lstrip().startswith((";", "#"))
+
+
+def _comment(option) -> None:
+    if getattr(option, "updated", False) or not option.lines:
+        # Edited options are written from their value, not their raw
+        # lines, so render them once and comment that line.
+        option.lines[:] = [str(option)]
+        option._updated = False
+    option.lines[0] = f";{option.lines[0]}"
+
+
+def fingerprint(path: Path) -> Tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` of ``path`` or ``None`` if it is missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
 
 class IniFile:
     """Wrapper around ConfigUpdater preserving file path and enabled state."""
@@ -27,15 +74,98 @@ class IniFile:
         # appears multiple times within a section.  Some real world UE ini files
         # contain such duplicates, so read with ``strict=False`` to keep loading
         # resilient and let our own duplicate detection handle conflicts.
+        self.fingerprint = fingerprint(path)
         self.updater = ConfigUpdater(strict=False)
         if path.exists():
             self.updater.read(str(path))
+        #: Text as last read from or written to disk, the common ancestor
+        #: when merging external edits.
+        self.base = self.snapshot()
+
+    @classmethod
+    def from_snapshot(cls, path: Path, text: str, enabled: bool = True) -> "IniFile":
+        """Return a detached copy holding ``text`` from :meth:`snapshot`.
+
+        ``path`` is not read, so the copy can be used off the GUI thread.
+        """
+        ini = cls.__new__(cls)
+        ini.path = path
+        ini.enabled = enabled
+        ini.fingerprint = None
+        ini.restore(text)
+        ini.base = text
+        return ini
 
     def comment_option(self, section: str, option: str) -> None:
         """Comment out an option if it exists."""
         if self.updater.has_section(section) and self.updater[section].has_option(option):
+            _comment(self.updater[section][option])
+
+    def uncomment_option(self, section: str, option: str) -> None:
+        """Undo :meth:`comment_option`."""
+        if self.has_option(section, option):
             opt = self.updater[section][option]
-            opt.lines[0] = f";{opt.lines[0]}"
+            if _is_commented(opt):
+                line = opt.lines[0].lstrip()
+                opt.lines[0] = line[1:]
+
+    def append_option(self, section: str, option: str, value: str) -> None:
+        """Add ``option`` as a new line even if the key already exists."""
+        if not self.updater.has_section(section):
+            self.updater.add_section(section)
+        sec = self.updater[section]
+        if hasattr(sec, "create_option"):
+            sec.add_option(sec.create_option(option, value))
+        else:
+            sec[option] = value
+
+    def remove_value(self, section: str, option: str, value: str) -> bool:
+        """Remove the last ``option`` line set to ``value``; return whether one was found."""
+        if not self.updater.has_section(section):
+            return False
+        blocks = [
+            b
+            for b in self.updater[section].iter_blocks()
+            if getattr(b, "key", None) == option and (b.value or "").strip() == value.strip()
+        ]
+        if not blocks:
+            return False
+        blocks[-1].detach()
+        return True
+
+    def iter_options(self, raw_keys: bool = False) -> Iterator[Tuple[str, str, str, int]]:
+        """Yield ``(section, option, value, line)`` in file order.
+
+        Line numbers are 1-based and reflect the current in-memory state, so
+        they match the file as it would be written by :meth:`write`.
+        Commented-out options are skipped.  Option names are lowercased
+        unless ``raw_keys`` is true, in which case they keep their written
+        case.
+        """
+        line = 1
+        for block in self.updater.iter_blocks():
+            # Sections and options added in memory have no raw lines yet but
+            # are written as a single line.
+            line += len(block.lines) or 1
+            if not hasattr(block, "iter_blocks"):
+                continue
+            for child in block.iter_blocks():
+                if hasattr(child, "key") and not _is_commented(child):
+                    key = child.raw_key if raw_keys else child.key
+                    yield block.name, key, child.value or "", line
+                line += len(child.lines) or 1
+
+    def has_option(self, section: str, option: str) -> bool:
+        return self.updater.has_section(section) and self.updater[section].has_option(option)
+
+    def snapshot(self) -> str:
+        """Return the in-memory contents for :meth:`restore`."""
+        return str(self.updater)
+
+    def restore(self, text: str) -> None:
+        updater = ConfigUpdater(strict=False)
+        updater.read_string(text)
+        self.updater = updater
 
     def write(self, backup_dir: Path) -> None:
         """Write file to disk with backup."""
@@ -44,6 +174,184 @@ class IniFile:
             shutil.copy2(self.path, backup_dir / self.path.name)
         with self.path.open("w", encoding="utf-8") as f:
             self.updater.write(f)
+        self.base = self.snapshot()
+        self.fingerprint = fingerprint(self.path)
+
+
+INSERT = "insert"
+DELETE = "delete"
+COMMENT = "comment"
+UNCOMMENT = "uncomment"
+#: Add an array operation line (``+CVars=...``) without replacing others.
+APPEND = "append"
+#: Remove one array operation line with the given value.
+REMOVE = "remove"
+ACTIONS = (INSERT, DELETE, COMMENT, UNCOMMENT, APPEND, REMOVE)
+
+
+@dataclass
+class Operation:
+    """One edit queued in a :class:`Transaction`.
+
+    After the transaction commits, ``file`` names the file the edit landed in
+    and ``previous`` holds the value it replaced (``None`` if there was
+    none), which is enough to invert the edit.
+    """
+
+    action: str
+    section: str
+    option: str
+    value: str | None = None
+    target: str | None = None
+    file: str | None = None
+    previous: str | None = None
+
+    def pinned(self) -> "Operation":
+        """Return this applied operation targeting the file it landed in."""
+        return Operation(self.action, self.section, self.option, self.value, self.file)
+
+    def inverse(self) -> "Operation":
+        """Return the operation undoing this applied one.
+
+        Deleted options are re-inserted at the end of their section, so the
+        values are restored but not necessarily the line order.
+        """
+        if self.action == INSERT and self.previous is None:
+            return Operation(DELETE, self.section, self.option, None, self.file)
+        if self.action in (INSERT, DELETE):
+            return Operation(INSERT, self.section, self.option, self.previous, self.file)
+        opposite = {COMMENT: UNCOMMENT, UNCOMMENT: COMMENT, APPEND: REMOVE, REMOVE: APPEND}
+        return Operation(opposite[self.action], self.section, self.option, self.value, self.file)
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, str | None]) -> "Operation":
+        return cls(**{k: raw.get(k) for k in cls.__dataclass_fields__})  # type: ignore[arg-type]
+
+
+class Transaction:
+    """Batch of edits applied to a :class:`ConfigDB` all at once.
+
+    Use through :meth:`ConfigDB.transaction`.  Operations are queued and
+    applied on exit: targets are resolved against an index of the files
+    holding each queued key, built once per commit; listeners are notified
+    once, and if any operation fails every file touched so far is restored
+    before the error propagates.  The applied
+    operations are recorded in :attr:`ConfigDB.journal` as one undo step
+    unless ``record`` is false.
+    """
+
+    def __init__(self, db: "ConfigDB", label: str = "", record: bool = True) -> None:
+        self.db = db
+        self.label = label
+        self.record = record
+        self.operations: List[Operation] = []
+        self.applied: List[Operation] = []
+
+    def insert(self, section: str, option: str, value: str, target: str | None = None) -> None:
+        """Set ``option``; ``target`` picks the file as in :meth:`ConfigDB.insert_setting`."""
+        self.operations.append(Operation(INSERT, section, option.lower(), value, target))
+
+    def append(self, section: str, option: str, value: str, target: str | None = None) -> None:
+        """Add an array entry to ``target`` (default: highest priority file)."""
+        self.operations.append(Operation(APPEND, section, option.lower(), value, target))
+
+    def delete(self, section: str, option: str, target: str | None = None) -> None:
+        """Delete ``option`` from ``target`` or from every active file."""
+        self.operations.append(Operation(DELETE, section, option.lower(), None, target))
+
+    def comment(self, section: str, option: str, target: str | None = None) -> None:
+        """Comment out ``option`` in ``target`` or in every active file."""
+        self.operations.append(Operation(COMMENT, section, option.lower(), None, target))
+
+    def __len__(self) -> int:
+        return len(self.operations)
+
+    def commit(self) -> List[Operation]:
+        active = self.db._active_files()
+        by_name = {ini.path.name: ini for ini in active}
+        # Names of the files holding each queued key, kept current as
+        # operations apply, so targets are not looked up file by file.
+        present: Dict[Tuple[str, str], Set[str]] = {}
+        for key in {(op.section, op.option) for op in self.operations}:
+            present[key] = {ini.path.name for ini in active if ini.has_option(*key)}
+        snapshots: Dict[str, str] = {}
+        applied: List[Operation] = []
+
+        def touch(ini: IniFile) -> IniFile:
+            if ini.path.name not in snapshots:
+                snapshots[ini.path.name] = ini.snapshot()
+            return ini
+
+        try:
+            for op in self.operations:
+                if op.action not in ACTIONS:
+                    raise ValueError(f"Unknown action: {op.action}")
+                if op.target is not None and op.target not in by_name:
+                    raise ValueError(f"Not an active config file: {op.target}")
+                holders = present[(op.section, op.option)]
+                if op.action in (INSERT, APPEND):
+                    ini = self._insert_target(op, active, by_name, holders)
+                    if ini is None:
+                        continue
+                    touch(ini)
+                    holders.add(ini.path.name)
+                    previous = None
+                    if op.action == APPEND:
+                        ini.append_option(op.section, op.option, op.value or "")
+                    else:
+                        if not ini.updater.has_section(op.section):
+                            ini.updater.add_section(op.section)
+                        sec = ini.updater[op.section]
+                        previous = sec[op.option].value if sec.has_option(op.option) else None
+                        sec[op.option] = op.value
+                    applied.append(Operation(op.action, op.section, op.option, op.value, op.target, ini.path.name, previous))
+                    continue
+                files = [by_name[op.target]] if op.target else active
+                for ini in files:
+                    if ini.path.name not in holders:
+                        continue
+                    if op.action == REMOVE:
+                        touch(ini)
+                        if ini.remove_value(op.section, op.option, op.value or ""):
+                            applied.append(Operation(REMOVE, op.section, op.option, op.value, op.target, ini.path.name))
+                        if not ini.has_option(op.section, op.option):
+                            holders.discard(ini.path.name)
+                        continue
+                    option = ini.updater[op.section][op.option]
+                    if _is_commented(option) != (op.action == UNCOMMENT):
+                        continue
+                    touch(ini)
+                    previous = option.value
+                    if op.action == DELETE:
+                        del ini.updater[op.section][op.option]
+                        holders.discard(ini.path.name)
+                    elif op.action == COMMENT:
+                        ini.comment_option(op.section, op.option)
+                    else:
+                        ini.uncomment_option(op.section, op.option)
+                    applied.append(Operation(op.action, op.section, op.option, None, op.target, ini.path.name, previous))
+        except Exception:
+            for name, text in snapshots.items():
+                by_name[name].restore(text)
+            raise
+        self.applied = applied
+        if applied:
+            if self.record:
+                self.db.journal.record(Entry(self.label, applied))
+            self.db._changed({op.option for op in applied})
+        return applied
+
+    @staticmethod
+    def _insert_target(
+        op: Operation, active: List[IniFile], by_name: Dict[str, IniFile], holders: Set[str]
+    ) -> IniFile | None:
+        if op.target:
+            return by_name[op.target]
+        if op.action == INSERT:
+            for ini in reversed(active):
+                if ini.path.name not in holders:
+                    return ini
+        return active[-1] if active else None
 
 
 class ConfigDB:
@@ -59,6 +367,74 @@ class ConfigDB:
     def __init__(self) -> None:
         self.files: List[IniFile] = []
         self.config_dir: Path | None = None
+        self._settings: Dict[str, List[Setting]] | None = None
+        self._listeners: List[Listener] = []
+        #: Undo/redo history of edits made through transactions.
+        self.journal = Journal()
+
+    # ------------------------------------------------------------------
+    # Reverse index and change notification
+    # ------------------------------------------------------------------
+
+    def add_listener(self, listener: Listener) -> None:
+        """Call ``listener`` after every edit made through this object."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Listener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _changed(self, names: Iterable[str] | None = None) -> None:
+        if names is None:
+            self._settings = None
+            changed = None
+        else:
+            changed = {n.lower() for n in names}
+            if self._settings is not None:
+                for name in changed:
+                    self._reindex(name)
+        for listener in list(self._listeners):
+            listener(changed)
+
+    def _reindex(self, name: str) -> None:
+        assert self._settings is not None
+        found = []
+        for ini in self._active_files():
+            for sec in ini.updater.sections():
+                if ini.updater[sec].has_option(name):
+                    option = ini.updater[sec][name]
+                    if not _is_commented(option):
+                        found.append(Setting(ini.path.name, sec, option.value or ""))
+        if found:
+            self._settings[name] = found
+        else:
+            self._settings.pop(name, None)
+
+    def settings(self) -> Dict[str, List[Setting]]:
+        """Return ``{lowercased option: [Setting, ...]}`` for active files.
+
+        Settings are listed in load order, so the last one is the value that
+        takes effect.  The index is built on first use and then updated in
+        place by edits, so callers can join against it with plain dict
+        lookups.
+        """
+        if self._settings is None:
+            index: Dict[str, List[Setting]] = {}
+            for ini in self._active_files():
+                name = ini.path.name
+                for sec_name in ini.updater.sections():
+                    for opt_name, option in ini.updater[sec_name].items():
+                        if not _is_commented(option):
+                            index.setdefault(opt_name.lower(), []).append(
+                                Setting(name, sec_name, option.value or "")
+                            )
+            self._settings = index
+        return self._settings
+
+    def effective_setting(self, name: str) -> Setting | None:
+        """Return the highest priority setting of ``name``, if any."""
+        found = self.settings().get(name.lower())
+        return found[-1] if found else None
 
     def load(self, config_dir: Path) -> None:
         """Load all known ini files from ``config_dir``."""
@@ -73,6 +449,8 @@ class ConfigDB:
         for pat in patterns:
             for path in sorted(config_dir.glob(pat)):
                 self.files.append(IniFile(path))
+        self.journal.clear()
+        self._changed()
 
     # new helper methods
     def list_files(self) -> List[Tuple[str, bool]]:
@@ -83,9 +461,43 @@ class ConfigDB:
         """Toggle whether a given ini file participates in operations."""
         for ini in self.files:
             if ini.path.name == filename:
-                ini.enabled = enabled
+                if ini.enabled != enabled:
+                    ini.enabled = enabled
+                    self._changed()
                 break
 
+    def changed_files(self) -> List[IniFile]:
+        """Return loaded files whose size or mtime changed since they were read."""
+        return [ini for ini in self.files if fingerprint(ini.path) != ini.fingerprint]
+
+    def reload_changed(self) -> "ReloadReport":
+        """Re-read files edited outside this object, keeping unsaved edits.
+
+        Only files reported by :meth:`changed_files` are parsed; see
+        :mod:`ue_configurator.ini_merge` for how edits are merged.  Undo
+        history touching a reloaded file is dropped, since undoing it would
+        restore values from before the external edit.
+        """
+        from .ini_merge import ReloadReport, merge_external
+
+        report = ReloadReport()
+        for ini in self.changed_files():
+            ini.fingerprint = fingerprint(ini.path)
+            if ini.fingerprint is None:
+                report.missing.append(ini.path.name)
+                continue
+            disk_text = ini.path.read_text(encoding="utf-8")
+            if disk_text == ini.base:
+                continue
+            kept, conflicts = merge_external(ini, disk_text)
+            report.reloaded.append(ini.path.name)
+            report.kept.extend(kept)
+            report.conflicts.extend(conflicts)
+        if report.reloaded:
+            report.undo_dropped = self.journal.discard(set(report.reloaded))
+            self._changed()
+        return report
+
     def _active_files(self) -> List[IniFile]:
         return [ini for ini in self.files if ini.enabled]
 
@@ -100,7 +512,15 @@ class ConfigDB:
         return result
 
     def find_duplicates(self) -> Dict[Tuple[str, str], List[IniFile]]:
-        dups = {k: v for k, v in self.entries().items() if len(v) > 1}
+        # Array operations (``+CVars=...``) are meant to repeat.
+        dups = {}
+        for key, files in self.entries().items():
+            if len(files) < 2 or key[1].startswith(ARRAY_OPS):
+                continue
+            # Entries commented out in memory are no longer duplicates.
+            active = [ini for ini in files if not _is_commented(ini.updater[key[0]][key[1]])]
+            if len(active) > 1:
+                dups[key] = active
         return dups
 
     def comment_lower_priority(self) -> None:
@@ -112,13 +532,14 @@ class ConfigDB:
         them.
         """
         dups = self.find_duplicates()
-        for (section, option), files in dups.items():
-            files_sorted = sorted(
-                files,
-                key=lambda f: self._priority_of(f.path.name),
-            )
-            for ini in files_sorted[:-1]:
-                ini.comment_option(section, option)
+        with self.transaction("Comment duplicates") as tx:
+            for (section, option), files in dups.items():
+                files_sorted = sorted(
+                    files,
+                    key=lambda f: self._priority_of(f.path.name),
+                )
+                for ini in files_sorted[:-1]:
+                    tx.comment(section, option, ini.path.name)
 
     def _priority_of(self, filename: str) -> int:
         for idx, prefix in enumerate(self.PRIORITY):
@@ -131,6 +552,7 @@ class ConfigDB:
         backup_dir = config_dir / "Backup" / datetime.now().strftime("%Y-%m-%d-%H%M%S")
         for ini in self._active_files():
             ini.write(backup_dir)
+        self.journal.mark_saved()
         return backup_dir
 
     def validate(self) -> Tuple[bool, str | None]:
@@ -148,56 +570,125 @@ class ConfigDB:
     def available_targets(self) -> List[str]:
         return [ini.path.name for ini in self._active_files()]
 
+    @contextmanager
+    def transaction(self, label: str = "") -> Iterator[Transaction]:
+        """Queue edits and apply them together when the block exits.
+
+        ``with db.transaction() as tx: tx.insert(...); tx.delete(...)``.
+        Nothing is applied if the block raises; if an edit fails, all files
+        are restored to their state before the transaction.  The batch is
+        one undo step named ``label``.
+        """
+        tx = Transaction(self, label)
+        yield tx
+        tx.commit()
+
+    # ------------------------------------------------------------------
+    # Undo and redo
+    # ------------------------------------------------------------------
+
+    def _apply(self, operations: List[Operation]) -> List[Operation]:
+        tx = Transaction(self, record=False)
+        tx.operations = operations
+        return tx.commit()
+
+    def undo(self) -> Entry | None:
+        """Revert the last recorded edit and return it (``None`` if none)."""
+        entry = self.journal.peek_undo()
+        if entry is None:
+            return None
+        self._apply([op.inverse() for op in reversed(entry.operations)])
+        return self.journal.undone()
+
+    def redo(self) -> Entry | None:
+        """Re-apply the last undone edit and return it (``None`` if none)."""
+        entry = self.journal.peek_redo()
+        if entry is None:
+            return None
+        self._apply([op.pinned() for op in entry.operations])
+        return self.journal.redone()
+
+    def replay(self, journal_path: Path) -> int:
+        """Re-apply the edits persisted in ``journal_path``; return the event count.
+
+        Call this after :meth:`load` to recover the unsaved edits of a
+        session that ended without saving.  The events are re-recorded in
+        :attr:`journal`, so they can be undone as usual.
+        """
+        events = read_events(journal_path)
+        for event, label, raw_ops in events:
+            ops = [Operation.from_dict(raw) for raw in raw_ops]
+            if event == "undo":
+                self._apply([op.inverse() for op in reversed(ops)])
+                if self.journal.can_undo():
+                    self.journal.undone()
+            elif event == "redo" and self.journal.can_redo():
+                self.redo()
+            else:
+                applied = self._apply([op.pinned() for op in ops])
+                if applied:
+                    self.journal.record(Entry(label, applied))
+        return len(events)
+
     def insert_setting(self, section: str, option: str, value: str, target_name: str | None = None) -> None:
         """Insert ``option`` into the specified ini file or best candidate."""
-        option_l = option.lower()
-        target: IniFile | None = None
-        if target_name:
-            for ini in self._active_files():
-                if ini.path.name == target_name:
-                    target = ini
-                    break
-        active = self._active_files()
-        if target is None and active:
-            for ini in reversed(active):
-                if not (ini.updater.has_section(section) and ini.updater[section].has_option(option_l)):
-                    target = ini
-                    break
-            if target is None:
-                target = active[-1]
-        if not target:
-            return
-        if not target.updater.has_section(section):
-            target.updater.add_section(section)
-        target.updater[section][option_l] = value
+        active = {ini.path.name for ini in self._active_files()}
+        with self.transaction(f"Set {option}") as tx:
+            # An unknown target falls back to the best candidate.
+            tx.insert(section, option, value, target_name if target_name in active else None)
 
     def resolve_duplicate(self, section: str, option: str, action: str) -> None:
-        option_l = option.lower()
-        files = self.entries().get((section, option_l))
-        if not files:
-            return
-        files_sorted = sorted(files, key=lambda f: self._priority_of(f.path.name))
-        if action == "comment":
-            for ini in files_sorted[:-1]:
-                ini.comment_option(section, option_l)
-        elif action == "delete":
-            for ini in files_sorted[:-1]:
-                if ini.updater.has_section(section) and ini.updater[section].has_option(option_l):
-                    del ini.updater[section][option_l]
+        self.resolve_duplicates({(section, option): action}, f"{action.capitalize()} duplicate {option}")
+
+    def resolve_duplicates(self, actions: Dict[Tuple[str, str], str], label: str = "Resolve duplicates") -> None:
+        """Comment or delete the lower priority entries of many keys at once.
+
+        ``actions`` maps ``(section, option)`` to ``"comment"``, ``"delete"``
+        or ``"ignore"``.  Entries already commented out are left alone, so
+        the file kept is the one :meth:`find_duplicates` ranks highest.  The
+        batch is one undo step.
+        """
+        dups = self.find_duplicates()
+        with self.transaction(label) as tx:
+            for (section, option), action in actions.items():
+                option_l = option.lower()
+                files = dups.get((section, option_l))
+                if not files:
+                    continue
+                files_sorted = sorted(files, key=lambda f: self._priority_of(f.path.name))
+                for ini in files_sorted[:-1]:
+                    if action == "comment":
+                        tx.comment(section, option_l, ini.path.name)
+                    elif action == "delete":
+                        tx.delete(section, option_l, ini.path.name)
+
+    def apply_changes(
+        self, target_name: str, changes: Iterable[Tuple[str, str, str]], label: str = ""
+    ) -> None:
+        """Write ``(section, option, value)`` entries into ``target_name``.
+
+        Array operation keys (``+CVars``) are appended as new lines; other
+        keys are set in place.  Listeners are notified once for the batch
+        and the batch is one undo step.
+        """
+        if target_name not in self.available_targets():
+            raise ValueError(f"Not an active config file: {target_name}")
+        with self.transaction(label or f"Apply changes to {target_name}") as tx:
+            for section, option, value in changes:
+                if option.startswith(ARRAY_OPS):
+                    tx.append(section, option, value, target_name)
+                else:
+                    tx.insert(section, option, value, target_name)
 
     def merge_preset(self, preset_path: Path) -> None:
-        """Merge an external preset ``.ini`` file into the highest priority file."""
-        active = self._active_files()
-        if not active:
-            return
-        target = active[-1]
-        updater = ConfigUpdater(strict=False)
-        updater.read(str(preset_path))
-        for sec in updater.sections():
-            if not target.updater.has_section(sec):
-                target.updater.add_section(sec)
-            for opt, val in updater[sec].items():
-                target.updater[sec][opt] = val.value
+        """Merge an external preset ``.ini`` file into the highest priority file.
+
+        Only entries that differ from the effective config are written; see
+        :mod:`ue_configurator.preset_diff` to preview them first.
+        """
+        from .preset_diff import apply_diff, diff_preset
+
+        apply_diff(self, diff_preset(self, preset_path), label=f"Merge preset {preset_path.name}")
 
     def export_preset(self, path: Path) -> None:
         """Export current merged config to ``path``."""
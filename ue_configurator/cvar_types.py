@@ -0,0 +1,96 @@
+"""Typed CVar metadata parsed from raw ``range``/``default`` strings.
+
+The indexer stores the parsed fields (``dtype``, ``min``, ``max``,
+``options`` and ``cpp_type``) in every cache record so consumers do not have
+to re-parse them.  Records from older caches lack these fields; for those
+:func:`cvar_metadata` falls back to a memoized parse.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+NUMERIC_RANGE = re.compile(
+    r"^\s*([+-]?\d+(?:\.\d+)?)\s*(?:-|\.\.)\s*([+-]?\d+(?:\.\d+)?)\s*$"
+)
+OPTION_SPLIT = re.compile(r"[|,/]")
+
+CPP_TYPES = {"int": "int32", "float": "float", "str": "FString"}
+MACRO_CPP_TYPES = {"INTEGER": "int32", "FLOAT": "float", "STRING": "FString"}
+MACRO_DTYPES = {"INTEGER": "int", "FLOAT": "float", "STRING": "str"}
+
+METADATA_FIELDS = ("dtype", "min", "max", "options", "cpp_type")
+
+ParsedType = Tuple[str, Optional[float], Optional[float], Optional[Tuple[str, ...]]]
+
+
+@lru_cache(maxsize=65536)
+def parse_cvar_type(range_str: str, default: str) -> ParsedType:
+    """Infer ``(dtype, minimum, maximum, options)`` for a CVar.
+
+    ``dtype`` is one of ``"int"``, ``"float"`` or ``"str"``.  ``options`` is a
+    tuple of allowed values when the range string is an enumeration such as
+    ``"Low|High"``.  Results are memoized since many CVars share the same
+    range and default strings.
+    """
+    range_str = range_str.strip()
+
+    # Try to parse a numeric range like ``0-1`` or ``0..1``.
+    num_match = NUMERIC_RANGE.match(range_str)
+    if num_match:
+        start, end = num_match.groups()
+        if "." in start or "." in end:
+            return "float", float(start), float(end), None
+        return "int", int(start), int(end), None
+
+    # If the range isn't numeric, treat it as a set of string options
+    # separated by common delimiters (|, /, ,).
+    if range_str:
+        parts = tuple(p.strip() for p in OPTION_SPLIT.split(range_str) if p.strip())
+        if len(parts) > 1:
+            return "str", None, None, parts
+
+    # Fall back to the default value to guess type when no range was parsed.
+    try:
+        if "." in default or "e" in default.lower():
+            float(default)
+            return "float", None, None, None
+        int(default)
+        return "int", None, None, None
+    except Exception:
+        return "str", None, None, None
+
+
+def compute_metadata(item: Dict[str, Any], macro: str | None = None) -> Dict[str, Any]:
+    """Return the metadata fields for ``item``.
+
+    ``macro`` is the ``UE_CVAR_*`` kind (``INTEGER``/``FLOAT``/``STRING``) when
+    known and takes precedence over the guessed value type.
+    """
+    dtype, vmin, vmax, options = parse_cvar_type(
+        item.get("range", "") or "", item.get("default", "") or ""
+    )
+    dtype = MACRO_DTYPES.get(macro or "", dtype)
+    return {
+        "dtype": dtype,
+        "min": vmin,
+        "max": vmax,
+        "options": list(options) if options else None,
+        "cpp_type": MACRO_CPP_TYPES.get(macro or "", CPP_TYPES[dtype]),
+    }
+
+
+def annotate(records: Iterable[Dict[str, Any]]) -> None:
+    """Add metadata fields in place to records that do not have them yet."""
+    for item in records:
+        if "dtype" not in item:
+            item.update(compute_metadata(item))
+
+
+def cvar_metadata(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Return precomputed metadata for ``item`` or parse it on the fly."""
+    if "dtype" in item:
+        return {field: item.get(field) for field in METADATA_FIELDS}
+    return compute_metadata(item)
@@ -0,0 +1,277 @@
+"""Resolve effective CVars of Unreal device profiles.
+
+``*DeviceProfiles.ini`` files declare profiles as ``[Name DeviceProfile]``
+sections.  Each profile may name a parent with ``BaseProfileName=`` and sets
+CVars through the ``CVars`` array (``+CVars=r.X=1``, ``-CVars=...``,
+``!CVars=ClearArray``).  The same profile can appear in several ini layers
+(engine base, project default, platform folders); arrays are merged layer by
+layer first, then CVars are inherited down the ``BaseProfileName`` chain with
+the child winning.
+
+:class:`DeviceProfileResolver` builds the inheritance graph once and memoizes
+the effective CVar map of every profile it resolves.  When a profile changes,
+only it and its descendants are recomputed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Tuple
+
+from .config_db import ConfigDB, IniFile
+
+SECTION_SUFFIX = " DeviceProfile"
+FILE_SUFFIX = "DeviceProfiles.ini"
+
+#: ``(section, option, value, line)`` as yielded by :meth:`IniFile.iter_options`.
+Option = Tuple[str, str, str, int]
+#: ``(label, options)`` for one ini layer, lowest priority first.
+Layer = Tuple[str, Iterable[Option]]
+
+
+@dataclass
+class DeviceProfile:
+    """A profile merged across all ini layers, before inheritance."""
+
+    name: str
+    base: str | None = None
+    #: Lowercased CVar name -> (name as written, value), in array order.
+    cvars: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+    #: Labels of the layers that define this profile.
+    files: List[str] = field(default_factory=list)
+
+
+def _split_cvar(entry: str) -> Tuple[str, str] | None:
+    name, sep, value = entry.partition("=")
+    name = name.strip()
+    if not sep or not name:
+        return None
+    return name, value.strip()
+
+
+def parse_layers(layers: Iterable[Layer]) -> Dict[str, DeviceProfile]:
+    """Merge the device profile sections of ``layers`` into profiles."""
+    profiles: Dict[str, DeviceProfile] = {}
+    for label, options in layers:
+        # Raw ``CVars`` array entries per profile for this layer's operations.
+        arrays: Dict[str, List[str]] = {}
+        for section, option, value, _line in options:
+            if not section.endswith(SECTION_SUFFIX):
+                continue
+            name = section[: -len(SECTION_SUFFIX)].strip()
+            profile = profiles.get(name)
+            if profile is None:
+                profile = profiles[name] = DeviceProfile(name)
+            if label not in profile.files:
+                profile.files.append(label)
+            key = option.lower()
+            if key == "baseprofilename":
+                profile.base = value.strip() or None
+                continue
+            if key.lstrip("+-.!") != "cvars":
+                continue
+            entries = arrays.setdefault(name, [f"{n}={v}" for n, v in profile.cvars.values()])
+            op = key[0]
+            if op == "!":
+                entries.clear()
+            elif op == "-":
+                if value in entries:
+                    entries.remove(value)
+            elif op == "+":
+                if value not in entries:
+                    entries.append(value)
+            else:  # "." or bare key: always append
+                entries.append(value)
+        for name, entries in arrays.items():
+            cvars: Dict[str, Tuple[str, str]] = {}
+            for entry in entries:
+                parsed = _split_cvar(entry)
+                if parsed:
+                    cvars[parsed[0].lower()] = parsed
+            profiles[name].cvars = cvars
+    return profiles
+
+
+def profile_files(config_dir: Path) -> List[Path]:
+    """Return project device profile inis, lowest priority first.
+
+    ``DefaultDeviceProfiles.ini`` comes first, followed by platform folders
+    (``Config/Android/AndroidDeviceProfiles.ini`` and so on).
+    """
+    files = [config_dir / f"Default{FILE_SUFFIX}"]
+    if config_dir.is_dir():
+        files.extend(sorted(config_dir.glob(f"*/*{FILE_SUFFIX}")))
+    return [p for p in files if p.is_file()]
+
+
+def layers_from_paths(paths: Iterable[Path]) -> List[Layer]:
+    return [(path.name, list(IniFile(path).iter_options())) for path in paths]
+
+
+def engine_layers(engine_dir: Path | None) -> List[Layer]:
+    """Return the engine's ``BaseDeviceProfiles.ini`` layer, if present."""
+    if engine_dir is None:
+        return []
+    base = engine_dir / "Engine" / "Config" / f"Base{FILE_SUFFIX}"
+    return layers_from_paths([base]) if base.is_file() else []
+
+
+def layers_from_db(db: ConfigDB) -> List[Layer]:
+    """Return layers from the active files of ``db`` plus platform folders.
+
+    Files loaded in ``db`` contribute their in-memory state so unsaved edits
+    are reflected; platform folder files are read from disk.
+    """
+    layers: List[Layer] = [
+        (ini.path.name, list(ini.iter_options()))
+        for ini in db._active_files()
+        if ini.path.name.endswith(FILE_SUFFIX)
+    ]
+    if db.config_dir is not None:
+        layers.extend(layers_from_paths(sorted(db.config_dir.glob(f"*/*{FILE_SUFFIX}"))))
+    return layers
+
+
+class DeviceProfileResolver:
+    """Inheritance graph of device profiles with memoized CVar maps."""
+
+    def __init__(self, profiles: Dict[str, DeviceProfile]) -> None:
+        self.profiles = profiles
+        self._children: Dict[str, Set[str]] = {}
+        self._effective: Dict[str, Dict[str, Tuple[str, str, str]]] = {}
+        self._link()
+
+    @classmethod
+    def from_layers(cls, layers: Iterable[Layer]) -> "DeviceProfileResolver":
+        return cls(parse_layers(layers))
+
+    @classmethod
+    def from_config_dir(cls, config_dir: Path, engine_dir: Path | None = None) -> "DeviceProfileResolver":
+        """Load project profiles, optionally on top of the engine's base file."""
+        return cls.from_layers(engine_layers(engine_dir) + layers_from_paths(profile_files(config_dir)))
+
+    @classmethod
+    def from_db(cls, db: ConfigDB, engine_dir: Path | None = None) -> "DeviceProfileResolver":
+        return cls.from_layers(engine_layers(engine_dir) + layers_from_db(db))
+
+    def _link(self) -> None:
+        self._children = {}
+        for profile in self.profiles.values():
+            if profile.base:
+                self._children.setdefault(profile.base, set()).add(profile.name)
+
+    def names(self) -> List[str]:
+        return sorted(self.profiles, key=str.lower)
+
+    def chain(self, name: str) -> List[str]:
+        """Return ``name`` followed by its ancestors.
+
+        Raises :class:`ValueError` when the ``BaseProfileName`` links form a
+        cycle.  A missing parent simply ends the chain.
+        """
+        result: List[str] = []
+        current: str | None = name
+        while current is not None and current in self.profiles:
+            if current in result:
+                raise ValueError(f"Device profile cycle: {' -> '.join(result + [current])}")
+            result.append(current)
+            current = self.profiles[current].base
+        return result
+
+    def descendants(self, name: str) -> Set[str]:
+        """Return every profile inheriting from ``name``, directly or not."""
+        seen: Set[str] = set()
+        stack = [name]
+        while stack:
+            for child in self._children.get(stack.pop(), ()):
+                if child not in seen:
+                    seen.add(child)
+                    stack.append(child)
+        return seen
+
+    def effective(self, name: str) -> Dict[str, Tuple[str, str, str]]:
+        """Return ``{lowercased cvar: (name, value, defining profile)}``.
+
+        The result is memoized.  Resolving a profile also memoizes its
+        ancestors, so resolving every profile costs one merge per profile.
+        """
+        cached = self._effective.get(name)
+        if cached is not None:
+            return cached
+        pending = self.chain(name)
+        if not pending:
+            raise KeyError(name)
+        # Start from the nearest ancestor that is already resolved.
+        result: Dict[str, Tuple[str, str, str]] = {}
+        for depth, ancestor in enumerate(pending):
+            if ancestor in self._effective:
+                result = self._effective[ancestor]
+                pending = pending[:depth]
+                break
+        for profile_name in reversed(pending):
+            result = dict(result)
+            for key, (cvar, value) in self.profiles[profile_name].cvars.items():
+                result[key] = (cvar, value, profile_name)
+            self._effective[profile_name] = result
+        return self._effective[name]
+
+    def invalidate(self, name: str) -> Set[str]:
+        """Forget memoized results of ``name`` and its descendants."""
+        dropped = {name} | self.descendants(name)
+        for profile_name in dropped:
+            self._effective.pop(profile_name, None)
+        return dropped
+
+    def update_profile(self, profile: DeviceProfile) -> Set[str]:
+        """Replace or add ``profile`` and return the invalidated names."""
+        old = self.profiles.get(profile.name)
+        self.profiles[profile.name] = profile
+        if old is None or old.base != profile.base:
+            self._link()
+        return self.invalidate(profile.name)
+
+    def set_cvar(self, name: str, cvar: str, value: str) -> Set[str]:
+        """Set ``cvar`` on profile ``name`` in memory."""
+        self.profiles[name].cvars[cvar.lower()] = (cvar, value)
+        return self.invalidate(name)
+
+    def reload(self, layers: Iterable[Layer]) -> Set[str]:
+        """Re-read ``layers`` and invalidate only profiles that changed."""
+        new = parse_layers(layers)
+        changed: Set[str] = set()
+        for name in set(self.profiles) | set(new):
+            old, fresh = self.profiles.get(name), new.get(name)
+            if old is None or fresh is None or (old.base, old.cvars) != (fresh.base, fresh.cvars):
+                changed.add(name)
+        # Dropped profiles must invalidate their descendants under the old links.
+        dropped: Set[str] = set()
+        for name in changed:
+            dropped |= self.invalidate(name)
+        self.profiles = new
+        self._link()
+        for name in changed:
+            dropped |= self.invalidate(name)
+        return dropped
+
+    def matrix(
+        self,
+        profiles: Iterable[str] | None = None,
+        cvars: Iterable[str] | None = None,
+    ) -> Dict[str, Dict[str, Tuple[str, str]]]:
+        """Compare effective values across profiles.
+
+        Returns ``{cvar: {profile: (value, defining profile)}}`` for every
+        CVar set by any of ``profiles`` (default: all), or only ``cvars``.
+        """
+        names = list(profiles) if profiles is not None else self.names()
+        wanted = {c.lower() for c in cvars} if cvars is not None else None
+        rows: Dict[str, Dict[str, Tuple[str, str]]] = {}
+        display: Dict[str, str] = {}
+        for profile_name in names:
+            for key, (cvar, value, source) in self.effective(profile_name).items():
+                if wanted is not None and key not in wanted:
+                    continue
+                display.setdefault(key, cvar)
+                rows.setdefault(key, {})[profile_name] = (value, source)
+        return {display[key]: rows[key] for key in sorted(rows)}
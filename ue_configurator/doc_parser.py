@@ -0,0 +1,220 @@
+"""Streaming parser for the console variable reference page.
+
+The reference page is several megabytes of HTML holding thousands of table
+rows.  Instead of building a DOM, :class:`ConsoleVariableTableParser`
+reacts to tag events and keeps only the row being read, so records can be
+pulled out while the response is still downloading.
+
+:func:`iter_console_variables` feeds chunks (``str`` or ``bytes``) to the
+parser and yields records as soon as their row closes.  When :mod:`lxml` is
+installed its incremental HTML parser is used instead, with the same output.
+
+Cell text matches BeautifulSoup's ``get_text(strip=True)``: every text run
+between two tags is stripped and the non-empty runs are concatenated.
+Comments and ``<script>``/``<style>`` contents are ignored.  The first row of
+each ``table.table`` is its header and is skipped, as are rows with fewer
+than three ``<td>`` cells.
+"""
+
+from __future__ import annotations
+
+import codecs
+from html.parser import HTMLParser
+from typing import Dict, Iterable, Iterator, List
+
+try:
+    from lxml import etree  # type: ignore
+except ModuleNotFoundError:
+    etree = None  # type: ignore
+
+Record = Dict[str, str]
+_SKIP_TEXT = {"script", "style"}
+
+
+def _record(cells: List[str]) -> Record:
+    return {
+        "name": cells[0],
+        "description": cells[2],
+        "default": cells[1],
+        "category": "",
+        "range": "",
+        "file": "",
+    }
+
+
+def _is_target(classes: str | None) -> bool:
+    return "table" in (classes or "").split()
+
+
+class ConsoleVariableTableParser(HTMLParser):
+    """Collect console variable rows from ``table.table`` elements.
+
+    Call :meth:`feed` with successive chunks and :meth:`pop_records` to take
+    the rows completed so far.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        # One flag per open <table>: True for ``table.table``.
+        self._tables: List[bool] = []
+        # Rows seen in each open target table, to skip its header row.
+        self._row_counts: List[int] = []
+        self._cells: List[str] | None = None
+        self._cell: List[str] | None = None
+        self._cell_depth = 0
+        self._text: List[str] = []
+        self._skip = 0
+        self._records: List[Record] = []
+
+    def pop_records(self) -> List[Record]:
+        records, self._records = self._records, []
+        return records
+
+    def _flush(self) -> None:
+        if self._text:
+            text = "".join(self._text).strip()
+            self._text = []
+            if text and self._cell is not None:
+                self._cell.append(text)
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        self._flush()
+        if tag == "table":
+            target = _is_target(dict(attrs).get("class"))
+            self._tables.append(target)
+            if target:
+                self._row_counts.append(0)
+        elif tag == "tr" and self._tables and self._tables[-1]:
+            self._row_counts[-1] += 1
+            self._cells = [] if self._row_counts[-1] > 1 else None
+            self._cell = None
+            self._cell_depth = 0
+        elif tag == "td" and self._cells is not None:
+            if self._cell_depth == 0:
+                self._cell = []
+            self._cell_depth += 1
+        elif tag in _SKIP_TEXT:
+            self._skip += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush()
+        if tag == "table" and self._tables:
+            if self._tables.pop():
+                self._row_counts.pop()
+                self._cells = None
+        elif tag == "tr" and self._cells is not None:
+            if len(self._cells) >= 3:
+                self._records.append(_record(self._cells))
+            self._cells = None
+        elif tag == "td" and self._cell is not None:
+            self._cell_depth -= 1
+            if self._cell_depth == 0:
+                assert self._cells is not None
+                self._cells.append("".join(self._cell))
+                self._cell = None
+        elif tag in _SKIP_TEXT and self._skip:
+            self._skip -= 1
+
+    def handle_data(self, data: str) -> None:
+        if self._cell is not None and not self._skip:
+            self._text.append(data)
+
+    def handle_comment(self, data: str) -> None:
+        self._flush()
+
+    def unknown_decl(self, data: str) -> None:
+        self._flush()
+        if data.startswith("CDATA[") and self._cell is not None:
+            self._text.append(data[6:])
+            self._flush()
+
+    def close(self) -> None:
+        super().close()
+        self._flush()
+
+
+def _decoded(chunks: Iterable[str | bytes], encoding: str) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    for chunk in chunks:
+        yield decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def _iter_html_parser(chunks: Iterable[str]) -> Iterator[Record]:
+    parser = ConsoleVariableTableParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from parser.pop_records()
+    parser.close()
+    yield from parser.pop_records()
+
+
+def _cell_text(cell) -> str:
+    parts = []
+    if cell.text:
+        parts.append(cell.text.strip())
+    for child in cell:
+        if isinstance(child.tag, str) and child.tag not in _SKIP_TEXT:
+            parts.append(_cell_text(child))
+        if child.tail:
+            parts.append(child.tail.strip())
+    return "".join(parts)
+
+
+def _iter_lxml(chunks: Iterable[str]) -> Iterator[Record]:
+    parser = etree.HTMLPullParser(events=("start", "end"), tag=("table", "tr"))
+    tables: List[bool] = []
+    row_counts: List[int] = []
+
+    def drain() -> Iterator[Record]:
+        for event, element in parser.read_events():
+            if element.tag == "table":
+                if event == "start":
+                    tables.append(_is_target(element.get("class")))
+                    if tables[-1]:
+                        row_counts.append(0)
+                else:
+                    if tables and tables.pop():
+                        row_counts.pop()
+                    element.clear(keep_tail=True)
+            elif tables and tables[-1]:
+                if event == "start":
+                    row_counts[-1] += 1
+                    continue
+                if row_counts[-1] > 1:
+                    cells = [_cell_text(td) for td in element.iter("td")]
+                    if len(cells) >= 3:
+                        yield _record(cells)
+                # Rows are not needed once read; keep memory flat.
+                element.clear(keep_tail=True)
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from drain()
+    parser.close()
+    yield from drain()
+
+
+def iter_console_variables(
+    chunks: Iterable[str | bytes], encoding: str = "utf-8", use_lxml: bool | None = None
+) -> Iterator[Record]:
+    """Yield console variable records from HTML arriving in ``chunks``.
+
+    ``bytes`` chunks are decoded incrementally with ``encoding``.
+    ``use_lxml=None`` picks lxml when it is installed.
+    """
+    text = _decoded(chunks, encoding)
+    if use_lxml is None:
+        use_lxml = etree is not None
+    if use_lxml:
+        if etree is None:
+            raise RuntimeError("lxml is not installed")
+        return _iter_lxml(text)
+    return _iter_html_parser(text)
+
+
+def parse_console_variable_page(html: str) -> List[Record]:
+    """Parse console variables from a complete reference page."""
+    return list(iter_console_variables([html]))
@@ -0,0 +1,170 @@
+"""Build CVar caches from saved copies of the online reference.
+
+Machines without internet access cannot scrape the docs, so the reference
+pages can be saved in a browser and imported as a *bundle*: a directory or
+a ``.zip`` of ``.html`` files.  A bundle may hold several pages per version
+and several versions.  The version of a page is taken from its path
+(``5.4/page2.html``, ``reference-5.5.html``), else from the URL the browser
+recorded when saving it, else the default version.
+
+Pages are parsed in parallel worker processes with the streaming parser.
+Zip entries are streamed straight from the archive, never extracted.  The
+records of each version are merged into its versioned cache (see
+:func:`import_bundle`).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from .cvar_types import annotate
+from .doc_parser import iter_console_variables
+from .indexer import _cache_with_version
+
+Record = Dict[str, str]
+PAGE_SUFFIXES = (".html", ".htm")
+CHUNK_SIZE = 64 * 1024
+
+_PATH_VERSION = re.compile(r"(?<![\d.])(\d+\.\d+)(?!\.?\d)")
+# Browsers record the page URL when saving ("saved from url=" comment or the
+# canonical link).  Other application_version links are the version picker.
+_SAVED_URL = re.compile(
+    r"""(?:saved from url=\(\d+\)|rel=["']?canonical["']?\s+href=["'])[^"'\s>]*application_version=(\d+\.\d+)""",
+    re.IGNORECASE,
+)
+_HEAD_BYTES = 16 * 1024
+
+
+def version_from_path(name: str) -> str | None:
+    """Return the last ``X.Y`` version mentioned in an entry path."""
+    matches = _PATH_VERSION.findall(name.replace("\\", "/"))
+    return matches[-1] if matches else None
+
+
+def list_pages(bundle: Path) -> List[str]:
+    """Return the page entries of ``bundle`` in a stable order.
+
+    Entries are paths relative to a directory bundle or member names of a
+    zip bundle.
+    """
+    if zipfile.is_zipfile(bundle):
+        with zipfile.ZipFile(bundle) as zf:
+            names = [
+                info.filename
+                for info in zf.infolist()
+                if not info.is_dir() and info.filename.lower().endswith(PAGE_SUFFIXES)
+            ]
+    elif bundle.is_dir():
+        names = [
+            p.relative_to(bundle).as_posix()
+            for p in bundle.rglob("*")
+            if p.is_file() and p.suffix.lower() in PAGE_SUFFIXES
+        ]
+    else:
+        raise ValueError(f"Not a directory or zip file: {bundle}")
+    return sorted(names)
+
+
+def _iter_chunks(bundle: Path, name: str) -> Iterator[bytes]:
+    if bundle.is_dir():
+        with open(bundle / name, "rb") as fh:
+            while chunk := fh.read(CHUNK_SIZE):
+                yield chunk
+        return
+    with zipfile.ZipFile(bundle) as zf, zf.open(name) as fh:
+        while chunk := fh.read(CHUNK_SIZE):
+            yield chunk
+
+
+def parse_page(bundle: Path, name: str) -> Tuple[str, str | None, List[Record]]:
+    """Parse one bundle entry; return ``(name, detected version, records)``."""
+    head = bytearray()
+
+    def sniffed() -> Iterator[bytes]:
+        for chunk in _iter_chunks(bundle, name):
+            if len(head) < _HEAD_BYTES:
+                head.extend(chunk[: _HEAD_BYTES - len(head)])
+            yield chunk
+
+    records = list(iter_console_variables(sniffed()))
+    version = version_from_path(name)
+    if version is None:
+        match = _SAVED_URL.search(head.decode("utf-8", "replace"))
+        version = match.group(1) if match else None
+    return name, version, records
+
+
+def parse_bundle(
+    bundle: Path, default_version: str = "5.4", workers: int | None = None
+) -> Dict[str, List[Record]]:
+    """Parse every page of ``bundle`` and group the records by version.
+
+    Pages of one version are merged in entry order; a CVar listed on several
+    pages keeps its first record.  ``workers=1`` parses in-process.
+    """
+    names = list_pages(bundle)
+    if workers == 1 or len(names) <= 1:
+        parsed = [parse_page(bundle, name) for name in names]
+    else:
+        workers = min(workers or os.cpu_count() or 1, len(names))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = list(pool.map(parse_page, [bundle] * len(names), names))
+
+    per_version: Dict[str, Dict[str, Record]] = {}
+    for _name, version, records in parsed:
+        merged = per_version.setdefault(version or default_version, {})
+        for record in records:
+            merged.setdefault(record["name"].lower(), record)
+    return {version: list(records.values()) for version, records in per_version.items()}
+
+
+def merge_records(existing: List[Record], imported: List[Record]) -> List[Record]:
+    """Merge ``imported`` docs records into an existing cache.
+
+    Records indexed from engine headers (they name a source ``file``) are
+    kept; docs records are replaced and new CVars are appended.
+    """
+    result = list(existing)
+    index = {r.get("name", "").lower(): i for i, r in enumerate(result)}
+    for record in imported:
+        key = record["name"].lower()
+        pos = index.get(key)
+        if pos is None:
+            index[key] = len(result)
+            result.append(record)
+        elif not result[pos].get("file"):
+            result[pos] = record
+    return result
+
+
+def import_bundle(
+    bundle: Path,
+    cache_file: Path,
+    default_version: str = "5.4",
+    workers: int | None = None,
+) -> Dict[str, Path]:
+    """Import ``bundle`` into the versioned caches next to ``cache_file``.
+
+    Returns the cache written for each version found in the bundle.
+    """
+    written: Dict[str, Path] = {}
+    for version, records in sorted(parse_bundle(bundle, default_version, workers).items()):
+        target = _cache_with_version(cache_file, version)
+        existing: List[Record] = []
+        if target.exists():
+            try:
+                existing = json.loads(target.read_text())
+            except (OSError, ValueError):
+                existing = []
+        data = merge_records(existing, records)
+        annotate(data)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(json.dumps(data, indent=2))
+        written[version] = target
+    return written
@@ -0,0 +1,253 @@
+"""HTTP fetching for the docs scraper: pooled, retried and cached.
+
+:class:`Fetcher` wraps a pooled :class:`requests.Session`:
+
+* transient failures (connection errors, timeouts, 429 and 5xx responses)
+  are retried a bounded number of times with exponential backoff and full
+  jitter, honouring ``Retry-After``;
+* responses are stored on disk with their ``ETag``/``Last-Modified``
+  validators, and later requests are conditional, so unchanged pages come
+  back as ``304 Not Modified`` and are served from the cache;
+* a ``403`` (Cloudflare) is retried once through ``cloudscraper`` when it is
+  installed.
+
+:meth:`Fetcher.iter_text` streams the body in chunks so large pages can be
+parsed while they download.
+
+Pass a custom ``session`` (anything with a requests-like ``get``) or a
+``base_url`` to point the scraper at a stand-in server in tests.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import cloudscraper  # type: ignore
+except ModuleNotFoundError:
+    cloudscraper = None  # type: ignore
+
+DEFAULT_CACHE_DIR = Path.home() / ".ue5_config_assistant" / "http"
+RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# Some locations block generic user agents or requests without language
+# headers and respond with HTTP 403.  Pretend to be a real browser so that
+# the request succeeds more reliably for end users.
+BROWSER_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/118.0 Safari/537.36"
+    ),
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    # Some regions appear to require a referer header for the request to
+    # succeed.  Provide one to further mimic a real browser request.
+    "Referer": "https://dev.epicgames.com/documentation/",
+}
+
+
+@dataclass
+class FetchResult:
+    url: str
+    status: int
+    text: str
+    #: True when the body came from the on-disk cache after a 304.
+    from_cache: bool = False
+
+
+def pooled_session(pool_size: int = 8) -> requests.Session:
+    """Return a session keeping up to ``pool_size`` connections per host."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class Fetcher:
+    """GET pages with connection reuse, bounded retries and HTTP caching.
+
+    ``cache_dir=None`` disables the response cache.  ``sleep`` and ``rng``
+    are injectable so tests do not wait.
+    """
+
+    def __init__(
+        self,
+        session: Any | None = None,
+        cache_dir: Path | None = DEFAULT_CACHE_DIR,
+        retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 10.0,
+        timeout: float = 10,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.session = session if session is not None else pooled_session()
+        self.cache_dir = cache_dir
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.sleep = sleep
+        self.rng = rng or random.Random()
+        self._scraper: Any | None = None
+
+    # ------------------------------------------------------------------
+    # Response cache
+    # ------------------------------------------------------------------
+
+    def _cache_file(self, url: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{hashlib.sha1(url.encode()).hexdigest()[:16]}.json"
+
+    def _load(self, url: str) -> Dict[str, Any] | None:
+        path = self._cache_file(url)
+        if path is None:
+            return None
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return entry if entry.get("url") == url else None
+
+    @staticmethod
+    def _cacheable(resp: Any) -> bool:
+        headers = getattr(resp, "headers", {}) or {}
+        return bool(headers.get("ETag") or headers.get("Last-Modified"))
+
+    def _store(self, url: str, resp: Any, text: str) -> None:
+        path = self._cache_file(url)
+        if path is None or not self._cacheable(resp):
+            return
+        headers = resp.headers
+        entry = {"url": url, "etag": headers.get("ETag"), "last_modified": headers.get("Last-Modified"), "text": text}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(entry), encoding="utf-8")
+            tmp.replace(path)
+        except OSError:  # pragma: no cover - cache is best effort
+            pass
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def _delay(self, attempt: int, resp: Any | None) -> float:
+        retry_after = (getattr(resp, "headers", {}) or {}).get("Retry-After") if resp is not None else None
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                pass
+        # Full jitter keeps concurrent clients from retrying in lockstep.
+        return self.rng.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+    def _request(self, session: Any, url: str, headers: Dict[str, str], stream: bool = False) -> Any:
+        extra = {"stream": True} if stream else {}
+        for attempt in range(self.retries + 1):
+            resp = None
+            try:
+                resp = session.get(url, headers=headers, timeout=self.timeout, **extra)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.retries:
+                    raise
+            else:
+                if resp.status_code not in RETRY_STATUS or attempt == self.retries:
+                    return resp
+                _close(resp)
+            self.sleep(self._delay(attempt, resp))
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _open(self, url: str, headers: Dict[str, str] | None, stream: bool) -> tuple[Any, Dict[str, Any] | None]:
+        """Send the (conditional) request; return the response and cache entry."""
+        request_headers = dict(BROWSER_HEADERS if headers is None else headers)
+        entry = self._load(url)
+        if entry:
+            if entry.get("etag"):
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+        resp = self._request(self.session, url, request_headers, stream)
+        if resp.status_code == 403 and cloudscraper is not None:
+            # Some environments sit behind Cloudflare protection which
+            # rejects generic requests.
+            _close(resp)
+            if self._scraper is None:
+                self._scraper = cloudscraper.create_scraper()
+            resp = self._request(self._scraper, url, request_headers, stream)
+        if resp.status_code == 304 and entry:
+            return resp, entry
+        if resp.status_code >= 400:
+            _close(resp)
+        resp.raise_for_status()
+        if resp.status_code >= 400:
+            # Stand-in responses may not raise themselves.
+            raise requests.HTTPError(f"HTTP {resp.status_code} for {url}", response=resp)
+        return resp, None
+
+    def get(self, url: str, headers: Dict[str, str] | None = None) -> FetchResult:
+        """Fetch ``url``; raise :class:`requests.HTTPError` on failure."""
+        resp, entry = self._open(url, headers, stream=False)
+        if entry is not None:
+            return FetchResult(url, 304, entry["text"], from_cache=True)
+        self._store(url, resp, resp.text)
+        return FetchResult(url, resp.status_code, resp.text)
+
+    def iter_text(self, url: str, headers: Dict[str, str] | None = None, chunk_size: int = 64 * 1024) -> Iterator[str]:
+        """Yield the body of ``url`` in decoded chunks as it arrives.
+
+        A body served from the cache is yielded in one piece.  Errors are
+        raised like :meth:`get`, before the first chunk.
+        """
+        resp, entry = self._open(url, headers, stream=True)
+        return self._iter_body(url, resp, entry, chunk_size)
+
+    def _iter_body(self, url: str, resp: Any, entry: Dict[str, Any] | None, chunk_size: int) -> Iterator[str]:
+        try:
+            if entry is not None:
+                yield entry["text"]
+                return
+            if not hasattr(resp, "iter_content"):
+                self._store(url, resp, resp.text)
+                yield resp.text
+                return
+            if resp.encoding is None:
+                resp.encoding = "utf-8"
+            keep: List[str] | None = [] if self._cacheable(resp) else None
+            for chunk in resp.iter_content(chunk_size, decode_unicode=True):
+                if keep is not None:
+                    keep.append(chunk)
+                yield chunk
+            if keep is not None:
+                self._store(url, resp, "".join(keep))
+        finally:
+            _close(resp)
+
+
+def _close(resp: Any) -> None:
+    close = getattr(resp, "close", None)
+    if close is not None:
+        close()
+
+
+_default: Fetcher | None = None
+
+
+def default_fetcher() -> Fetcher:
+    """Return the shared fetcher so repeated builds reuse its connections."""
+    global _default
+    if _default is None:
+        _default = Fetcher()
+    return _default
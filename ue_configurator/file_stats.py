@@ -0,0 +1,156 @@
+"""Per-file statistics for the loaded ini files.
+
+:func:`scan_file` reads one :class:`~ue_configurator.config_db.IniFile` into
+a :class:`FileScan`: its uncommented keys, size and modification time.
+Scans are independent, so they can run on a worker thread and arrive one
+file at a time; :func:`scan_snapshot` scans a copy taken with
+:meth:`IniFile.snapshot <ue_configurator.config_db.IniFile.snapshot>` so
+the worker never touches the files the GUI edits.
+
+:class:`FileStatsIndex` joins the scans.  For every ``(section, key)`` it
+keeps the load positions of the enabled files setting it, and per file the
+number of keys it shares with another enabled file (*duplicates*) and the
+number overridden by a file loaded after it (*shadowed*).  Adding a scan or
+enabling/disabling a file only touches that file's keys, so toggling a file
+never rebuilds the whole key set.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Sequence, Set, Tuple
+
+from .config_db import ARRAY_OPS, IniFile
+
+Key = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class FileScan:
+    name: str
+    #: Uncommented ``(section, lowercased key)`` pairs, array operations excluded.
+    keys: FrozenSet[Key]
+    #: Number of uncommented options, array operation lines included.
+    entries: int
+    #: Size on disk in bytes, ``0`` for files not written yet.
+    size: int
+    #: Modification time on disk in seconds, ``None`` for files not written yet.
+    mtime: float | None
+
+
+@dataclass
+class FileStats:
+    name: str
+    enabled: bool
+    entries: int = 0
+    size: int = 0
+    mtime: float | None = None
+    #: Keys also set by another enabled file.
+    duplicates: int = 0
+    #: Keys overridden by an enabled file loaded later.
+    shadowed: int = 0
+    #: ``False`` until the file's scan was added.
+    scanned: bool = False
+
+
+def scan_file(ini: IniFile) -> FileScan:
+    """Return the statistics of one file as it is in memory."""
+    keys: Set[Key] = set()
+    entries = 0
+    for section, option, _value, _line in ini.iter_options():
+        entries += 1
+        if not option.startswith(ARRAY_OPS):
+            keys.add((section, option))
+    try:
+        st = ini.path.stat()
+        size, mtime = st.st_size, st.st_mtime
+    except OSError:
+        size, mtime = 0, None
+    return FileScan(ini.path.name, frozenset(keys), entries, size, mtime)
+
+
+def scan_snapshot(path: Path, text: str) -> FileScan:
+    """Return the statistics of the file at ``path`` holding ``text``."""
+    return scan_file(IniFile.from_snapshot(path, text))
+
+
+class FileStatsIndex:
+    """Duplicate and shadowed counts for files in load order ``names``."""
+
+    def __init__(self, names: Sequence[Tuple[str, bool]]) -> None:
+        self.names = [name for name, _enabled in names]
+        self._pos = {name: i for i, name in enumerate(self.names)}
+        self.stats = {name: FileStats(name, enabled) for name, enabled in names}
+        self._keys: Dict[str, FrozenSet[Key]] = {}
+        #: key -> sorted load positions of enabled scanned files setting it.
+        self._holders: Dict[Key, List[int]] = {}
+
+    def __getitem__(self, name: str) -> FileStats:
+        return self.stats[name]
+
+    def add(self, scan: FileScan) -> Set[str]:
+        """Add or replace the scan of a file; return the files whose counts changed."""
+        stats = self.stats[scan.name]
+        changed = {scan.name}
+        if stats.enabled and scan.name in self._keys:
+            changed |= self._detach(scan.name)
+        self._keys[scan.name] = scan.keys
+        stats.entries, stats.size, stats.mtime = scan.entries, scan.size, scan.mtime
+        stats.scanned = True
+        if stats.enabled:
+            changed |= self._attach(scan.name)
+        return changed
+
+    def set_enabled(self, name: str, enabled: bool) -> Set[str]:
+        """Enable or disable ``name``; return the files whose counts changed."""
+        stats = self.stats[name]
+        if stats.enabled == enabled:
+            return set()
+        stats.enabled = enabled
+        if name not in self._keys:
+            return {name}
+        changed = self._attach(name) if enabled else self._detach(name)
+        return changed | {name}
+
+    def _attach(self, name: str) -> Set[str]:
+        pos = self._pos[name]
+        stats = self.stats[name]
+        changed: Set[str] = set()
+        for key in self._keys[name]:
+            holders = self._holders.setdefault(key, [])
+            if len(holders) == 1:
+                # The only other file setting the key becomes a duplicate.
+                self.stats[self.names[holders[0]]].duplicates += 1
+                changed.add(self.names[holders[0]])
+            if holders:
+                stats.duplicates += 1
+                if holders[-1] > pos:
+                    stats.shadowed += 1
+                else:
+                    # The previous winner is now overridden.
+                    self.stats[self.names[holders[-1]]].shadowed += 1
+                    changed.add(self.names[holders[-1]])
+            insort(holders, pos)
+        return changed
+
+    def _detach(self, name: str) -> Set[str]:
+        pos = self._pos[name]
+        stats = self.stats[name]
+        changed: Set[str] = set()
+        for key in self._keys[name]:
+            holders = self._holders[key]
+            del holders[bisect_left(holders, pos)]
+            if not holders:
+                del self._holders[key]
+                continue
+            if len(holders) == 1:
+                self.stats[self.names[holders[0]]].duplicates -= 1
+                changed.add(self.names[holders[0]])
+            if holders[-1] < pos:
+                # The file loaded before it takes effect again.
+                self.stats[self.names[holders[-1]]].shadowed -= 1
+                changed.add(self.names[holders[-1]])
+        stats.duplicates = stats.shadowed = 0
+        return changed
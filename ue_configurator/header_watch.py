@@ -0,0 +1,204 @@
+"""Keep a header-based CVar cache current while engine sources change.
+
+:class:`HeaderWatcher` remembers the ``(mtime_ns, size)`` fingerprint and
+the CVars of every header under an engine root.  :meth:`HeaderWatcher.scan`
+stats the tree and parses only headers that are new or changed, then
+reports the difference as an :class:`IndexDelta` of added, updated and
+removed CVars, so callers can patch their views row by row.  After a write,
+:meth:`IndexDelta.resolve` swaps in the records as cached.
+
+:func:`watch_cache` drives a watcher in a polling loop and rewrites the
+cache file (and the fingerprints next to it) whenever something changed.
+It backs ``python -m ue_configurator.indexer --watch``.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from .config_db import fingerprint
+from .cvar_merge import HEADERS, source_view
+from .cvar_types import annotate
+from .indexer import (
+    index_header,
+    iter_headers,
+    load_cache,
+    merge_docs,
+    read_header_state,
+    write_header_state,
+)
+
+Record = Dict[str, str]
+
+
+@dataclass
+class IndexDelta:
+    """CVars that changed between two scans."""
+
+    added: List[Record] = field(default_factory=list)
+    updated: List[Record] = field(default_factory=list)
+    #: Names of CVars no longer registered in any header.
+    removed: List[str] = field(default_factory=list)
+    #: Headers that were re-indexed or disappeared.
+    files: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+    def summary(self) -> str:
+        return f"+{len(self.added)} ~{len(self.updated)} -{len(self.removed)} ({len(self.files)} file(s))"
+
+    def resolve(self, records: Iterable[Record]) -> "IndexDelta":
+        """Return this delta with each CVar as it appears in ``records``.
+
+        ``records`` is the cache as written, merged with docs and annotated,
+        so views patched from the result keep docs fields and metadata.  A
+        CVar dropped from every header but still documented is updated
+        rather than removed.
+        """
+        by_name = {r["name"].lower(): r for r in records if r.get("name")}
+        delta = IndexDelta(files=list(self.files))
+        for record in self.added:
+            delta.added.append(by_name.get(record["name"].lower(), record))
+        for record in self.updated:
+            delta.updated.append(by_name.get(record["name"].lower(), record))
+        for name in self.removed:
+            if name.lower() in by_name:
+                delta.updated.append(by_name[name.lower()])
+            else:
+                delta.removed.append(name)
+        return delta
+
+
+class HeaderWatcher:
+    """Incrementally re-index the headers under ``root``.
+
+    ``records`` (usually the current cache) and ``fingerprints`` seed the
+    watcher.  Headers without a known fingerprint are parsed on the first
+    scan, but only real differences to the seeded records are reported.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        records: Iterable[Record] = (),
+        fingerprints: Dict[str, Tuple[int, int]] | None = None,
+    ) -> None:
+        self.root = root
+        self._records: Dict[str, List[Record]] = {}
+        # Number of headers registering each name; a CVar moved to another
+        # header is an update, not a removal.
+        self._counts: Dict[str, int] = {}
+        for record in records:
+            if record.get("file"):
+                self._records.setdefault(record["file"], []).append(record)
+                self._counts[record["name"]] = self._counts.get(record["name"], 0) + 1
+        self._fingerprints: Dict[str, Tuple[int, int] | None] = dict(fingerprints or {})
+
+    @classmethod
+    def from_cache(cls, cache_file: Path, root: Path) -> "HeaderWatcher":
+        # Keep only what the headers said, so a later merge attributes fields correctly.
+        records = [
+            source_view(r, HEADERS) for r in load_cache(cache_file) if HEADERS in r.get("sources", [HEADERS])
+        ]
+        return cls(root, records, read_header_state(cache_file, root))
+
+    def scan(self) -> IndexDelta:
+        """Re-index new, changed and deleted headers and return the delta."""
+        changed: Dict[str, List[Record]] = {}
+        seen = set()
+        for header in iter_headers(self.root):
+            path = str(header)
+            seen.add(path)
+            fp = fingerprint(header)
+            if fp is not None and fp == self._fingerprints.get(path):
+                continue
+            self._fingerprints[path] = fp
+            try:
+                changed[path] = index_header(header)
+            except OSError:
+                changed[path] = []
+        for path in set(self._records) - seen:
+            changed[path] = []
+            self._fingerprints.pop(path, None)
+
+        old: Dict[str, Record] = {}
+        new: Dict[str, Record] = {}
+        known = set(self._counts)
+        for path, records in changed.items():
+            for record in self._records.get(path, []):
+                old[record["name"]] = record
+                self._counts[record["name"]] -= 1
+            for record in records:
+                new[record["name"]] = record
+                self._counts[record["name"]] = self._counts.get(record["name"], 0) + 1
+            if records:
+                self._records[path] = records
+            else:
+                self._records.pop(path, None)
+
+        delta = IndexDelta(files=sorted(changed))
+        for name, record in new.items():
+            if name not in known:
+                delta.added.append(record)
+            elif record != old.get(name):
+                delta.updated.append(record)
+        for name in old:
+            if name in new:
+                continue
+            if self._counts.get(name):
+                # Still registered by an unchanged header; show that one.
+                delta.updated.append(self._find(name))
+            else:
+                self._counts.pop(name, None)
+                delta.removed.append(name)
+        return delta
+
+    def _find(self, name: str) -> Record:
+        return next(r for records in self._records.values() for r in records if r["name"] == name)
+
+    def records(self) -> List[Record]:
+        """Return all indexed CVars, grouped by header path."""
+        return [record for path in sorted(self._records) for record in self._records[path]]
+
+    def write(self, cache_file: Path) -> List[Record]:
+        """Write the cache and header fingerprints to ``cache_file``.
+
+        A cache built with docs is merged with them again.  Returns the
+        records as written.
+        """
+        data = merge_docs(cache_file, self.records())
+        annotate(data)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(data, indent=2))
+        write_header_state(cache_file, self.root, self._fingerprints)
+        return data
+
+
+def watch_cache(
+    cache_file: Path,
+    root: Path,
+    interval: float = 2.0,
+    iterations: int | None = None,
+    on_delta: Callable[[IndexDelta], None] | None = None,
+) -> None:
+    """Poll ``root`` and update ``cache_file`` until interrupted.
+
+    ``iterations`` bounds the number of scans (``None`` runs forever).
+    """
+    watcher = HeaderWatcher.from_cache(cache_file, root)
+    count = 0
+    while iterations is None or count < iterations:
+        if count:
+            time.sleep(interval)
+        count += 1
+        delta = watcher.scan()
+        if delta.files:
+            # Also persists fingerprints learned for unchanged headers.
+            delta = delta.resolve(watcher.write(cache_file))
+        if delta and on_delta:
+            on_delta(delta)
@@ -0,0 +1,294 @@
+"""Long-running CVar index service over a Unix domain socket.
+
+The daemon keeps a :class:`~ue_configurator.cvar_index.CVarIndex` warm in
+memory so that repeated queries avoid re-parsing the JSON cache.  The protocol
+is newline-delimited JSON: each request is an object with an ``op`` field and
+each response is ``{"ok": true, "result": ...}`` or
+``{"ok": false, "error": "..."}``.
+
+Supported operations:
+
+``ping``
+    returns the number of indexed CVars
+``lookup``
+    ``{"name": str}`` -> record or ``null``
+``search``
+    ``{"text": str, "category": str | null, "limit": int}`` -> list of records
+``validate``
+    ``{"names": [str, ...]}`` -> list of names missing from the index
+``suggest``
+    ``{"name": str, "k": int}`` -> known names close to ``name``
+``complete``
+    ``{"text": str, "k": int}`` -> names starting with ``text``, then near matches
+``names``
+    every indexed CVar name
+
+The server checks the cache file's fingerprint before each request and
+reloads the index when the file changed, so a rebuilt or header-watched
+cache is picked up without a restart.
+
+:class:`IndexClient` talks to a running daemon and transparently falls back to
+an in-process index when none is reachable (or on platforms without
+``AF_UNIX``).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from .config_db import fingerprint
+from .cvar_index import CVarIndex
+
+DEFAULT_DIR = Path.home() / ".ue5_config_assistant"
+
+
+def socket_path(version: str, directory: Path = DEFAULT_DIR) -> Path:
+    """Return the default socket path for ``version``."""
+    return directory / f"index-{version}.sock"
+
+
+def handle_request(index: CVarIndex, request: Dict[str, Any]) -> Any:
+    """Dispatch a single decoded request against ``index``."""
+    op = request.get("op")
+    if op == "ping":
+        return len(index)
+    if op == "lookup":
+        return index.lookup(request["name"])
+    if op == "search":
+        return index.search(
+            request.get("text", ""),
+            request.get("category"),
+            int(request.get("limit", 100)),
+        )
+    if op == "validate":
+        return index.unknown(request.get("names", []))
+    if op == "suggest":
+        return index.suggest(request["name"], int(request.get("k", 5)))
+    if op == "complete":
+        return index.complete(request.get("text", ""), int(request.get("k", 10)))
+    if op == "names":
+        return [r["name"] for r in index.records if r.get("name")]
+    raise ValueError(f"Unknown op: {op!r}")
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                index = self.server.current_index()  # type: ignore[attr-defined]
+                result = handle_request(index, json.loads(line))
+                reply = {"ok": True, "result": result}
+            except Exception as exc:
+                reply = {"ok": False, "error": str(exc)}
+            self.wfile.write(json.dumps(reply).encode() + b"\n")
+            self.wfile.flush()
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+
+    class IndexServer(socketserver.ThreadingUnixStreamServer):
+        """Threaded Unix socket server holding a warm :class:`CVarIndex`.
+
+        With ``cache_file`` the index is reloaded from it whenever its
+        fingerprint changes.
+        """
+
+        daemon_threads = True
+
+        def __init__(
+            self,
+            path: Path,
+            index: CVarIndex,
+            cache_file: Path | None = None,
+            version: str | None = None,
+        ) -> None:
+            self.index = index
+            self.path = path
+            self.cache_file = cache_file
+            self.version = version
+            self._stamp = _cache_stamp(cache_file, version) if cache_file else None
+            self._reload_lock = threading.Lock()
+            _remove_stale_socket(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            super().__init__(str(path), _Handler)
+
+        def current_index(self) -> CVarIndex:
+            """Return the index, reloading it first if the cache file changed."""
+            if self.cache_file is None:
+                return self.index
+            with self._reload_lock:
+                stamp = _cache_stamp(self.cache_file, self.version)
+                if stamp != self._stamp:
+                    self.index = CVarIndex.from_cache(self.cache_file, self.version)
+                    self._stamp = stamp
+                return self.index
+
+        def server_close(self) -> None:
+            super().server_close()
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+else:  # pragma: no cover - Windows without AF_UNIX support
+    IndexServer = None  # type: ignore[assignment,misc]
+
+
+def _cache_stamp(cache_file: Path, version: str | None) -> Tuple[int, int] | None:
+    """Fingerprint of the file the index for ``version`` is loaded from."""
+    from .indexer import cache_path
+
+    return fingerprint(cache_path(cache_file, version))
+
+
+def _remove_stale_socket(path: Path) -> None:
+    """Delete ``path`` if it is a socket nobody listens on.
+
+    Anything else at ``path`` is left alone and reported as an error.
+    """
+    try:
+        mode = path.stat().st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise RuntimeError(f"Not a socket, refusing to replace: {path}")
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        path.unlink()
+    else:
+        raise RuntimeError(f"Index daemon already running at {path}")
+    finally:
+        sock.close()
+
+
+def serve(cache_file: Path, version: str, path: Path | None = None) -> None:
+    """Load the index and serve requests until interrupted."""
+    if IndexServer is None:
+        raise RuntimeError("Unix domain sockets are not supported on this platform")
+    path = path or socket_path(version)
+    index = CVarIndex.from_cache(cache_file, version)
+    with IndexServer(path, index, cache_file, version) as server:
+        print(f"Serving {len(index)} CVars on {path}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+class IndexClient:
+    """Query a running daemon, falling back to an in-process index.
+
+    The fallback index is loaded from ``cache_file`` and reloaded when the
+    file changes, like the daemon does.  Callers that already hold the
+    records can pass ``local`` to build it from those instead.  Without a
+    ``version`` (and ``path``) no daemon is tried.
+    """
+
+    def __init__(
+        self,
+        cache_file: Path,
+        version: str | None,
+        path: Path | None = None,
+        timeout: float = 2.0,
+        local: Callable[[], CVarIndex] | None = None,
+    ) -> None:
+        self.cache_file = cache_file
+        self.version = version
+        self.path = path or (socket_path(version) if version else None)
+        self.timeout = timeout
+        self._sock: socket.socket | None = None
+        self._reader: Any = None
+        self._make_local = local
+        self._local: CVarIndex | None = None
+        self._stamp: Tuple[int, int] | None = None
+        self._connect()
+
+    @property
+    def is_remote(self) -> bool:
+        return self._sock is not None
+
+    def _connect(self) -> None:
+        if not hasattr(socket, "AF_UNIX") or self.path is None or not self.path.exists():
+            return
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(str(self.path))
+        except OSError:
+            sock.close()
+            return
+        self._sock = sock
+        self._reader = sock.makefile("rb")
+
+    def _local_index(self) -> CVarIndex:
+        if self._make_local is not None:
+            if self._local is None:
+                self._local = self._make_local()
+            return self._local
+        stamp = _cache_stamp(self.cache_file, self.version)
+        if self._local is None or stamp != self._stamp:
+            self._local = CVarIndex.from_cache(self.cache_file, self.version)
+            self._stamp = stamp
+        return self._local
+
+    def _call(self, request: Dict[str, Any]) -> Any:
+        if self._sock is not None:
+            try:
+                self._sock.sendall(json.dumps(request).encode() + b"\n")
+                reply = json.loads(self._reader.readline())
+            except (OSError, ValueError):
+                # Daemon went away mid-session; continue in-process.
+                self.close()
+            else:
+                if not reply.get("ok"):
+                    raise ValueError(reply.get("error"))
+                return reply["result"]
+        return handle_request(self._local_index(), request)
+
+    def lookup(self, name: str) -> Dict[str, str] | None:
+        return self._call({"op": "lookup", "name": name})
+
+    def search(self, text: str, category: str | None = None, limit: int = 100) -> List[Dict[str, str]]:
+        return self._call({"op": "search", "text": text, "category": category, "limit": limit})
+
+    def validate(self, names: List[str]) -> List[str]:
+        return self._call({"op": "validate", "names": names})
+
+    def suggest(self, name: str, k: int = 5) -> List[str]:
+        return self._call({"op": "suggest", "name": name, "k": k})
+
+    def complete(self, text: str, k: int = 10) -> List[str]:
+        return self._call({"op": "complete", "text": text, "k": k})
+
+    def names(self) -> List[str]:
+        return self._call({"op": "names"})
+
+    def __len__(self) -> int:
+        return self._call({"op": "ping"})
+
+    def __contains__(self, name: str) -> bool:
+        return self.lookup(name) is not None
+
+    def close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._reader.close()
+                self._sock.close()
+            finally:
+                self._sock = None
+                self._reader = None
+
+    def __enter__(self) -> "IndexClient":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
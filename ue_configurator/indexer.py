@@ -11,17 +11,16 @@ import contextlib
 import rich.progress
 import json as jsonlib
 import requests
-try:
-    import cloudscraper  # type: ignore
-except ModuleNotFoundError:
-    cloudscraper = None  # type: ignore
-from bs4 import BeautifulSoup
+from .config_db import fingerprint
+from .cvar_types import annotate, compute_metadata
+from .doc_parser import iter_console_variables, parse_console_variable_page  # noqa: F401
+from .fetch import Fetcher, default_fetcher
 
 REGISTER = re.compile(
     r'IConsoleVariable::Register\s*\(\s*"(?P<name>[A-Za-z0-9_.]+)"\s*,\s*(?P<default>[^,]+),\s*"(?P<desc>[^"]+)"',
 )
 UE_CVAR = re.compile(
-    r'UE_CVAR_(?:INTEGER|FLOAT|STRING)\s*\(\s*"(?P<name>[^"]+)"\s*,\s*(?P<default>[^,]+),\s*"(?P<desc>[^"]+)"',
+    r'UE_CVAR_(?P<kind>INTEGER|FLOAT|STRING)\s*\(\s*"(?P<name>[^"]+)"\s*,\s*(?P<default>[^,]+),\s*"(?P<desc>[^"]+)"',
 )
 
 COMMENT_CATEGORY = re.compile(r"Category:\s*(?P<val>.+)")
@@ -33,73 +32,30 @@ DOCS_URL = (
 )
 
 
-def parse_console_variable_page(html: str) -> List[Dict[str, str]]:
-    """Parse console variables from a reference HTML page."""
-    soup = BeautifulSoup(html, "html.parser")
-    results: List[Dict[str, str]] = []
-    for table in soup.find_all("table", class_="table"):
-        rows = table.find_all("tr")
-        # Skip the header row that contains column titles.
-        for row in rows[1:]:
-            cols = row.find_all("td")
-            if len(cols) < 3:
-                continue
-            name = cols[0].get_text(strip=True)
-            default = cols[1].get_text(strip=True)
-            desc = cols[2].get_text(strip=True)
-            results.append(
-                {
-                    "name": name,
-                    "description": desc,
-                    "default": default,
-                    "category": "",
-                    "range": "",
-                    "file": "",
-                }
-            )
-    return results
-
-
-def scrape_console_variables(version: str) -> List[Dict[str, str]]:
+def scrape_console_variables(
+    version: str, fetcher: Fetcher | None = None, base_url: str = DOCS_URL
+) -> List[Dict[str, str]]:
     """Fetch console variables from Epic's online documentation for ``version``.
 
     Parameters
     ----------
     version:
         Engine version string, e.g. "5.4".
+    fetcher:
+        HTTP fetcher to use; defaults to a shared pooled and cached one.
+    base_url:
+        Reference page URL, e.g. a local mirror.
     """
 
-    url = f"{DOCS_URL}?application_version={version}"
-    # Some locations block generic user agents or requests without language
-    # headers and respond with HTTP 403.  Pretend to be a real browser so that
-    # the request succeeds more reliably for end users.
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/118.0 Safari/537.36"
-        ),
-        "Accept-Language": "en-US,en;q=0.5",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        # Some regions appear to require a referer header for the request to
-        # succeed.  Provide one to further mimic a real browser request.
-        "Referer": "https://dev.epicgames.com/documentation/",
-    }
-    resp = requests.get(url, headers=headers, timeout=10)
-    if resp.status_code == 403:
-        # Some environments sit behind Cloudflare protection which rejects
-        # generic requests. Retry with cloudscraper if available.
-        if cloudscraper is None:
-            raise RuntimeError("HTTP 403 received while fetching console variable reference")
-        scraper = cloudscraper.create_scraper()
-        resp = scraper.get(url, headers=headers, timeout=10)
+    url = f"{base_url}?application_version={version}"
     try:
-        resp.raise_for_status()
+        # Rows are parsed while the page downloads.
+        chunks = (fetcher or default_fetcher()).iter_text(url)
     except requests.HTTPError as exc:  # pragma: no cover - network dependent
         raise RuntimeError(
             f"Failed to fetch console variable reference for UE {version}: {exc}"
         ) from exc
-    return parse_console_variable_page(resp.text)
+    return list(iter_console_variables(chunks))
 
 
 def iter_headers(root: Path) -> Iterable[Path]:
@@ -125,35 +81,97 @@ def _parse_comment_metadata(lines: List[str], idx: int) -> Tuple[str | None, str
     return category, valid_range
 
 
-def index_headers(root: Path, progress: rich.progress.Progress | None = None) -> list[dict[str, str]]:
+def index_header(header: Path) -> list[dict[str, str]]:
+    """Return the CVars registered in a single header."""
+    results = []
+    text = header.read_text(errors="ignore")
+    lines = text.splitlines()
+    for idx, line in enumerate(lines):
+        match = REGISTER.search(line) or UE_CVAR.search(line)
+        if match:
+            category, rng = _parse_comment_metadata(lines, idx)
+            item = {
+                "name": match.group("name"),
+                "description": match.group("desc"),
+                "default": match.group("default").strip(),
+                "category": category or "",
+                "range": rng or "",
+                "file": str(header),
+            }
+            macro = match.groupdict().get("kind")
+            if macro:
+                # The declared kind outranks any type guessed from values.
+                item["macro"] = macro
+            item.update(compute_metadata(item, macro))
+            results.append(item)
+    return results
+
+
+def index_headers(
+    root: Path,
+    progress: rich.progress.Progress | None = None,
+    fingerprints: Dict[str, Tuple[int, int] | None] | None = None,
+) -> list[dict[str, str]]:
+    """Index every header under ``root``.
+
+    If ``fingerprints`` is given it receives ``(mtime_ns, size)`` of each
+    header as read, so a later watch can skip unchanged files.
+    """
     results = []
     headers = list(iter_headers(root)) if progress else iter_headers(root)
     task_id = None
     if progress:
         task_id = progress.add_task("Headers", total=len(headers))
     for header in headers:
-        text = header.read_text(errors="ignore")
-        lines = text.splitlines()
-        for idx, line in enumerate(lines):
-            match = REGISTER.search(line) or UE_CVAR.search(line)
-            if match:
-                category, rng = _parse_comment_metadata(lines, idx)
-                results.append(
-                    {
-                        "name": match.group("name"),
-                        "description": match.group("desc"),
-                        "default": match.group("default").strip(),
-                        "category": category or "",
-                        "range": rng or "",
-                        "file": str(header),
-                    }
-                )
+        if fingerprints is not None:
+            fingerprints[str(header)] = fingerprint(header)
+        results.extend(index_header(header))
 
         if progress and task_id is not None:
             progress.advance(task_id)
     return results
 
 
+def header_state_file(cache_file: Path) -> Path:
+    """Return the file holding header fingerprints for ``cache_file``."""
+    return cache_file.with_name(f"{cache_file.stem}.headers.json")
+
+
+def write_header_state(cache_file: Path, root: Path, fingerprints: Dict[str, Tuple[int, int] | None]) -> None:
+    state = {"root": str(root), "files": fingerprints}
+    header_state_file(cache_file).write_text(json.dumps(state))
+
+
+def read_header_state(cache_file: Path, root: Path) -> Dict[str, Tuple[int, int]]:
+    """Return fingerprints saved for ``root`` next to ``cache_file``."""
+    try:
+        state = json.loads(header_state_file(cache_file).read_text())
+    except (OSError, ValueError):
+        return {}
+    if state.get("root") != str(root):
+        return {}
+    return {path: tuple(fp) for path, fp in state.get("files", {}).items() if fp}
+
+
+def docs_file(cache_file: Path) -> Path:
+    """Return the file keeping the docs records merged into ``cache_file``."""
+    return cache_file.with_name(f"{cache_file.stem}.docs.json")
+
+
+def merge_docs(cache_file: Path, headers: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Merge ``headers`` with the docs records saved for ``cache_file``.
+
+    Returns ``headers`` unchanged when the cache was not built with docs.
+    """
+    try:
+        docs = json.loads(docs_file(cache_file).read_text())
+    except (OSError, ValueError):
+        return headers
+    from .cvar_merge import merge_sources
+
+    return merge_sources(headers, docs).records
+
+
 def _cache_with_version(cache_file: Path, version: str) -> Path:
     """Return ``cache_file`` with ``-<version>`` inserted before the suffix."""
     suffix = f"-{version}"
@@ -167,6 +185,7 @@ def build_cache(
     engine_root: Path | None = None,
     version: str = "5.4",
     progress: rich.progress.Progress | None = None,
+    docs: List[Dict[str, str]] | None = None,
 ) -> Path:
     """Build a cache of console variables.
 
@@ -179,6 +198,10 @@ def build_cache(
         online documentation.
     version:
         Engine version to scrape when ``engine_root`` is ``None``.
+    docs:
+        Docs records to merge with the header index (see
+        :mod:`ue_configurator.cvar_merge`).  They are kept next to the cache
+        so later header updates are merged again.
     """
 
     target = _cache_with_version(cache_file, version)
@@ -189,8 +212,22 @@ def build_cache(
         except OSError:
             pass
 
+    fingerprints: Dict[str, Tuple[int, int] | None] = {}
     if engine_root:
-        data = index_headers(engine_root, progress)
+        data = index_headers(engine_root, progress, fingerprints)
+        docs_target = docs_file(target)
+        if docs is not None:
+            from .cvar_merge import merge_sources
+
+            # Typed once here so every later merge can compare dtypes.
+            docs = [dict(record) for record in docs]
+            annotate(docs)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            docs_target.write_text(json.dumps(docs))
+            data = merge_sources(data, docs).records
+        elif docs_target.exists():
+            # A header-only rebuild replaces an earlier merged cache.
+            docs_target.unlink()
     else:
         try:
             data = scrape_console_variables(version)
@@ -199,21 +236,31 @@ def build_cache(
             # empty cache instead and allow the caller to continue.
             print(f"Warning: unable to build online cache: {exc}")
             data = []
+    annotate(data)
     target.parent.mkdir(parents=True, exist_ok=True)
     target.write_text(json.dumps(data, indent=2))
+    if engine_root:
+        write_header_state(target, engine_root, fingerprints)
+    return target
+
+
+def cache_path(cache_file: Path, version: str | None = None) -> Path:
+    """Return the file :func:`load_cache` reads for ``version``."""
+    if not version:
+        return cache_file
+    target = _cache_with_version(cache_file, version)
+    if not target.exists() and cache_file.exists():
+        return cache_file
     return target
 
 
 def load_cache(cache_file: Path, version: str | None = None) -> List[Dict[str, str]]:
-    target = cache_file
-    if version:
-        target = _cache_with_version(cache_file, version)
-        if not target.exists() and cache_file.exists():
-            print(
-                "Warning: cache file without version suffix detected; "
-                "consider rebuilding"
-            )
-            target = cache_file
+    target = cache_path(cache_file, version)
+    if version and target != _cache_with_version(cache_file, version):
+        print(
+            "Warning: cache file without version suffix detected; "
+            "consider rebuilding"
+        )
     if target.exists():
         try:
             return json.loads(target.read_text())
@@ -262,7 +309,10 @@ def main() -> None:
     parser.add_argument(
         "--version",
         default="5.4",
-        help="Engine version to scrape from online docs (ignored if --engine-root is provided)",
+        help=(
+            "Engine version to scrape from online docs, or of bundle pages without one "
+            "(ignored if --engine-root is provided)"
+        ),
     )
     parser.add_argument(
         "--cache",
@@ -274,7 +324,41 @@ def main() -> None:
         action="store_true",
         help="Delete existing cache before building",
     )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-index changed headers (requires --engine-root)",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=2.0,
+        help="Seconds between scans in --watch mode",
+    )
+    parser.add_argument(
+        "--bundle",
+        type=Path,
+        help=(
+            "Import saved reference pages from a directory or zip instead of fetching them "
+            "(merged into the header index with --engine-root)"
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for --bundle (default: CPU count)",
+    )
+    parser.add_argument(
+        "--merge-docs",
+        action="store_true",
+        help="Merge the online docs (or --bundle pages) into the header index (requires --engine-root)",
+    )
     args = parser.parse_args()
+    if args.watch and not args.engine_root:
+        parser.error("--watch requires --engine-root")
+    if args.merge_docs and not args.engine_root:
+        parser.error("--merge-docs requires --engine-root")
 
     if args.rebuild:
         for f in args.cache.parent.glob(f"{args.cache.stem}*{args.cache.suffix}"):
@@ -283,16 +367,52 @@ def main() -> None:
             except OSError:
                 pass
 
-    progress = rich.progress.Progress() if args.engine_root else None
-    with progress or contextlib.nullcontext():
-        target = build_cache(
-            cache_file=args.cache,
-            engine_root=args.engine_root,
-            version=args.version,
-            progress=progress,
-        )
+    if args.bundle and not args.engine_root:
+        from .docs_bundle import import_bundle
+
+        written = import_bundle(args.bundle, args.cache, args.version, args.workers)
+        if not written:
+            print(f"Warning: no .html pages found in {args.bundle}")
+        for version, path in written.items():
+            print(f"Cache for {version} written to {path}")
+        return
+
+    target = _cache_with_version(args.cache, args.version)
+    if not (args.watch and target.exists() and header_state_file(target).exists()):
+        docs = None
+        if args.bundle:
+            from .docs_bundle import parse_bundle
 
-    print(f"Cache written to {target}")
+            docs = parse_bundle(args.bundle, args.version, args.workers).get(args.version, [])
+        elif args.merge_docs:
+            try:
+                docs = scrape_console_variables(args.version)
+            except Exception as exc:  # pragma: no cover - network dependent
+                print(f"Warning: unable to fetch docs, building from headers only: {exc}")
+        progress = rich.progress.Progress() if args.engine_root else None
+        with progress or contextlib.nullcontext():
+            target = build_cache(
+                cache_file=args.cache,
+                engine_root=args.engine_root,
+                version=args.version,
+                progress=progress,
+                docs=docs,
+            )
+
+        print(f"Cache written to {target}")
+    if args.watch:
+        from .header_watch import watch_cache
+
+        print(f"Watching {args.engine_root} for header changes (Ctrl+C to stop)")
+        try:
+            watch_cache(
+                target,
+                args.engine_root,
+                args.interval,
+                on_delta=lambda delta: print(f"Updated {target.name}: {delta.summary()}"),
+            )
+        except KeyboardInterrupt:
+            pass
 
 
 if __name__ == "__main__":
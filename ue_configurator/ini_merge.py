@@ -0,0 +1,135 @@
+"""Reload ini files edited outside the app without losing unsaved edits.
+
+Each :class:`~ue_configurator.config_db.IniFile` remembers the text it was
+loaded from (the *base*) and the ``(mtime_ns, size)`` fingerprint of the
+file at that time.  Detecting external edits is one ``stat`` per file; only
+files whose fingerprint changed are read again.
+
+A changed file is merged three ways per ``(section, key)``: the disk
+version is taken as the new state and every key the user edited in memory
+since the base is re-applied on top of it.  When the disk version changed
+the same key differently, the in-memory edit is kept and the key is
+reported as a :class:`MergeConflict`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from .config_db import ARRAY_OPS, ConfigUpdater, IniFile, _comment, _is_commented
+
+#: ``(section, lowercased key) -> values`` of uncommented options.
+State = Dict[Tuple[str, str], Tuple[str, ...]]
+
+
+@dataclass
+class MergeConflict:
+    """A key changed both on disk and in memory."""
+
+    file: str
+    section: str
+    key: str
+    base: Tuple[str, ...]
+    mine: Tuple[str, ...]
+    theirs: Tuple[str, ...]
+
+
+@dataclass
+class ReloadReport:
+    """Outcome of :meth:`ConfigDB.reload_changed`."""
+
+    #: Files read again from disk.
+    reloaded: List[str] = field(default_factory=list)
+    #: Files that disappeared from disk; their in-memory state is kept.
+    missing: List[str] = field(default_factory=list)
+    #: ``(file, section, key)`` of in-memory edits re-applied after reloading.
+    kept: List[Tuple[str, str, str]] = field(default_factory=list)
+    conflicts: List[MergeConflict] = field(default_factory=list)
+    #: Undo/redo entries dropped because they touched a reloaded file.
+    undo_dropped: int = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.reloaded or self.missing)
+
+
+def _state(updater: ConfigUpdater) -> Tuple[State, Dict[Tuple[str, str], str], set]:
+    """Return the option values, raw key names and commented keys of ``updater``."""
+    values: Dict[Tuple[str, str], List[str]] = {}
+    raw: Dict[Tuple[str, str], str] = {}
+    commented = set()
+    for block in updater.iter_blocks():
+        if not hasattr(block, "iter_blocks"):
+            continue
+        for child in block.iter_blocks():
+            if not hasattr(child, "key"):
+                continue
+            key = (block.name, child.key)
+            raw.setdefault(key, child.raw_key)
+            if _is_commented(child):
+                commented.add(key)
+            else:
+                values.setdefault(key, []).append((child.value or "").strip())
+    return {k: tuple(v) for k, v in values.items()}, raw, commented
+
+
+def _parse(text: str) -> ConfigUpdater:
+    updater = ConfigUpdater(strict=False)
+    updater.read_string(text)
+    return updater
+
+
+def _apply(
+    target: ConfigUpdater, section: str, key: str, raw_key: str, values: Tuple[str, ...] | None, comment: bool
+) -> None:
+    """Make ``key`` in ``target`` hold ``values`` (``None``: remove or comment it)."""
+    if not target.has_section(section):
+        if values is None:
+            return
+        target.add_section(section)
+    sec = target[section]
+    blocks = [b for b in sec.iter_blocks() if getattr(b, "key", None) == key and not _is_commented(b)]
+    if values is None:
+        for block in blocks:
+            if comment:
+                _comment(block)
+            else:
+                block.detach()
+        return
+    if len(blocks) == 1 and len(values) == 1 and not key.startswith(ARRAY_OPS):
+        # Keep the line where the external edit put it.
+        blocks[0].value = values[0]
+        return
+    for block in blocks:
+        block.detach()
+    for value in values:
+        sec.add_option(sec.create_option(raw_key, value))
+
+
+def merge_external(ini: IniFile, disk_text: str) -> Tuple[List[Tuple[str, str, str]], List[MergeConflict]]:
+    """Replace ``ini``'s state with ``disk_text`` plus its unsaved edits.
+
+    Returns the re-applied keys and the conflicts.  ``ini.base`` becomes
+    ``disk_text``.
+    """
+    base, _raw, _commented = _state(_parse(ini.base))
+    mine, raw, commented = _state(ini.updater)
+    theirs_updater = _parse(disk_text)
+    theirs, _raw, _commented = _state(theirs_updater)
+
+    kept: List[Tuple[str, str, str]] = []
+    conflicts: List[MergeConflict] = []
+    name = ini.path.name
+    for key in sorted(set(base) | set(mine) | set(theirs)):
+        b, m, t = base.get(key), mine.get(key), theirs.get(key)
+        if m == b or m == t:
+            continue
+        section, option = key
+        if t != b:
+            conflicts.append(MergeConflict(name, section, option, b or (), m or (), t or ()))
+        _apply(theirs_updater, section, option, raw.get(key, option), m, key in commented)
+        kept.append((name, section, option))
+
+    ini.updater = theirs_updater
+    ini.base = disk_text
+    return kept, conflicts
@@ -0,0 +1,164 @@
+"""Bounded undo/redo journal of applied config edits.
+
+Every committed :class:`~ue_configurator.config_db.Transaction` is recorded
+as one :class:`Entry` holding the operations it applied, each pinned to the
+file it landed in together with the value it replaced.  Undoing an entry
+applies the inverse operations, so undo and redo cost as much as the edit
+itself instead of re-reading whole files from a backup.
+
+When attached to a file the journal also appends one JSON line per event
+(``do``, ``undo`` or ``redo``).  Each line carries its operations, so
+:meth:`ConfigDB.replay <ue_configurator.config_db.ConfigDB.replay>` can
+re-apply the unsaved edits of a crashed session to freshly loaded files.
+Saving truncates the file because the edits are then on disk.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Set, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover - import cycle at runtime
+    from .config_db import Operation
+
+DO = "do"
+UNDO = "undo"
+REDO = "redo"
+EVENTS = (DO, UNDO, REDO)
+DEFAULT_LIMIT = 100
+
+#: ``(event, label, operations as dicts)`` read back from a journal file.
+Event = Tuple[str, str, List[Dict[str, Any]]]
+
+
+@dataclass
+class Entry:
+    """One undoable step: the operations a transaction applied."""
+
+    label: str
+    operations: List["Operation"]
+
+
+def read_events(path: Path) -> List[Event]:
+    """Return the events persisted in ``path``.
+
+    A missing file has no events.  Lines that do not parse, such as a line
+    cut short by a crash, are skipped.
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError:
+        return []
+    events: List[Event] = []
+    for line in text.splitlines():
+        try:
+            raw = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(raw, dict) and raw.get("event") in EVENTS:
+            events.append((raw["event"], raw.get("label", ""), list(raw.get("ops", []))))
+    return events
+
+
+class Journal:
+    """Undo and redo stacks with at most ``limit`` undoable entries."""
+
+    def __init__(self, limit: int = DEFAULT_LIMIT, path: Path | None = None) -> None:
+        self.limit = limit
+        self._undo: Deque[Entry] = deque(maxlen=limit)
+        self._redo: List[Entry] = []
+        self.path: Path | None = None
+        if path is not None:
+            self.attach(path)
+
+    def attach(self, path: Path) -> None:
+        """Persist events to ``path``, rewriting it with the current entries."""
+        self.path = path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("w", encoding="utf-8") as f:
+                for entry in self._undo:
+                    f.write(self._line(DO, entry))
+        except OSError:
+            logging.warning("Cannot write undo journal %s", path, exc_info=True)
+
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def peek_undo(self) -> Entry | None:
+        return self._undo[-1] if self._undo else None
+
+    def peek_redo(self) -> Entry | None:
+        return self._redo[-1] if self._redo else None
+
+    def record(self, entry: Entry) -> None:
+        """Push a new entry; the oldest one is dropped beyond ``limit``."""
+        self._undo.append(entry)
+        self._redo.clear()
+        self._write(DO, entry)
+
+    def undone(self) -> Entry:
+        """Move the last entry to the redo stack after it was undone."""
+        entry = self._undo.pop()
+        self._redo.append(entry)
+        self._write(UNDO, entry)
+        return entry
+
+    def redone(self) -> Entry:
+        """Move the last undone entry back after it was re-applied."""
+        entry = self._redo.pop()
+        self._undo.append(entry)
+        self._write(REDO, entry)
+        return entry
+
+    def clear(self) -> None:
+        """Forget all entries, e.g. after the files were reloaded."""
+        self._undo.clear()
+        self._redo.clear()
+        self.mark_saved()
+
+    def discard(self, files: Set[str]) -> int:
+        """Drop the entries touching any of ``files``; return how many were dropped.
+
+        Used after ``files`` were reloaded from disk: their recorded
+        ``previous`` values predate the external edit, so undoing them would
+        overwrite it.  The persisted events are rewritten to match.
+        """
+        keep = [e for e in self._undo if not any(op.file in files for op in e.operations)]
+        redo = [e for e in self._redo if not any(op.file in files for op in e.operations)]
+        dropped = len(self._undo) - len(keep) + len(self._redo) - len(redo)
+        if dropped:
+            self._undo = deque(keep, maxlen=self.limit)
+            self._redo = redo
+            if self.path is not None:
+                self.attach(self.path)
+        return dropped
+
+    def mark_saved(self) -> None:
+        """Truncate the persisted events; undo stays available in memory."""
+        if self.path is None:
+            return
+        try:
+            self.path.write_text("", encoding="utf-8")
+        except OSError:
+            logging.warning("Cannot write undo journal %s", self.path, exc_info=True)
+
+    def _line(self, event: str, entry: Entry) -> str:
+        ops = [asdict(op) for op in entry.operations]
+        return json.dumps({"event": event, "label": entry.label, "ops": ops}) + "\n"
+
+    def _write(self, event: str, entry: Entry) -> None:
+        if self.path is None:
+            return
+        try:
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(self._line(event, entry))
+        except OSError:
+            logging.warning("Cannot write undo journal %s", self.path, exc_info=True)
@@ -0,0 +1,163 @@
+"""Browse CVars by the namespaces in their dotted names.
+
+:class:`NamespaceTree` sorts the records once by their lowercased name
+segments (``r.Shadow.MaxResolution`` -> ``("r", "shadow", "maxresolution")``).
+In that order every namespace covers a contiguous range of positions, so a
+:class:`NamespaceNode` is just a ``[lo, hi)`` range and its descendant count
+is ``hi - lo``.  Children are grouped from a node's range the first time
+they are requested.
+
+Filters are bitmaps over the sorted positions, stored in a Python ``int``.
+:meth:`NamespaceTree.match` builds one per search text; the number of
+matching CVars below a node is the popcount of the node's slice of the
+bitmap, so counts follow the filter without walking the tree.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Sequence, Tuple
+
+Record = Dict[str, str]
+
+
+def name_key(name: str) -> Tuple[str, ...]:
+    return tuple(name.lower().split("."))
+
+
+class NamespaceNode:
+    """One namespace; ``record`` is set when it is also a CVar name."""
+
+    __slots__ = ("tree", "segment", "path", "depth", "lo", "hi", "parent", "row", "_record", "_children")
+
+    def __init__(
+        self,
+        tree: "NamespaceTree",
+        segment: str,
+        path: str,
+        depth: int,
+        lo: int,
+        hi: int,
+        parent: "NamespaceNode | None" = None,
+        row: int = 0,
+    ) -> None:
+        self.tree = tree
+        self.segment = segment
+        self.path = path
+        self.depth = depth
+        self.lo = lo
+        self.hi = hi
+        self.parent = parent
+        self.row = row
+        self._record: Record | None = None
+        self._children: List[NamespaceNode] | None = None
+
+    @property
+    def record(self) -> Record | None:
+        """The CVar named exactly like this namespace, if any."""
+        self.children()
+        return self._record
+
+    @property
+    def total(self) -> int:
+        """Number of CVars in this namespace, including the node itself."""
+        return self.hi - self.lo
+
+    @property
+    def loaded(self) -> bool:
+        return self._children is not None
+
+    def children(self) -> List["NamespaceNode"]:
+        if self._children is None:
+            self._children = self.tree._group(self)
+        return self._children
+
+    def count(self, bits: int) -> int:
+        """Number of CVars in this namespace whose bit is set in ``bits``."""
+        width = self.hi - self.lo
+        return ((bits >> self.lo) & ((1 << width) - 1)).bit_count()
+
+
+class NamespaceTree:
+    """Namespace hierarchy over ``records``."""
+
+    def __init__(self, records: Sequence[Record]) -> None:
+        named = [r for r in records if r.get("name")]
+        keyed = sorted(((name_key(r["name"]), r) for r in named), key=lambda kr: kr[0])
+        self.keys = [k for k, _r in keyed]
+        self.records = [r for _k, r in keyed]
+        self.all = (1 << len(self.records)) - 1
+        self.root = NamespaceNode(self, "", "", 0, 0, len(self.records))
+        self._haystack: List[Tuple[str, str]] | None = None
+        self._matches: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def _group(self, node: NamespaceNode) -> List[NamespaceNode]:
+        keys = self.keys
+        depth = node.depth
+        i = node.lo
+        # Records named exactly like the namespace sort first.
+        while i < node.hi and len(keys[i]) == depth:
+            if node._record is None:
+                node._record = self.records[i]
+            i += 1
+        children: List[NamespaceNode] = []
+        while i < node.hi:
+            segment = keys[i][depth]
+            j = i + 1
+            while j < node.hi and keys[j][depth] == segment:
+                j += 1
+            # Show the spelling of the first CVar in the namespace.
+            display = self.records[i]["name"].split(".")[depth]
+            path = f"{node.path}.{display}" if node.path else display
+            child = NamespaceNode(self, display, path, depth + 1, i, j, node, len(children))
+            if j - i == 1 and len(keys[i]) == depth + 1:
+                child._record = self.records[i]
+                child._children = []
+            children.append(child)
+            i = j
+        return children
+
+    def find(self, path: str) -> NamespaceNode | None:
+        """Return the node for a dotted ``path`` (case-insensitive)."""
+        node = self.root
+        for segment in name_key(path) if path else ():
+            node = next((c for c in node.children() if c.segment.lower() == segment), None)
+            if node is None:
+                return None
+        return node
+
+    # ------------------------------------------------------------------
+    # Bitmaps
+    # ------------------------------------------------------------------
+
+    def bits(self, predicate: Callable[[Record], bool]) -> int:
+        """Return the bitmap of records for which ``predicate`` is true."""
+        buf = bytearray((len(self.records) + 7) // 8)
+        for i, record in enumerate(self.records):
+            if predicate(record):
+                buf[i >> 3] |= 1 << (i & 7)
+        return int.from_bytes(buf, "little")
+
+    def match(self, text: str) -> int:
+        """Bitmap of CVars whose name or description contains ``text``."""
+        text = text.lower()
+        if not text:
+            return self.all
+        cached = self._matches.get(text)
+        if cached is not None:
+            return cached
+        if self._haystack is None:
+            self._haystack = [
+                (r["name"].lower(), (r.get("description") or "").lower()) for r in self.records
+            ]
+        buf = bytearray((len(self.records) + 7) // 8)
+        for i, (name, desc) in enumerate(self._haystack):
+            if text in name or text in desc:
+                buf[i >> 3] |= 1 << (i & 7)
+        bits = int.from_bytes(buf, "little")
+        if len(self._matches) > 32:
+            self._matches.clear()
+        self._matches[text] = bits
+        return bits
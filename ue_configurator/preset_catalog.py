@@ -0,0 +1,246 @@
+"""Cached metadata and cross-preset search for a preset library.
+
+Each ``*.ini`` preset is parsed once into a :class:`PresetInfo` (sections,
+entries, key count, content hash).  The catalog is persisted as JSON and on
+:meth:`PresetCatalog.refresh` only presets whose modification time or size
+changed are read again; a changed timestamp with identical content keeps the
+cached entries.
+
+An inverted index from ``(section, key)`` to the presets that set it answers
+"which presets set ``r.ScreenPercentage``" with one lookup and lets overlap
+and conflict counts between all presets be computed from the shared keys
+only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from itertools import combinations
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+from .config_db import ARRAY_OPS, IniFile
+
+DEFAULT_CACHE_DIR = Path.home() / ".ue5_config_assistant" / "presets"
+CACHE_VERSION = 1
+
+Entry = Tuple[str, str, str]  # (section, key, value)
+
+
+@dataclass
+class PresetInfo:
+    """Parsed metadata of one preset file."""
+
+    name: str
+    mtime_ns: int
+    size: int
+    sha1: str
+    sections: List[str] = field(default_factory=list)
+    entries: List[Entry] = field(default_factory=list)
+
+    @property
+    def key_count(self) -> int:
+        return len(self.entries)
+
+    @property
+    def cvars(self) -> Set[str]:
+        return {key for _section, key, _value in self.entries}
+
+    def summary(self) -> str:
+        return f"{self.key_count} keys in {len(self.sections)} section(s)"
+
+
+@dataclass
+class Match:
+    preset: str
+    section: str
+    key: str
+    value: str
+
+
+def _index_key(key: str, value: str) -> Tuple[str, str]:
+    """Return ``(lookup key, value)`` for an entry.
+
+    Array entries such as ``+CVars=r.Bloom=0`` are indexed under the CVar
+    they set, so they overlap with plain ``r.Bloom=0`` keys.
+    """
+    if key.startswith(ARRAY_OPS) and "=" in value:
+        name, _sep, rhs = value.partition("=")
+        return name.strip().lower(), rhs.strip()
+    return key.lower(), value
+
+
+def default_cache_file(presets_dir: Path) -> Path:
+    key = hashlib.sha1(str(presets_dir.resolve()).encode()).hexdigest()[:16]
+    return DEFAULT_CACHE_DIR / f"{key}.json"
+
+
+def parse_preset(path: Path, data: bytes | None = None) -> PresetInfo:
+    data = path.read_bytes() if data is None else data
+    st = path.stat()
+    sections: List[str] = []
+    entries: List[Entry] = []
+    for section, key, value, _line in IniFile(path).iter_options(raw_keys=True):
+        if section not in sections:
+            sections.append(section)
+        entries.append((section, key, value.strip()))
+    return PresetInfo(
+        path.name, st.st_mtime_ns, st.st_size, hashlib.sha1(data).hexdigest(), sections, entries
+    )
+
+
+class PresetCatalog:
+    """Metadata for every preset in ``presets_dir``, refreshed incrementally."""
+
+    def __init__(self, presets_dir: Path, cache_file: Path | None = None) -> None:
+        self.presets_dir = presets_dir
+        self.cache_file = cache_file or default_cache_file(presets_dir)
+        self.presets: Dict[str, PresetInfo] = {}
+        # (section, lowercased key) -> {preset: value}, presets in name order.
+        self._by_key: Dict[Tuple[str, str], Dict[str, str]] = {}
+        self._by_name: Dict[str, List[str]] = {}
+        # Lowercased "key=value" per entry for substring search.
+        self._haystack: List[Tuple[str, Entry, str]] = []
+        self._load_cache()
+
+    def _load_cache(self) -> None:
+        try:
+            raw = json.loads(self.cache_file.read_text())
+        except (OSError, ValueError):
+            return
+        if raw.get("version") != CACHE_VERSION:
+            return
+        for item in raw.get("presets", []):
+            item["entries"] = [tuple(e) for e in item["entries"]]
+            info = PresetInfo(**item)
+            self.presets[info.name] = info
+        self._reindex()
+
+    def _save_cache(self) -> None:
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": CACHE_VERSION,
+            "presets": [asdict(info) for info in self.presets.values()],
+        }
+        self.cache_file.write_text(json.dumps(payload))
+
+    def _reindex(self) -> None:
+        by_key: Dict[Tuple[str, str], Dict[str, str]] = {}
+        by_name: Dict[str, List[str]] = {}
+        haystack: List[Tuple[str, Entry, str]] = []
+        for name in self.names():
+            for entry in self.presets[name].entries:
+                section, key, value = entry
+                lookup, indexed = _index_key(key, value)
+                by_key.setdefault((section, lookup), {})[name] = indexed
+                presets = by_name.setdefault(lookup, [])
+                if not presets or presets[-1] != name:
+                    presets.append(name)
+                haystack.append((name, entry, f"{key}={value}".lower()))
+        self._by_key = by_key
+        self._by_name = by_name
+        self._haystack = haystack
+
+    def refresh(self) -> Set[str]:
+        """Re-read presets whose file changed; return added/changed/removed names."""
+        changed: Set[str] = set()
+        seen: Set[str] = set()
+        if self.presets_dir.is_dir():
+            for path in self.presets_dir.glob("*.ini"):
+                name = path.name
+                seen.add(name)
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                cached = self.presets.get(name)
+                if cached and (cached.mtime_ns, cached.size) == (st.st_mtime_ns, st.st_size):
+                    continue
+                data = path.read_bytes()
+                if cached and cached.sha1 == hashlib.sha1(data).hexdigest():
+                    cached.mtime_ns, cached.size = st.st_mtime_ns, st.st_size
+                    continue
+                self.presets[name] = parse_preset(path, data)
+                changed.add(name)
+        removed = set(self.presets) - seen
+        for name in removed:
+            del self.presets[name]
+        changed |= removed
+        self._reindex()
+        self._save_cache()
+        return changed
+
+    def names(self) -> List[str]:
+        return sorted(self.presets, key=str.lower)
+
+    def presets_setting(self, key: str, section: str | None = None) -> List[str]:
+        """Return presets that set ``key`` (in ``section`` if given)."""
+        key = key.lower()
+        if section is not None:
+            return list(self._by_key.get((section, key), {}))
+        return list(self._by_name.get(key, []))
+
+    def search(self, text: str, limit: int = 500) -> List[Match]:
+        """Return entries whose ``key=value`` contains ``text`` (case-insensitive)."""
+        text = text.lower()
+        results: List[Match] = []
+        for name, (section, key, value), hay in self._haystack:
+            if text in hay:
+                results.append(Match(name, section, key, value))
+                if len(results) >= limit:
+                    break
+        return results
+
+    def search_by_preset(self, text: str, per_preset: int = 20) -> Dict[str, List[Match]]:
+        """Return ``{preset: matches}`` for every preset matching ``text``.
+
+        Unlike :meth:`search` no preset is cut off by a global limit; only
+        the matches listed per preset are capped at ``per_preset``.
+        """
+        text = text.lower()
+        results: Dict[str, List[Match]] = {}
+        for name, (section, key, value), hay in self._haystack:
+            if text in hay:
+                found = results.setdefault(name, [])
+                if len(found) < per_preset:
+                    found.append(Match(name, section, key, value))
+        return results
+
+    def overlaps(self) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        """Return ``{(preset_a, preset_b): (shared keys, conflicting keys)}``.
+
+        Only pairs sharing at least one key are listed.  The work is
+        proportional to the shared keys, not to all pairs of presets.
+        """
+        result: Dict[Tuple[str, str], List[int]] = {}
+        for per_preset in self._by_key.values():
+            if len(per_preset) < 2:
+                continue
+            for a, b in combinations(per_preset, 2):
+                counts = result.setdefault((a, b), [0, 0])
+                counts[0] += 1
+                if per_preset[a] != per_preset[b]:
+                    counts[1] += 1
+        return {pair: (shared, conflicts) for pair, (shared, conflicts) in result.items()}
+
+    def overlaps_with(self, name: str) -> List[Tuple[str, int, int]]:
+        """Return ``(other, shared, conflicts)`` for presets sharing keys with ``name``."""
+        info = self.presets.get(name)
+        if info is None:
+            return []
+        counts: Dict[str, List[int]] = {}
+        for key in {(s, _index_key(k, v)[0]) for s, k, v in info.entries}:
+            per_preset = self._by_key[key]
+            value = per_preset[name]
+            for other, theirs in per_preset.items():
+                if other == name:
+                    continue
+                entry = counts.setdefault(other, [0, 0])
+                entry[0] += 1
+                if theirs != value:
+                    entry[1] += 1
+        return sorted(
+            ((other, s, c) for other, (s, c) in counts.items()), key=lambda row: (-row[1], row[0])
+        )
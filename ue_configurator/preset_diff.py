@@ -0,0 +1,143 @@
+"""Diff a preset against the effective config and apply only the delta.
+
+The effective config is hashed once into a ``(section, key) -> value`` map
+(highest priority file wins), so classifying every preset entry is a single
+dict lookup.  Entries are classified as:
+
+``add``
+    the key is not set anywhere
+``change``
+    the key is set to a different value
+``noop``
+    the key already has the preset value
+``conflict``
+    applying the entry would not settle the value: the key is set with
+    disagreeing values in several files, or a file with higher priority
+    than the target overrides it
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from .config_db import ARRAY_OPS, ConfigDB, IniFile
+
+ADD = "add"
+CHANGE = "change"
+NOOP = "noop"
+CONFLICT = "conflict"
+KINDS = (ADD, CHANGE, NOOP, CONFLICT)
+
+
+@dataclass
+class Change:
+    """One preset entry and how it relates to the current config."""
+
+    kind: str
+    section: str
+    key: str
+    value: str
+    current: str | None = None
+    #: File holding the effective current value.
+    source: str | None = None
+    #: Files setting the key, lowest priority first.
+    files: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class PresetDiff:
+    """Classified preset entries and the file they would be written to."""
+
+    target: str | None
+    changes: List[Change]
+
+    def counts(self) -> Dict[str, int]:
+        counts = dict.fromkeys(KINDS, 0)
+        for change in self.changes:
+            counts[change.kind] += 1
+        return counts
+
+    def delta(self, include_conflicts: bool = True) -> List[Change]:
+        """Return the entries that need writing."""
+        kinds = {ADD, CHANGE, CONFLICT} if include_conflicts else {ADD, CHANGE}
+        return [c for c in self.changes if c.kind in kinds]
+
+
+def _norm(value: str) -> str:
+    return value.strip()
+
+
+def effective_values(db: ConfigDB) -> Dict[Tuple[str, str], List[Tuple[str, str]]]:
+    """Return ``{(section, key): [(file, value), ...]}`` in priority order.
+
+    Array operation keys map to every value they add so membership can be
+    checked; for other keys the last entry is the effective value.
+    """
+    values: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+    for ini in db._active_files():
+        name = ini.path.name
+        for section, key, value, _line in ini.iter_options():
+            values.setdefault((section, key.lower()), []).append((name, _norm(value)))
+    return values
+
+
+def diff_preset(db: ConfigDB, preset_path: Path, target: str | None = None) -> PresetDiff:
+    """Classify every entry of ``preset_path`` against ``db``.
+
+    ``target`` names the file the delta would be written to; it defaults to
+    the highest priority active file, like :meth:`ConfigDB.merge_preset`.
+    """
+    active = db.available_targets()
+    if target is None:
+        target = active[-1] if active else None
+    elif target not in active:
+        raise ValueError(f"Not an active config file: {target}")
+    rank = {name: idx for idx, name in enumerate(active)}
+    target_rank = rank.get(target, len(active))
+    current = effective_values(db)
+
+    changes: List[Change] = []
+    seen: set[Tuple[str, str, str]] = set()
+    for section, key, value, _line in IniFile(preset_path).iter_options():
+        key = key.lower()
+        value = _norm(value)
+        found = current.get((section, key), [])
+        files = [f for f, _v in found]
+        if key.startswith(ARRAY_OPS):
+            # Array entries are additive: only identical entries are no-ops.
+            if (section, key, value) in seen:
+                continue
+            seen.add((section, key, value))
+            kind = NOOP if any(v == value for _f, v in found) else ADD
+            changes.append(Change(kind, section, key, value, None, None, files))
+            continue
+        if not found:
+            changes.append(Change(ADD, section, key, value))
+            continue
+        source, effective = found[-1]
+        if len({v for _f, v in found}) > 1 or rank.get(source, -1) > target_rank:
+            kind = CONFLICT if effective != value else NOOP
+        else:
+            kind = NOOP if effective == value else CHANGE
+        changes.append(Change(kind, section, key, value, effective, source, files))
+    return PresetDiff(target, changes)
+
+
+def apply_diff(
+    db: ConfigDB, diff: PresetDiff, include_conflicts: bool = True, label: str = ""
+) -> List[Change]:
+    """Write only the delta of ``diff`` into its target file.
+
+    Returns the applied changes.  Listeners of ``db`` are notified once and
+    the delta is one undo step named ``label``.
+    """
+    delta = diff.delta(include_conflicts)
+    if diff.target is None or not delta:
+        return []
+    db.apply_changes(diff.target, [(c.section, c.key, c.value) for c in delta], label)
+    return delta
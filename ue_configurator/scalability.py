@@ -0,0 +1,187 @@
+"""Precomputed scalability group matrix (``sg.*`` -> CVars per level).
+
+``*Scalability.ini`` files define what each scalability group sets at every
+quality level in sections named ``[ShadowQuality@0]`` ... ``[ShadowQuality@Cine]``.
+Layers are applied in order (engine ``BaseScalability.ini``, the project's
+``DefaultScalability.ini``, then platform overrides): a later layer
+replaces individual keys of a section and keeps the rest.
+
+:class:`ScalabilityMatrix` parses the layers once into a
+``(group, level) -> {cvar: value}`` table so lookups are dict accesses.
+:meth:`ScalabilityMatrix.refresh` re-reads only files whose fingerprint
+changed and recomputes only the sections those files define.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Tuple
+
+from .config_db import IniFile, fingerprint as _fingerprint
+
+LEVELS = ("0", "1", "2", "3", "Cine")
+GROUP_PREFIX = "sg."
+FILE_SUFFIX = "Scalability.ini"
+
+#: ``(group lowercased, level)``
+Cell = Tuple[str, str]
+#: Lowercased CVar -> (name as written, value, layer file name)
+CellValues = Dict[str, Tuple[str, str, str]]
+
+
+def parse_level(level: str | int) -> str:
+    """Normalise ``2``, ``"2"``, ``"cine"`` or ``4`` to an entry of :data:`LEVELS`."""
+    text = str(level).strip()
+    for name in LEVELS:
+        if text.lower() == name.lower():
+            return name
+    if text == "4":
+        return "Cine"
+    raise ValueError(f"Unknown scalability level: {level!r}")
+
+
+def group_key(group: str) -> str:
+    """Return the lookup key for ``"sg.ShadowQuality"`` or ``"ShadowQuality"``."""
+    group = group.strip()
+    if group.lower().startswith(GROUP_PREFIX):
+        group = group[len(GROUP_PREFIX) :]
+    return group.lower()
+
+
+def parse_file(path: Path) -> Tuple[Dict[Cell, Dict[str, Tuple[str, str]]], Dict[str, str]]:
+    """Return the cells defined by ``path`` and the group names as written.
+
+    Cells map ``(group, level)`` to ``{cvar: (name, value)}``.
+    """
+    cells: Dict[Cell, Dict[str, Tuple[str, str]]] = {}
+    names: Dict[str, str] = {}
+    for section, option, value, _line in IniFile(path).iter_options(raw_keys=True):
+        group, sep, level = section.rpartition("@")
+        if not sep or not group:
+            continue
+        try:
+            level = parse_level(level)
+        except ValueError:
+            continue
+        key = group_key(group)
+        names.setdefault(key, group)
+        cells.setdefault((key, level), {})[option.lower()] = (option, value.strip())
+    return cells, names
+
+
+def scalability_files(
+    config_dir: Path | None,
+    engine_dir: Path | None = None,
+    platform: str | None = None,
+) -> List[Path]:
+    """Return the scalability ini layers, lowest priority first."""
+    candidates: List[Path] = []
+    if engine_dir is not None:
+        engine_config = engine_dir / "Engine" / "Config"
+        candidates.append(engine_config / f"Base{FILE_SUFFIX}")
+        if platform:
+            candidates.append(engine_config / platform / f"{platform}{FILE_SUFFIX}")
+    if config_dir is not None:
+        candidates.append(config_dir / f"Default{FILE_SUFFIX}")
+        if platform:
+            candidates.append(config_dir / platform / f"{platform}{FILE_SUFFIX}")
+    return [p for p in candidates if p.is_file()]
+
+
+class ScalabilityMatrix:
+    """Group x level x CVar -> value with layer overrides applied."""
+
+    def __init__(self, files: Iterable[Path]) -> None:
+        self.files: List[Path] = list(files)
+        self._fingerprints: Dict[Path, Tuple[int, int] | None] = {}
+        self._layers: Dict[Path, Dict[Cell, Dict[str, Tuple[str, str]]]] = {}
+        self._layer_names: Dict[Path, Dict[str, str]] = {}
+        self._cells: Dict[Cell, CellValues] = {}
+        self._group_names: Dict[str, str] = {}
+        for path in self.files:
+            self._read(path)
+        self._merge(None)
+
+    @classmethod
+    def for_project(
+        cls,
+        config_dir: Path | None,
+        engine_dir: Path | None = None,
+        platform: str | None = None,
+    ) -> "ScalabilityMatrix":
+        return cls(scalability_files(config_dir, engine_dir, platform))
+
+    def _read(self, path: Path) -> None:
+        self._fingerprints[path] = _fingerprint(path)
+        self._layers[path], self._layer_names[path] = parse_file(path) if path.is_file() else ({}, {})
+
+    def _merge(self, cells: Set[Cell] | None) -> None:
+        """Recompute ``cells`` (``None`` for all) from the parsed layers."""
+        if cells is None:
+            self._cells = {}
+            cells = {cell for layer in self._layers.values() for cell in layer}
+        for cell in cells:
+            merged: CellValues = {}
+            for path in self.files:
+                for key, (name, value) in self._layers[path].get(cell, {}).items():
+                    merged[key] = (name, value, path.name)
+            if merged:
+                self._cells[cell] = merged
+            else:
+                self._cells.pop(cell, None)
+        self._group_names = {}
+        for path in self.files:
+            for key, name in self._layer_names[path].items():
+                self._group_names.setdefault(key, name)
+
+    def refresh(self) -> Set[Cell]:
+        """Re-read changed files and return the cells that were recomputed."""
+        dirty: Set[Cell] = set()
+        for path in self.files:
+            if _fingerprint(path) == self._fingerprints.get(path):
+                continue
+            dirty |= set(self._layers.get(path, {}))
+            self._read(path)
+            dirty |= set(self._layers[path])
+        if dirty:
+            self._merge(dirty)
+        return dirty
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def groups(self) -> List[str]:
+        """Return group names as ``sg.<Group>``, sorted."""
+        return sorted({GROUP_PREFIX + self.display_group(g) for g, _l in self._cells}, key=str.lower)
+
+    def display_group(self, key: str) -> str:
+        return self._group_names.get(key, key)
+
+    def cvars(self, group: str, level: str | int) -> CellValues:
+        """Return ``{cvar: (name, value, file)}`` set by ``group`` at ``level``."""
+        return self._cells.get((group_key(group), parse_level(level)), {})
+
+    def value(self, group: str, level: str | int, cvar: str) -> str | None:
+        found = self.cvars(group, level).get(cvar.lower())
+        return found[1] if found else None
+
+    def table(self, group: str) -> Dict[str, Dict[str, str]]:
+        """Return ``{cvar: {level: value}}`` for every level of ``group``."""
+        rows: Dict[str, Dict[str, str]] = {}
+        display: Dict[str, str] = {}
+        for level in LEVELS:
+            for key, (name, value, _file) in self.cvars(group, level).items():
+                display.setdefault(key, name)
+                rows.setdefault(key, {})[level] = value
+        return {display[key]: rows[key] for key in sorted(rows)}
+
+    def groups_setting(self, cvar: str) -> List[Tuple[str, str, str]]:
+        """Return ``(sg.group, level, value)`` for every cell that sets ``cvar``."""
+        key = cvar.lower()
+        found = [
+            (GROUP_PREFIX + self.display_group(group), level, values[key][1])
+            for (group, level), values in self._cells.items()
+            if key in values
+        ]
+        return sorted(found, key=lambda row: (row[0].lower(), LEVELS.index(row[1])))
@@ -0,0 +1,184 @@
+"""Nearest-name suggestions for CVar names using a trigram index."""
+
+from __future__ import annotations
+
+import bisect
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+
+def trigrams(text: str) -> set[str]:
+    """Return the set of trigrams of ``text`` padded with spaces."""
+    padded = f"  {text.lower()} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance between ``a`` and ``b``, capped at ``limit + 1``.
+
+    Only the diagonal band of width ``2 * limit + 1`` is evaluated, which is
+    all that matters when distances above ``limit`` are discarded anyway.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    # Similar names mostly share a long prefix ("r.Shadow.") and often a
+    # suffix; trimming both leaves only the differing middle for the table.
+    start = 0
+    end = min(len(a), len(b))
+    while start < end and a[start] == b[start]:
+        start += 1
+    tail = 0
+    while tail < end - start and a[-1 - tail] == b[-1 - tail]:
+        tail += 1
+    a = a[start : len(a) - tail]
+    b = b[start : len(b) - tail]
+    over = limit + 1
+    prev = [j if j <= limit else over for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        lo = max(1, i - limit)
+        hi = min(len(b), i + limit)
+        cur = [over] * (len(b) + 1)
+        cur[0] = i if i <= limit else over
+        ca = a[i - 1]
+        best = cur[0]
+        for j in range(lo, hi + 1):
+            val = prev[j - 1] + (ca != b[j - 1])
+            if prev[j] + 1 < val:
+                val = prev[j] + 1
+            if cur[j - 1] + 1 < val:
+                val = cur[j - 1] + 1
+            if val > over:
+                val = over
+            cur[j] = val
+            if val < best:
+                best = val
+        if best > limit:
+            return over
+        prev = cur
+    return min(prev[-1], over)
+
+
+class Suggester:
+    """Trigram postings over a set of names.
+
+    A query only touches the postings of its own trigrams, so the cost does
+    not grow with the total number of names the way a linear edit-distance
+    scan does.  Trigrams shared by a large fraction of all names (``"  r"``,
+    ``"r.s"``, ...) carry little signal and are skipped when the query has
+    more selective ones.
+
+    Results are approximate: only the :attr:`RERANK` names sharing the most
+    selective trigrams are considered, so a close name with few shared rare
+    trigrams can be missed.  Those are filtered by their share of all query
+    trigrams before the exact edit distance, which is the expensive step.
+    """
+
+    #: Candidates re-ranked by exact edit distance after trigram scoring.
+    RERANK = 20
+
+    def __init__(self, names: Iterable[str]) -> None:
+        self._names: List[str] = []
+        self._lower: List[str] = []
+        seen: set[str] = set()
+        for name in names:
+            low = name.lower()
+            if low in seen:
+                continue
+            seen.add(low)
+            self._names.append(name)
+            self._lower.append(low)
+        # Postings are split by name length: a name whose length differs
+        # from the query by more than the edit limit can never match, so
+        # those lists are never touched.
+        postings: Dict[Tuple[str, int], List[int]] = {}
+        for idx, low in enumerate(self._lower):
+            size = len(low)
+            for gram in trigrams(low):
+                postings.setdefault((gram, size), []).append(idx)
+        self._postings = postings
+        self._sorted = sorted(range(len(self._lower)), key=self._lower.__getitem__)
+        self._sorted_keys = [self._lower[i] for i in self._sorted]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def suggest(self, query: str, k: int = 5, max_distance: int | None = None) -> List[str]:
+        """Return up to ``k`` names within ``max_distance`` edits of ``query``.
+
+        ``max_distance`` defaults to 2 for short queries and 3 for longer ones,
+        which covers typical typos.  The result is approximate; see
+        :class:`Suggester`.
+        """
+        query_l = query.lower()
+        limit = max_distance if max_distance is not None else (2 if len(query_l) <= 12 else 3)
+        qlen = len(query_l)
+        postings = self._postings
+        grams = trigrams(query_l)
+        lists = []
+        for gram in grams:
+            group = [
+                postings[(gram, size)]
+                for size in range(qlen - limit, qlen + limit + 1)
+                if (gram, size) in postings
+            ]
+            if group:
+                lists.append(group)
+        lists.sort(key=lambda group: sum(map(len, group)))
+        # Each edit destroys at most three trigrams, so any name within
+        # ``limit`` edits shares at least one of the ``3 * limit + 1`` rarest
+        # query trigrams.  Counting only the rarest few keeps the work
+        # proportional to selective postings instead of common prefixes.
+        counted = lists[: 3 * limit + 1]
+        if not counted:
+            return []
+        counts: Counter[int] = Counter()
+        for group in counted:
+            for posting in group:
+                counts.update(posting)
+        floor = max(1, len(counted) - 3 * limit)
+        lower = self._lower
+        # Each edit destroys at most three trigrams of either name, so the
+        # trigrams missing from the smaller shared set give a lower bound on
+        # the distance.  That is far cheaper than the edit distance itself
+        # and drops most candidates before it.
+        qsize = len(grams)
+        bounded = []
+        for idx, c in counts.most_common(self.RERANK):
+            if c < floor:
+                break
+            if lower[idx] == query_l:
+                continue
+            cand = trigrams(lower[idx])
+            least = (max(qsize, len(cand)) - len(grams & cand) + 2) // 3
+            if least <= limit:
+                bounded.append((least, idx))
+        bounded.sort()
+        ranked: List[Tuple[int, str, int]] = []
+        bound = limit
+        for least, idx in bounded:
+            # Once ``k`` names are found, later candidates can only lose.
+            if least > bound:
+                break
+            dist = edit_distance(query_l, lower[idx], bound)
+            if dist <= bound:
+                ranked.append((dist, lower[idx], idx))
+                if len(ranked) >= k:
+                    ranked.sort()
+                    del ranked[k:]
+                    bound = ranked[-1][0]
+        ranked.sort()
+        return [self._names[idx] for _d, _l, idx in ranked[:k]]
+
+    def complete(self, text: str, k: int = 10) -> List[str]:
+        """Return names starting with ``text``, topped up with near matches."""
+        text_l = text.lower()
+        start = bisect.bisect_left(self._sorted_keys, text_l)
+        result: List[str] = []
+        for pos in range(start, min(start + k, len(self._sorted_keys))):
+            if not self._sorted_keys[pos].startswith(text_l):
+                break
+            result.append(self._names[self._sorted[pos]])
+        if len(result) < k and len(text_l) >= 3:
+            seen = set(result)
+            result.extend(n for n in self.suggest(text, k) if n not in seen)
+        return result[:k]
@@ -0,0 +1,31 @@
+"""Autocomplete dropdowns backed by the CVar suggestion index."""
+
+from __future__ import annotations
+
+from typing import Callable, List
+
+from PySide6.QtCore import QStringListModel, Qt
+from PySide6.QtWidgets import QCompleter, QLineEdit
+
+
+def attach_completer(
+    line_edit: QLineEdit,
+    provider: Callable[[str], List[str]],
+    min_chars: int = 2,
+) -> QCompleter:
+    """Show ``provider(text)`` as a dropdown while the user types.
+
+    The provider already ranks prefix matches and near-miss names, so the
+    completer shows its list unfiltered instead of re-filtering by prefix.
+    """
+    model = QStringListModel(line_edit)
+    completer = QCompleter(model, line_edit)
+    completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+    completer.setCaseSensitivity(Qt.CaseInsensitive)
+    line_edit.setCompleter(completer)
+
+    def _update(text: str) -> None:
+        model.setStringList(provider(text) if len(text) >= min_chars else [])
+
+    line_edit.textEdited.connect(_update)
+    return completer
@@ -0,0 +1,69 @@
+"""Notice when loaded ini files are edited outside the app."""
+
+from __future__ import annotations
+
+from typing import List
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, QTimer, Signal
+
+from ..config_db import ConfigDB
+
+
+class ConfigWatcher(QObject):
+    """Emit :attr:`changed` with the names of externally edited files.
+
+    ``QFileSystemWatcher`` (inotify on Linux) triggers the checks; paths it
+    cannot watch, such as files on some network drives, are covered by
+    polling every ``poll_interval`` ms.  Bursts of notifications (an editor
+    saving several files, a source control sync) are batched into a single
+    stat pass over all loaded files after ``debounce`` ms.
+    """
+
+    changed = Signal(list)
+
+    def __init__(
+        self,
+        db: ConfigDB,
+        parent: QObject | None = None,
+        poll_interval: int = 3000,
+        debounce: int = 200,
+        force_polling: bool = False,
+    ) -> None:
+        super().__init__(parent)
+        self.db = db
+        self.force_polling = force_polling
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self._schedule)
+        # Editors that save by renaming replace the watched file, which only
+        # shows up as a change of its directory.
+        self.watcher.directoryChanged.connect(self._schedule)
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(debounce)
+        self._debounce.timeout.connect(self.check)
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(poll_interval)
+        self.poll_timer.timeout.connect(self.check)
+        self.watch()
+
+    def watch(self) -> None:
+        """(Re)register the paths of the loaded files."""
+        paths = [str(ini.path) for ini in self.db.files if ini.path.exists()]
+        dirs = sorted({str(ini.path.parent) for ini in self.db.files if ini.path.parent.exists()})
+        wanted = [p for p in paths + dirs if p not in self.watcher.files() + self.watcher.directories()]
+        failed = self.watcher.addPaths(wanted) if wanted else []
+        if self.force_polling or failed:
+            self.poll_timer.start()
+        else:
+            self.poll_timer.stop()
+
+    def _schedule(self, *_args) -> None:
+        self._debounce.start()
+
+    def check(self) -> List[str]:
+        """Stat every loaded file and emit :attr:`changed` if any was edited."""
+        names = [ini.path.name for ini in self.db.changed_files()]
+        if names:
+            self.changed.emit(names)
+        self.watch()
+        return names
@@ -1,60 +1,281 @@
-"""UI pane for resolving duplicate config entries."""
+"""UI pane for resolving duplicate config entries.
+
+Duplicates are shown through :class:`DuplicateModel`, which keeps only the
+list of duplicate keys and the actions the user changed.  Top-level rows
+are handed to the view in batches through ``fetchMore`` and the files of a
+key are listed when it is expanded, so opening the pane costs the same for
+ten duplicates or ten thousand.  The action column is edited through
+:class:`ActionDelegate` rather than a live combo box per row.
+"""
 
 from __future__ import annotations
 
 import logging
-from typing import Dict, Tuple, List
+from typing import Any, Dict, List, Tuple
 
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt
 from PySide6.QtWidgets import (
-    QWidget,
-    QVBoxLayout,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QAbstractItemView,
     QComboBox,
+    QHBoxLayout,
+    QLineEdit,
     QPushButton,
+    QStyledItemDelegate,
+    QTreeView,
+    QVBoxLayout,
+    QWidget,
 )
 
 from ..config_db import ConfigDB, IniFile
 
+ACTIONS = ("Comment", "Delete", "Ignore")
+DEFAULT_ACTION = "Comment"
+ACTION_COLUMN = 2
+
+Key = Tuple[str, str]
+
+
+class DuplicateModel(QAbstractItemModel):
+    """Duplicate keys with their action; children are the files setting them.
+
+    Top-level indexes carry internal id ``0``; a child of top-level row ``r``
+    carries ``r + 1``.
+    """
+
+    COLUMNS = ("Section", "Key", "Action")
+    BATCH = 256
+
+    def __init__(self, db: ConfigDB, parent=None) -> None:
+        super().__init__(parent)
+        self.db = db
+        self._dups: Dict[Key, List[IniFile]] = {}
+        self._keys: List[Key] = []
+        self._visible: List[Key] = []
+        self._loaded = 0
+        self._text = ""
+        #: Actions changed from :data:`DEFAULT_ACTION`.
+        self._actions: Dict[Key, str] = {}
+        self._files: Dict[Key, List[IniFile]] = {}
+
+    def set_duplicates(self, dups: Dict[Key, List[IniFile]]) -> None:
+        self.beginResetModel()
+        self._dups = dups
+        self._keys = list(dups)
+        self._actions = {k: a for k, a in self._actions.items() if k in dups}
+        self._files = {}
+        self._filter()
+        self.endResetModel()
+
+    def set_filter(self, text: str) -> None:
+        """Show only keys whose section or name contains ``text``."""
+        self.beginResetModel()
+        self._text = text.lower()
+        self._filter()
+        self.endResetModel()
+
+    def _filter(self) -> None:
+        text = self._text
+        if text:
+            self._visible = [k for k in self._keys if text in k[1].lower() or text in k[0].lower()]
+        else:
+            self._visible = self._keys
+        self._loaded = min(self.BATCH, len(self._visible))
+
+    def visible_count(self) -> int:
+        return len(self._visible)
+
+    def action(self, key: Key) -> str:
+        return self._actions.get(key, DEFAULT_ACTION)
+
+    def set_action(self, key: Key, action: str) -> None:
+        if action == DEFAULT_ACTION:
+            self._actions.pop(key, None)
+        else:
+            self._actions[key] = action
+
+    def set_all(self, action: str) -> None:
+        """Set the action of every key matching the filter."""
+        for key in self._visible:
+            self.set_action(key, action)
+        if self._loaded:
+            self.dataChanged.emit(
+                self.index(0, ACTION_COLUMN), self.index(self._loaded - 1, ACTION_COLUMN)
+            )
+        # File rows show the action of their key too.
+        for row in range(self._loaded):
+            parent = self.index(row, 0)
+            count = self.rowCount(parent)
+            if count:
+                self.dataChanged.emit(
+                    self.index(0, ACTION_COLUMN, parent), self.index(count - 1, ACTION_COLUMN, parent)
+                )
+
+    def resolutions(self) -> Dict[Key, str]:
+        """Return ``{(section, option): "comment" | "delete" | "ignore"}`` for all keys."""
+        return {key: self.action(key).lower() for key in self._keys}
+
+    def _sorted_files(self, key: Key) -> List[IniFile]:
+        files = self._files.get(key)
+        if files is None:
+            files = sorted(self._dups[key], key=lambda f: self.db._priority_of(f.path.name))
+            self._files[key] = files
+        return files
+
+    # ------------------------------------------------------------------
+    # QAbstractItemModel
+    # ------------------------------------------------------------------
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not parent.isValid():
+            if 0 <= row < self._loaded:
+                return self.createIndex(row, column, 0)
+            return QModelIndex()
+        if parent.internalId() == 0 and 0 <= row < len(self._dups[self._visible[parent.row()]]):
+            return self.createIndex(row, column, parent.row() + 1)
+        return QModelIndex()
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:  # type: ignore[override]
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return self._loaded
+        if parent.internalId() == 0 and parent.column() == 0:
+            return len(self._dups[self._visible[parent.row()]])
+        return 0
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self.COLUMNS)
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if not parent.isValid():
+            return bool(self._visible)
+        return parent.internalId() == 0 and parent.column() == 0
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        return not parent.isValid() and self._loaded < len(self._visible)
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        if parent.isValid():
+            return
+        count = min(self.BATCH, len(self._visible) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.internalId() == 0 and index.column() == ACTION_COLUMN:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole, Qt.ToolTipRole):
+            return None
+        if index.internalId() == 0:
+            key = self._visible[index.row()]
+            if index.column() == ACTION_COLUMN:
+                return self.action(key)
+            if role == Qt.ToolTipRole:
+                return f"[{key[0]}] {key[1]}: set in {len(self._dups[key])} files"
+            return key[index.column()]
+        key = self._visible[index.internalId() - 1]
+        files = self._sorted_files(key)
+        ini = files[index.row()]
+        if index.column() == 0:
+            return ini.path.name
+        if index.column() == 1:
+            try:
+                return ini.updater[key[0]][key[1]].value
+            except KeyError:
+                return ""
+        # The highest priority file keeps its entry.
+        return "Keep" if index.row() == len(files) - 1 else self.action(key)
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
+        if role != Qt.EditRole or not (self.flags(index) & Qt.ItemIsEditable) or value not in ACTIONS:
+            return False
+        self.set_action(self._visible[index.row()], value)
+        self.dataChanged.emit(index, index)
+        # The files below show the action too.
+        parent = index.sibling(index.row(), 0)
+        count = self.rowCount(parent)
+        self.dataChanged.emit(self.index(0, ACTION_COLUMN, parent), self.index(count - 1, ACTION_COLUMN, parent))
+        return True
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+
+
+class ActionDelegate(QStyledItemDelegate):
+    """Edit the action column with a combo box created only while editing."""
+
+    def createEditor(self, parent, option, index):  # type: ignore[override]
+        combo = QComboBox(parent)
+        combo.addItems(ACTIONS)
+        # Commit as soon as a choice is made.
+        combo.activated.connect(lambda _i, c=combo: self.commitData.emit(c))
+        return combo
+
+    def setEditorData(self, editor, index) -> None:  # type: ignore[override]
+        editor.setCurrentText(index.data(Qt.EditRole))
+
+    def setModelData(self, editor, model, index) -> None:  # type: ignore[override]
+        model.setData(index, editor.currentText(), Qt.EditRole)
+
 
 class ConflictPane(QWidget):
     def __init__(self, db: ConfigDB) -> None:
         super().__init__()
         self.db = db
         self.setWindowTitle("Resolve Duplicates")
-        self.tree = QTreeWidget()
-        self.tree.setHeaderLabels(["Section", "Key", "Action"])
+        self.filter_box = QLineEdit()
+        self.filter_box.setPlaceholderText("Filter by section or key")
+        self.model = DuplicateModel(db, self)
+        self.tree = QTreeView()
+        self.tree.setModel(self.model)
+        self.tree.setUniformRowHeights(True)
+        self.tree.setItemDelegateForColumn(ACTION_COLUMN, ActionDelegate(self.tree))
+        self.tree.setEditTriggers(
+            QAbstractItemView.CurrentChanged | QAbstractItemView.SelectedClicked | QAbstractItemView.DoubleClicked
+        )
+        self.comment_all_btn = QPushButton("Set All to Comment")
+        self.delete_all_btn = QPushButton("Set All to Delete")
+        self.ignore_all_btn = QPushButton("Set All to Ignore")
         self.apply_btn = QPushButton("Apply")
-        self.actions: Dict[Tuple[str, str], QComboBox] = {}
+        bulk = QHBoxLayout()
+        for btn in (self.comment_all_btn, self.delete_all_btn, self.ignore_all_btn):
+            bulk.addWidget(btn)
         layout = QVBoxLayout(self)
+        layout.addWidget(self.filter_box)
         layout.addWidget(self.tree)
+        layout.addLayout(bulk)
         layout.addWidget(self.apply_btn)
         self.populate()
 
+        self.filter_box.textChanged.connect(self.model.set_filter)
+        self.comment_all_btn.clicked.connect(lambda: self.model.set_all("Comment"))
+        self.delete_all_btn.clicked.connect(lambda: self.model.set_all("Delete"))
+        self.ignore_all_btn.clicked.connect(lambda: self.model.set_all("Ignore"))
         self.apply_btn.clicked.connect(self.apply)
 
     def populate(self) -> None:
         try:
-            self.tree.clear()
-            dups = self.db.find_duplicates()
-            for (section, option), files in dups.items():
-                parent = QTreeWidgetItem([section, option])
-                self.tree.addTopLevelItem(parent)
-                combo = QComboBox()
-                combo.addItems(["Comment", "Delete", "Ignore"])
-                self.tree.setItemWidget(parent, 2, combo)
-                self.actions[(section, option)] = combo
-                for ini in files:
-                    QTreeWidgetItem(parent, ["", "", ini.path.name])
-            self.tree.expandAll()
+            self.model.set_duplicates(self.db.find_duplicates())
         except Exception:
             logging.exception("Failed to populate duplicates pane")
 
     def apply(self) -> None:
         try:
-            for (section, option), combo in self.actions.items():
-                action = combo.currentText().lower()
-                self.db.resolve_duplicate(section, option, action)
+            self.db.resolve_duplicates(self.model.resolutions())
             if self.db.config_dir:
                 self.db.save(self.db.config_dir)
             self.populate()
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, cast
+from typing import Callable, Dict, List, cast
 import re
 
 from PySide6.QtCore import QRegularExpression
@@ -16,10 +16,13 @@ from PySide6.QtWidgets import (
     QPushButton,
     QSpinBox,
     QDoubleSpinBox,
+    QMessageBox,
 )
 
 from ..config_db import ConfigDB
-from .utils import infer_cvar_type
+from ..index_daemon import IndexClient
+from ..cvar_types import cvar_metadata
+from .completion import attach_completer
 
 
 class DetailsPane(QWidget):
@@ -27,19 +30,40 @@ class DetailsPane(QWidget):
         super().__init__()
         self.db = db
         self.setWindowTitle("CVar Details")
+        self.name_edit = QLineEdit()
+        self.name_edit.setPlaceholderText("CVar name")
         self.text = QTextBrowser()
         self.value_edit: QWidget = QLineEdit()
         self.target_box = QComboBox()
         self.add_btn = QPushButton("Add to Config")
         self.add_btn.setEnabled(False)
         self._layout = QVBoxLayout(self)
+        self._layout.addWidget(self.name_edit)
         self._layout.addWidget(self.text)
         self._layout.addWidget(self.value_edit)
         self._layout.addWidget(self.target_box)
         self._layout.addWidget(self.add_btn)
 
         self.current_item: Dict[str, str] | None = None
+        self._index_provider: Callable[[], IndexClient] | None = None
         self.add_btn.clicked.connect(self._add)
+        self.name_edit.editingFinished.connect(self._name_entered)
+
+    def set_index_provider(self, provider: Callable[[], IndexClient]) -> None:
+        """Enable name autocompletion using the index returned by ``provider``."""
+        self._index_provider = provider
+        completer = attach_completer(self.name_edit, lambda text: provider().complete(text))
+        completer.activated.connect(lambda _text: self._name_entered())
+
+    def _name_entered(self) -> None:
+        if not self._index_provider:
+            return
+        name = self.name_edit.text().strip()
+        if self.current_item and name == self.current_item.get("name"):
+            return
+        record = self._index_provider().lookup(name)
+        if record:
+            self.show_details(record)
 
     def set_db(self, db: ConfigDB) -> None:
         self.db = db
@@ -54,6 +78,7 @@ class DetailsPane(QWidget):
 
     def show_details(self, info: Dict[str, str]) -> None:
         self.current_item = info
+        self.name_edit.setText(info.get("name", ""))
         desc = info.get("description", "")
         file = info.get("file", "")
         rng = info.get("range", "")
@@ -64,8 +89,8 @@ class DetailsPane(QWidget):
         if default:
             content += f"<br>Default: {default}"
         self.text.setHtml(content)
-        dtype, min_val, max_val, options = infer_cvar_type(rng, default)
-        self._setup_value_edit(dtype, min_val, max_val, options, default)
+        meta = cvar_metadata(info)
+        self._setup_value_edit(meta["dtype"], meta["min"], meta["max"], meta["options"], default)
         self._populate_targets()
         self._update_add_enabled()
 
@@ -129,7 +154,22 @@ class DetailsPane(QWidget):
     def _add(self) -> None:
         if not self.db or not self.current_item:
             return
+        name = self.name_edit.text().strip() or self.current_item.get("name", "")
+        if name.lower() != self.current_item.get("name", "").lower():
+            # The value editor belongs to the shown CVar; switch to the typed
+            # one first so its value is entered with the right editor.
+            index = self._index_provider() if self._index_provider else None
+            record = index.lookup(name) if index else None
+            if record is None:
+                hint = ", ".join(index.suggest(name)) if index else ""
+                QMessageBox.warning(
+                    self,
+                    "Unknown CVar",
+                    f"{name} is not a known CVar." + (f"\n\nDid you mean: {hint}" if hint else ""),
+                )
+                return
+            self.show_details(record)
+            return
         target = self.target_box.currentText()
         value = self._current_value()
-        name = self.current_item.get("name", "")
-        self.db.insert_setting("ConsoleVariables", name, value, target)
+        self.db.insert_setting("ConsoleVariables", self.current_item["name"], value, target)
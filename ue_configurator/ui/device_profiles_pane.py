@@ -0,0 +1,81 @@
+"""UI pane comparing effective CVars across device profiles."""
+
+from __future__ import annotations
+
+from typing import Set
+
+from PySide6.QtCore import Qt, QSortFilterProxyModel
+from PySide6.QtGui import QFont, QStandardItem, QStandardItemModel
+from PySide6.QtWidgets import QHeaderView, QLineEdit, QTableView, QVBoxLayout, QWidget
+
+from ..config_db import ConfigDB
+from ..device_profiles import DeviceProfileResolver, layers_from_db
+
+
+class DeviceProfilesPane(QWidget):
+    """Matrix of CVars (rows) by device profile (columns).
+
+    Values a profile sets itself are shown in bold; inherited values are
+    greyed out with the defining profile in the tooltip.
+    """
+
+    def __init__(self, db: ConfigDB) -> None:
+        super().__init__()
+        self.db = db
+        self.setWindowTitle("Device Profiles")
+        self.resolver = DeviceProfileResolver.from_db(db)
+
+        self.filter_box = QLineEdit()
+        self.filter_box.setPlaceholderText("Filter CVars")
+        self.model = QStandardItemModel(self)
+        self.proxy_model = QSortFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.model)
+        self.proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.proxy_model.setFilterKeyColumn(0)
+        self.table = QTableView()
+        self.table.setModel(self.proxy_model)
+        self.table.setSortingEnabled(True)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.filter_box)
+        layout.addWidget(self.table)
+
+        self.filter_box.textChanged.connect(self.proxy_model.setFilterFixedString)
+        db.add_listener(self._db_changed)
+        self.populate()
+
+    def populate(self) -> None:
+        names = self.resolver.names()
+        matrix = self.resolver.matrix(names)
+        self.model.clear()
+        self.model.setHorizontalHeaderLabels(["CVar"] + names)
+        bold = QFont()
+        bold.setBold(True)
+        for cvar, row in matrix.items():
+            items = [QStandardItem(cvar)]
+            for profile in names:
+                value, source = row.get(profile, ("", ""))
+                item = QStandardItem(value)
+                if source == profile:
+                    item.setFont(bold)
+                elif source:
+                    item.setForeground(Qt.gray)
+                    item.setToolTip(f"Inherited from {source}")
+                items.append(item)
+            self.model.appendRow(items)
+        for col, profile in enumerate(names, start=1):
+            chain = " → ".join(self.resolver.chain(profile))
+            self.model.horizontalHeaderItem(col).setToolTip(chain)
+
+    def _db_changed(self, names: Set[str] | None) -> None:
+        if names is not None and not any(
+            n.lstrip("+-.!") in ("cvars", "baseprofilename") for n in names
+        ):
+            return
+        if self.resolver.reload(layers_from_db(self.db)):
+            self.populate()
+
+    def closeEvent(self, event) -> None:  # type: ignore[override]
+        self.db.remove_listener(self._db_changed)
+        super().closeEvent(event)
@@ -1,8 +1,18 @@
-"""UI pane for toggling active ini files."""
+"""UI pane for toggling active ini files.
+
+Each file is listed with its entry count, size, modification time and how
+many of its keys are duplicated in or shadowed by other enabled files.  The
+files are scanned on a worker thread and their statistics appear as each
+scan finishes; enabling or disabling a file updates the counts from the
+:class:`~ue_configurator.file_stats.FileStatsIndex` without rescanning.
+"""
 
 from __future__ import annotations
 
-from typing import Callable
+import configparser
+import logging
+from datetime import datetime
+from typing import Callable, Dict, List, Set, Tuple
 from pathlib import Path
 
 from PySide6.QtWidgets import (
@@ -11,11 +21,78 @@ from PySide6.QtWidgets import (
     QListWidget,
     QListWidgetItem,
     QMenu,
+    QStyledItemDelegate,
 )
 from PySide6.QtGui import QDesktopServices
-from PySide6.QtCore import Qt, QPoint, QUrl
+from PySide6.QtCore import QObject, QThread, QTimer, Qt, QPoint, QUrl, Signal
 
 from ..config_db import ConfigDB
+from ..file_stats import FileStats, FileStatsIndex, scan_snapshot
+
+#: Item data role holding the statistics line shown below the file name.
+STATS_ROLE = Qt.UserRole + 1
+
+
+def _size(size: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if size < 1024 or unit == "MB":
+            return f"{size} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return ""  # pragma: no cover - loop always returns
+
+
+def describe(stats: FileStats) -> str:
+    """Return the statistics line shown for a file."""
+    if not stats.scanned:
+        return "Scanning…"
+    parts = [f"{stats.entries} entries", _size(stats.size)]
+    if stats.mtime is not None:
+        parts.append("modified " + datetime.fromtimestamp(stats.mtime).strftime("%Y-%m-%d %H:%M"))
+    if stats.enabled:
+        parts.append(f"{stats.duplicates} duplicates")
+        parts.append(f"{stats.shadowed} shadowed")
+    else:
+        parts.append("disabled")
+    return " · ".join(parts)
+
+
+class FileStatsWorker(QObject):
+    """Worker object scanning files in a separate thread.
+
+    ``files`` are ``(path, text)`` snapshots taken on the GUI thread, so
+    edits made while scanning do not race with the worker.  ``scanned`` is
+    emitted once per file with the scan generation so the pane can drop
+    results of a scan it restarted.
+    """
+
+    scanned = Signal(int, object)
+    finished = Signal()
+
+    def __init__(self, files: List[Tuple[Path, str]], generation: int) -> None:
+        super().__init__()
+        self.files = files
+        self.generation = generation
+        self.cancelled = False
+
+    def run(self) -> None:
+        for path, text in self.files:
+            if self.cancelled:
+                break
+            try:
+                self.scanned.emit(self.generation, scan_snapshot(path, text))
+            except configparser.Error:  # pragma: no cover - snapshots of loaded files parse
+                logging.exception("Failed to scan %s", path)
+        self.finished.emit()
+
+
+class _StatsDelegate(QStyledItemDelegate):
+    """Show the statistics line below the file name."""
+
+    def initStyleOption(self, option, index) -> None:  # type: ignore[override]
+        super().initStyleOption(option, index)
+        stats = index.data(STATS_ROLE)
+        if stats:
+            option.text = f"{option.text}\n{stats}"
 
 
 class FilesPane(QWidget):
@@ -25,16 +102,33 @@ class FilesPane(QWidget):
         self.on_change = on_change
         self.setWindowTitle("Config Files")
         self.list = QListWidget()
+        self.list.setItemDelegate(_StatsDelegate(self.list))
         self.list.itemChanged.connect(self._toggle)
         self.list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.list.customContextMenuRequested.connect(self._context_menu)
         layout = QVBoxLayout(self)
         layout.addWidget(self.list)
+
+        self.stats = FileStatsIndex([])
+        self._items: Dict[str, QListWidgetItem] = {}
+        self._generation = 0
+        self._thread: QThread | None = None
+        self._worker: FileStatsWorker | None = None
+        self._toggling = False
+        # Edits arrive per keystroke; rescan once they settle.
+        self._rescan_timer = QTimer(self)
+        self._rescan_timer.setSingleShot(True)
+        self._rescan_timer.setInterval(300)
+        self._rescan_timer.timeout.connect(self._rescan)
+        db.add_listener(self._db_changed)
         self.populate()
 
     def populate(self) -> None:
+        files = self.db.list_files()
+        self.stats = FileStatsIndex(files)
+        self._items = {}
         self.list.clear()
-        for name, enabled in self.db.list_files():
+        for name, enabled in files:
             item = QListWidgetItem(name)
             item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
             item.setCheckState(Qt.Checked if enabled else Qt.Unchecked)
@@ -43,13 +137,93 @@ class FilesPane(QWidget):
             else:
                 path = Path(name)
             item.setData(Qt.UserRole, path)
+            item.setData(STATS_ROLE, describe(self.stats[name]))
             item.setToolTip(str(path))
             self.list.addItem(item)
+            self._items[name] = item
+        self.scan()
+
+    # ------------------------------------------------------------------
+    # Background statistics
+    # ------------------------------------------------------------------
+
+    def scan(self) -> None:
+        """Scan every file in a background thread, restarting a running scan."""
+        self.stop_scan()
+        self._generation += 1
+        thread = QThread(self)
+        files = [(ini.path, ini.snapshot()) for ini in self.db.files]
+        worker = FileStatsWorker(files, self._generation)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.scanned.connect(self._scanned)
+        # Quit from the worker thread so the scan ends without waiting for
+        # the GUI event loop.
+        worker.finished.connect(thread.quit, Qt.DirectConnection)
+        thread.finished.connect(worker.deleteLater)
+        self._thread = thread
+        self._worker = worker
+        thread.start()
+
+    def stop_scan(self) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        assert self._worker is not None
+        self._worker.cancelled = True
+        self._thread = self._worker = None
+        thread.quit()
+        thread.wait()
+        thread.deleteLater()
+
+    def _scanned(self, generation: int, scan) -> None:
+        if generation != self._generation or scan.name not in self._items:
+            return
+        self._refresh(self.stats.add(scan))
+
+    def _refresh(self, names: Set[str]) -> None:
+        for name in names:
+            item = self._items.get(name)
+            if item is not None:
+                item.setData(STATS_ROLE, describe(self.stats[name]))
+
+    def _db_changed(self, _names: Set[str] | None) -> None:
+        if not self._toggling:
+            self._rescan_timer.start()
+
+    def _rescan(self) -> None:
+        files = self.db.list_files()
+        if [name for name, _enabled in files] != self.stats.names:
+            self.populate()
+            return
+        for name, enabled in files:
+            # Update the index first so ``_toggle`` ignores the check change.
+            self._refresh(self.stats.set_enabled(name, enabled))
+            self._items[name].setCheckState(Qt.Checked if enabled else Qt.Unchecked)
+        self.scan()
+
+    def closeEvent(self, event) -> None:  # type: ignore[override]
+        self.db.remove_listener(self._db_changed)
+        self._rescan_timer.stop()
+        self.stop_scan()
+        super().closeEvent(event)
+
+    # ------------------------------------------------------------------
+    # Actions
+    # ------------------------------------------------------------------
 
     def _toggle(self, item: QListWidgetItem) -> None:
         name = item.text()
         enabled = item.checkState() == Qt.Checked
-        self.db.set_file_enabled(name, enabled)
+        # Statistics updates change the item too.
+        if name not in self._items or self.stats[name].enabled == enabled:
+            return
+        self._toggling = True
+        try:
+            self.db.set_file_enabled(name, enabled)
+        finally:
+            self._toggling = False
+        self._refresh(self.stats.set_enabled(name, enabled))
         if self.on_change:
             self.on_change()
 
@@ -5,14 +5,22 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
-from PySide6.QtWidgets import QSplitter, QMainWindow, QMessageBox
+from PySide6.QtWidgets import QSplitter, QMainWindow, QMessageBox, QFileDialog
 from PySide6.QtGui import QAction, QDesktopServices, QKeySequence
 from PySide6.QtCore import QUrl
 
 from ..config_db import ConfigDB
+from ..index_daemon import IndexClient
+from ..validation import add_suggestions, validate_cvars
+from ..bulk_import import bulk_import
+from ..journal import read_events
 from .conflict_pane import ConflictPane
 from .preset_pane import PresetPane
 from .files_pane import FilesPane
+from .device_profiles_pane import DeviceProfilesPane
+from .scalability_pane import ScalabilityPane
+from .config_watcher import ConfigWatcher
+from ..indexer import detect_engine_from_uproject
 from ..settings import load_settings, save_settings
 
 from .search_pane import SearchPane
@@ -28,12 +36,17 @@ class MainWindow(QMainWindow):
         self.conflict_pane: ConflictPane | None = None
         self.preset_pane: PresetPane | None = None
         self.files_pane: FilesPane | None = None
+        self.device_profiles_pane: DeviceProfilesPane | None = None
+        self.scalability_pane: ScalabilityPane | None = None
         config_dir = project_dir / "Config"
         if config_dir.exists():
             self.db.load(config_dir)
+            self._attach_journal()
 
         self.search = SearchPane(cache_file, project_dir, use_local_engine=use_local_engine)
+        self.search.set_db(self.db)
         self.details = DetailsPane(self.db)
+        self.details.set_index_provider(self.cvar_index)
 
         # QTableView does not provide an ``itemSelectionChanged`` signal like
         # QTableWidget.  Use the selection model's ``selectionChanged`` signal
@@ -62,6 +75,31 @@ class MainWindow(QMainWindow):
         files_action.setToolTip("Browse config files (Ctrl+F)")
         files_action.triggered.connect(self.show_files)
 
+        profiles_action = QAction("Device Profiles", self)
+        profiles_action.setShortcut(QKeySequence("Ctrl+Shift+D"))
+        profiles_action.setToolTip("Compare CVars across device profiles (Ctrl+Shift+D)")
+        profiles_action.triggered.connect(self.show_device_profiles)
+
+        scalability_action = QAction("Scalability", self)
+        scalability_action.setShortcut(QKeySequence("Ctrl+Shift+G"))
+        scalability_action.setToolTip("Show CVars set by scalability groups (Ctrl+Shift+G)")
+        scalability_action.triggered.connect(self.show_scalability)
+
+        bulk_action = QAction("Bulk Import", self)
+        bulk_action.setShortcut(QKeySequence("Ctrl+I"))
+        bulk_action.setToolTip("Apply settings from a CSV or JSON file (Ctrl+I)")
+        bulk_action.triggered.connect(self.bulk_import)
+
+        undo_action = QAction("Undo", self)
+        undo_action.setShortcut(QKeySequence("Ctrl+Z"))
+        undo_action.setToolTip("Undo the last edit (Ctrl+Z)")
+        undo_action.triggered.connect(self.undo)
+
+        redo_action = QAction("Redo", self)
+        redo_action.setShortcut(QKeySequence("Ctrl+Y"))
+        redo_action.setToolTip("Redo the last undone edit (Ctrl+Y)")
+        redo_action.triggered.connect(self.redo)
+
         save_action = QAction("Save", self)
         save_action.setShortcut(QKeySequence("Ctrl+S"))
         save_action.setToolTip("Validate and save configuration (Ctrl+S)")
@@ -69,12 +107,85 @@ class MainWindow(QMainWindow):
         self.menuBar().addAction(conflict_action)
         self.menuBar().addAction(preset_action)
         self.menuBar().addAction(files_action)
+        self.menuBar().addAction(profiles_action)
+        self.menuBar().addAction(scalability_action)
+        self.menuBar().addAction(bulk_action)
+        self.menuBar().addAction(undo_action)
+        self.menuBar().addAction(redo_action)
         self.menuBar().addAction(save_action)
 
+        self.watcher = ConfigWatcher(self.db, self)
+        self.watcher.changed.connect(self.reload_external)
+
         settings = load_settings()
         if geo := settings.get("main_geometry"):
             self.restoreGeometry(bytes.fromhex(geo))
 
+    def journal_file(self) -> Path:
+        return self.project_dir / "Saved" / "UEConfigAssistant" / "journal.jsonl"
+
+    def _attach_journal(self) -> None:
+        """Offer to replay unsaved edits of a previous session, then persist new ones."""
+        path = self.journal_file()
+        if read_events(path):
+            answer = QMessageBox.question(
+                self,
+                "Recover Edits",
+                "The previous session ended with unsaved edits.\n\nReplay them?",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.Yes,
+            )
+            if answer == QMessageBox.Yes:
+                try:
+                    self.db.replay(path)
+                except (KeyError, TypeError, ValueError):
+                    logging.exception("Failed to replay undo journal")
+                    QMessageBox.warning(self, "Recover Edits", "Some edits could not be replayed.")
+        self.db.journal.attach(path)
+
+    def reload_external(self, *_args) -> bool:
+        """Merge files edited outside the app; return ``False`` on conflicts."""
+        report = self.db.reload_changed()
+        if not report:
+            return True
+        if report.reloaded:
+            message = f"Reloaded {', '.join(report.reloaded)}"
+            if report.undo_dropped:
+                message += f"; cleared {report.undo_dropped} undo step(s) for these files"
+            self.statusBar().showMessage(message, 5000)
+        problems = [f"{name}: deleted on disk, in-memory copy kept" for name in report.missing]
+        problems += [
+            f"{c.file} [{c.section}] {c.key}: disk has {', '.join(c.theirs) or '(removed)'}, "
+            f"keeping {', '.join(c.mine) or '(removed)'}"
+            for c in report.conflicts
+        ]
+        if problems:
+            QMessageBox.warning(
+                self,
+                "External Changes",
+                "Config files were changed outside the app. Your unsaved edits were kept:\n\n"
+                + "\n".join(problems[:20]),
+            )
+        return not report.conflicts
+
+    def undo(self) -> None:
+        try:
+            entry = self.db.undo()
+        except ValueError as exc:
+            QMessageBox.warning(self, "Undo Failed", str(exc))
+            return
+        if entry is not None:
+            self.statusBar().showMessage(f"Undid: {entry.label or 'edit'}", 3000)
+
+    def redo(self) -> None:
+        try:
+            entry = self.db.redo()
+        except ValueError as exc:
+            QMessageBox.warning(self, "Redo Failed", str(exc))
+            return
+        if entry is not None:
+            self.statusBar().showMessage(f"Redid: {entry.label or 'edit'}", 3000)
+
     def show_details(self, *_args) -> None:
         """Show details for the currently selected row.
 
@@ -84,10 +195,13 @@ class MainWindow(QMainWindow):
         rows = self.search.table.selectionModel().selectedRows()
         if not rows:
             return
-        row = rows[0].row()
+        row = self.search.proxy_model.mapToSource(rows[0]).row()
         item = self.search.data[row]
         self.details.show_details(item)
 
+    def cvar_index(self) -> IndexClient:
+        return self.search.cvar_index()
+
     def show_conflicts(self) -> None:
         try:
             self.conflict_pane = ConflictPane(self.db)
@@ -96,10 +210,30 @@ class MainWindow(QMainWindow):
             logging.exception("Failed to open conflict pane")
 
     def save_config(self) -> None:
+        if not self.reload_external():
+            # Let the user review the conflicting keys before overwriting.
+            return
         ok, msg = self.db.validate()
         if not ok:
             QMessageBox.warning(self, "Validation Error", msg or "Invalid config")
             return
+        diagnostics = validate_cvars(self.db, self.cvar_index())
+        if diagnostics:
+            add_suggestions(diagnostics[:20], self.cvar_index())
+            lines = [f"{d.file}:{d.line}: {d.message}" for d in diagnostics[:20]]
+            if len(diagnostics) > 20:
+                lines.append(f"... and {len(diagnostics) - 20} more")
+            answer = QMessageBox.question(
+                self,
+                "CVar Issues",
+                f"{len(diagnostics)} console variable issue(s) found:\n\n"
+                + "\n".join(lines)
+                + "\n\nSave anyway?",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.No,
+            )
+            if answer != QMessageBox.Yes:
+                return
         config_dir = self.project_dir / "Config"
         backup_dir = self.db.save(config_dir)
         box = QMessageBox(self)
@@ -113,8 +247,24 @@ class MainWindow(QMainWindow):
         if box.clickedButton() == open_btn:
             QDesktopServices.openUrl(QUrl.fromLocalFile(str(backup_dir)))
 
+    def bulk_import(self) -> None:
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Bulk import", str(self.project_dir), "Settings (*.csv *.json)"
+        )
+        if not path:
+            return
+        try:
+            applied = bulk_import(self.db, Path(path))
+        except (OSError, ValueError) as exc:
+            QMessageBox.warning(self, "Bulk Import Failed", f"{exc}\n\nNo changes were made.")
+            return
+        QMessageBox.information(
+            self, "Bulk Import", f"Applied {len(applied)} change(s). Save to write them to disk."
+        )
+
     def closeEvent(self, event) -> None:  # type: ignore[override]
         save_settings({"main_geometry": self.saveGeometry().data().hex()})
+        self.search.stop_header_watch()
         super().closeEvent(event)
 
     def show_presets(self) -> None:
@@ -131,3 +281,22 @@ class MainWindow(QMainWindow):
             self.files_pane.show()
         except Exception:
             logging.exception("Failed to open files pane")
+
+    def show_device_profiles(self) -> None:
+        try:
+            self.device_profiles_pane = DeviceProfilesPane(self.db)
+            self.device_profiles_pane.show()
+        except Exception:
+            logging.exception("Failed to open device profiles pane")
+
+    def show_scalability(self) -> None:
+        try:
+            if self.scalability_pane is None:
+                self.scalability_pane = ScalabilityPane(
+                    self.db.config_dir, detect_engine_from_uproject(self.project_dir)
+                )
+            else:
+                self.scalability_pane.reload()
+            self.scalability_pane.show()
+        except Exception:
+            logging.exception("Failed to open scalability pane")
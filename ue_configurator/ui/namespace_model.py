@@ -0,0 +1,150 @@
+"""Lazy tree model over a :class:`~ue_configurator.namespace_tree.NamespaceTree`."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Sequence, Set
+
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt
+from PySide6.QtGui import QBrush, QColor
+
+from ..namespace_tree import NamespaceNode, NamespaceTree
+
+#: Item data role holding the dotted namespace path of a node.
+PATH_ROLE = Qt.UserRole
+
+
+class NamespaceTreeModel(QAbstractItemModel):
+    """Namespaces as rows, with the number of (matching) CVars below each.
+
+    Children are inserted through ``fetchMore`` when a node is expanded.
+    :meth:`set_text_filter` swaps the match bitmap; counts are computed per
+    visible row from it.
+    """
+
+    COLUMNS = ("Namespace", "CVars")
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.tree = NamespaceTree([])
+        self._text = ""
+        self.bits = self.tree.all
+        # Top-level namespaces are always listed.
+        self._fetched: Set[int] = {id(self.tree.root)}
+
+    def set_records(self, records: Sequence[Dict[str, str]]) -> None:
+        self.beginResetModel()
+        self.tree = NamespaceTree(records)
+        self.bits = self.tree.match(self._text)
+        self._fetched = {id(self.tree.root)}
+        self.endResetModel()
+
+    def set_text_filter(self, text: str) -> None:
+        self._text = text
+        self.bits = self.tree.match(text)
+        # Only rows already shown need repainting.
+        stack: List[NamespaceNode] = [self.tree.root]
+        while stack:
+            node = stack.pop()
+            if id(node) not in self._fetched or not node.children():
+                continue
+            parent = self._index(node)
+            last = len(node.children()) - 1
+            self.dataChanged.emit(self.index(0, 0, parent), self.index(last, 1, parent))
+            stack.extend(node.children())
+
+    def node(self, index: QModelIndex) -> NamespaceNode:
+        return index.internalPointer() if index.isValid() else self.tree.root
+
+    def _index(self, node: NamespaceNode) -> QModelIndex:
+        if node.parent is None:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def index_for_path(self, path: str) -> QModelIndex:
+        """Return the index of ``path``, fetching its ancestors as needed."""
+        node = self.tree.find(path)
+        if node is None:
+            return QModelIndex()
+        chain = []
+        while node.parent is not None:
+            chain.append(node)
+            node = node.parent
+        for ancestor in [self.tree.root, *reversed(chain[1:])]:
+            parent = self._index(ancestor)
+            if self.canFetchMore(parent):
+                self.fetchMore(parent)
+        return self._index(chain[0]) if chain else QModelIndex()
+
+    # ------------------------------------------------------------------
+    # QAbstractItemModel
+    # ------------------------------------------------------------------
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        node = self.node(parent)
+        if id(node) not in self._fetched or not 0 <= row < len(node.children()):
+            return QModelIndex()
+        return self.createIndex(row, column, node.children()[row])
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:  # type: ignore[override]
+        if not index.isValid():
+            return QModelIndex()
+        return self._index(self.node(index).parent)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        node = self.node(parent)
+        return len(node.children()) if id(node) in self._fetched else 0
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self.COLUMNS)
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        node = self.node(parent)
+        if node.loaded:
+            return bool(node.children())
+        if node.total != 1:
+            return node.total > 1
+        # A single CVar named like the namespace itself is a leaf.
+        return len(self.tree.keys[node.lo]) > node.depth
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        return id(self.node(parent)) not in self._fetched and self.hasChildren(parent)
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        node = self.node(parent)
+        if id(node) in self._fetched:
+            return
+        count = len(node.children())
+        if count:
+            self.beginInsertRows(parent, 0, count - 1)
+        self._fetched.add(id(node))
+        if count:
+            self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        node = self.node(index)
+        if role == Qt.DisplayRole:
+            if index.column() == 0:
+                return node.segment
+            if self._text:
+                return f"{node.count(self.bits)} / {node.total}"
+            return str(node.total)
+        if role == Qt.ToolTipRole:
+            if node.record is not None and node.record.get("description"):
+                return f"{node.path}\n{node.record['description']}"
+            return node.path
+        if role == Qt.ForegroundRole and self._text and not node.count(self.bits):
+            return QBrush(QColor(Qt.gray))
+        if role == Qt.TextAlignmentRole and index.column() == 1:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        if role == PATH_ROLE:
+            return node.path
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section]
+        return None
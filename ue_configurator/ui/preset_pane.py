@@ -9,8 +9,14 @@ import shutil
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
+    QHBoxLayout,
     QListWidget,
     QPushButton,
+    QLabel,
+    QTableWidget,
+    QTableWidgetItem,
+    QHeaderView,
+    QLineEdit,
     QFileDialog,
     QMessageBox,
     QInputDialog,
@@ -20,39 +26,108 @@ from PySide6.QtCore import Qt
 
 
 from ..config_db import ConfigDB
+from ..preset_catalog import PresetCatalog
+from ..preset_diff import CONFLICT, NOOP, PresetDiff, apply_diff, diff_preset
 
 
 class PresetPane(QWidget):
-    def __init__(self, presets_dir: Path, db: ConfigDB) -> None:
+    def __init__(self, presets_dir: Path, db: ConfigDB, catalog_cache: Path | None = None) -> None:
         super().__init__()
         self.presets_dir = presets_dir
         self.db = db
+        self.catalog = PresetCatalog(presets_dir, catalog_cache)
         self.setWindowTitle("Presets")
 
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("Search presets by key or value")
+        self.overlap_label = QLabel()
+        self.overlap_label.setWordWrap(True)
         self.list = QListWidget()
         self.list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.list.customContextMenuRequested.connect(self._show_context_menu)
         self.import_btn = QPushButton("Import")
         self.export_btn = QPushButton("Export Current")
+        self.preview_btn = QPushButton("Preview")
+        self.apply_btn = QPushButton("Apply Changes")
+        self.apply_btn.setEnabled(False)
+        self.show_noop_btn = QPushButton("Show Unchanged")
+        self.show_noop_btn.setCheckable(True)
+
+        self.summary = QLabel()
+        self.preview = QTableWidget(0, 5)
+        self.preview.setHorizontalHeaderLabels(["Change", "Section", "Key", "Current", "Preset"])
+        self.preview.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.preview.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.diff: PresetDiff | None = None
+        self.preview_path: Path | None = None
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.preview_btn)
+        buttons.addWidget(self.show_noop_btn)
+        buttons.addWidget(self.apply_btn)
 
         layout = QVBoxLayout(self)
+        layout.addWidget(self.search_box)
         layout.addWidget(self.list)
+        layout.addWidget(self.overlap_label)
         layout.addWidget(self.import_btn)
         layout.addWidget(self.export_btn)
+        layout.addLayout(buttons)
+        layout.addWidget(self.summary)
+        layout.addWidget(self.preview)
 
+        self.search_box.textChanged.connect(self.filter_presets)
+        self.list.currentTextChanged.connect(self._show_overlaps)
         self.import_btn.clicked.connect(self.import_preset)
         self.export_btn.clicked.connect(self.export_preset)
+        self.preview_btn.clicked.connect(self._preview_selected)
+        self.apply_btn.clicked.connect(self.apply_preview)
+        self.show_noop_btn.toggled.connect(lambda _checked: self._fill_preview())
+        self.list.itemDoubleClicked.connect(lambda item: self.preview_preset(self.presets_dir / item.text()))
         self.load_presets()
 
     def load_presets(self) -> None:
         try:
             self.list.clear()
             self.presets_dir.mkdir(parents=True, exist_ok=True)
-            for p in self.presets_dir.glob("*.ini"):
-                self.list.addItem(p.name)
+            self.catalog.refresh()
+            for name in self.catalog.names():
+                self.list.addItem(name)
+                item = self.list.item(self.list.count() - 1)
+                item.setToolTip(self.catalog.presets[name].summary())
+            self.filter_presets(self.search_box.text())
         except Exception:
             logging.exception("Failed to load presets")
 
+    def filter_presets(self, text: str) -> None:
+        """Show only presets with a ``key=value`` entry containing ``text``."""
+        text = text.strip()
+        matches: dict[str, list[str]] = {}
+        if text:
+            for name, found in self.catalog.search_by_preset(text).items():
+                matches[name] = [f"[{m.section}] {m.key}={m.value}" for m in found]
+        for row in range(self.list.count()):
+            item = self.list.item(row)
+            name = item.text()
+            info = self.catalog.presets.get(name)
+            summary = info.summary() if info else ""
+            if not text:
+                item.setHidden(False)
+                item.setToolTip(summary)
+                continue
+            found = matches.get(name)
+            item.setHidden(not found)
+            if found:
+                item.setToolTip("\n".join([summary] + found))
+
+    def _show_overlaps(self, name: str) -> None:
+        overlaps = self.catalog.overlaps_with(name) if name else []
+        if not overlaps:
+            self.overlap_label.clear()
+            return
+        parts = [f"{other}: {shared} shared, {conflicts} conflicting" for other, shared, conflicts in overlaps[:5]]
+        self.overlap_label.setText("Overlaps with " + "; ".join(parts))
+
     def import_preset(self) -> None:
         try:
             path, _ = QFileDialog.getOpenFileName(
@@ -61,14 +136,67 @@ class PresetPane(QWidget):
             if path:
                 dest = self.presets_dir / Path(path).name
                 shutil.copy2(path, dest)
-                self.db.merge_preset(dest)
-                QMessageBox.information(
-                    self, "Preset Imported", f"Imported {dest.name}"
-                )
                 self.load_presets()
+                # Nothing is merged until the previewed changes are applied.
+                self.preview_preset(dest)
         except Exception:
             logging.exception("Failed to import preset")
 
+    def _preview_selected(self) -> None:
+        item = self.list.currentItem()
+        if item:
+            self.preview_preset(self.presets_dir / item.text())
+
+    def preview_preset(self, path: Path) -> None:
+        """Show what merging ``path`` would change without touching the config."""
+        try:
+            self.diff = diff_preset(self.db, path)
+            self.preview_path = path
+        except Exception:
+            logging.exception("Failed to diff preset")
+            QMessageBox.warning(self, "Preview Failed", f"Could not read {path.name}")
+            return
+        self._fill_preview()
+
+    def _fill_preview(self) -> None:
+        self.preview.setRowCount(0)
+        if self.diff is None:
+            self.summary.clear()
+            self.apply_btn.setEnabled(False)
+            return
+        show_noop = self.show_noop_btn.isChecked()
+        for change in self.diff.changes:
+            if change.kind == NOOP and not show_noop:
+                continue
+            row = self.preview.rowCount()
+            self.preview.insertRow(row)
+            cells = [change.kind, change.section, change.key, change.current or "", change.value]
+            for col, text in enumerate(cells):
+                cell = QTableWidgetItem(text)
+                if change.kind == CONFLICT:
+                    cell.setForeground(Qt.red)
+                    cell.setToolTip("Set in: " + ", ".join(change.files))
+                self.preview.setItem(row, col, cell)
+        counts = self.diff.counts()
+        self.summary.setText(
+            f"{counts['add']} to add, {counts['change']} to change, "
+            f"{counts['conflict']} conflicting, {counts['noop']} unchanged"
+            + (f" → {self.diff.target}" if self.diff.target else "")
+        )
+        self.apply_btn.setEnabled(bool(self.diff.delta()))
+
+    def apply_preview(self) -> None:
+        """Write the previewed delta into the target file."""
+        if self.diff is None:
+            return
+        label = f"Merge preset {self.preview_path.name}" if self.preview_path else ""
+        applied = apply_diff(self.db, self.diff, label=label)
+        QMessageBox.information(
+            self, "Preset Applied", f"Applied {len(applied)} change(s) to {self.diff.target}"
+        )
+        self.diff = None
+        self._fill_preview()
+
     def export_preset(self) -> None:
         try:
             path, _ = QFileDialog.getSaveFileName(
@@ -0,0 +1,80 @@
+"""UI pane showing what each scalability group sets per quality level."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from PySide6.QtGui import QStandardItem, QStandardItemModel
+from PySide6.QtWidgets import (
+    QComboBox,
+    QHBoxLayout,
+    QHeaderView,
+    QPushButton,
+    QTableView,
+    QVBoxLayout,
+    QWidget,
+)
+
+from ..scalability import LEVELS, ScalabilityMatrix
+
+
+class ScalabilityPane(QWidget):
+    """Table of CVars (rows) by quality level (columns) for one ``sg.*`` group."""
+
+    def __init__(
+        self,
+        config_dir: Path | None,
+        engine_dir: Path | None = None,
+        platform: str | None = None,
+    ) -> None:
+        super().__init__()
+        self.setWindowTitle("Scalability Groups")
+        self.matrix = ScalabilityMatrix.for_project(config_dir, engine_dir, platform)
+
+        self.group_box = QComboBox()
+        self.reload_btn = QPushButton("Reload")
+        self.model = QStandardItemModel(0, len(LEVELS) + 1, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+
+        top = QHBoxLayout()
+        top.addWidget(self.group_box, 1)
+        top.addWidget(self.reload_btn)
+        layout = QVBoxLayout(self)
+        layout.addLayout(top)
+        layout.addWidget(self.table)
+
+        self.group_box.currentTextChanged.connect(self.show_group)
+        self.reload_btn.clicked.connect(self.reload)
+        self.group_box.addItems(self.matrix.groups())
+
+    def show_group(self, group: str) -> None:
+        self.model.setRowCount(0)
+        self.model.setHorizontalHeaderLabels(["CVar"] + [f"@{level}" for level in LEVELS])
+        if not group:
+            return
+        sources = {level: self.matrix.cvars(group, level) for level in LEVELS}
+        for cvar, values in self.matrix.table(group).items():
+            items = [QStandardItem(cvar)]
+            for level in LEVELS:
+                item = QStandardItem(values.get(level, ""))
+                found = sources[level].get(cvar.lower())
+                if found:
+                    item.setToolTip(found[2])
+                items.append(item)
+            self.model.appendRow(items)
+
+    def reload(self) -> None:
+        """Re-read changed scalability files and refresh the view if needed."""
+        dirty = self.matrix.refresh()
+        current = self.group_box.currentText()
+        if not dirty:
+            return
+        self.group_box.blockSignals(True)
+        self.group_box.clear()
+        self.group_box.addItems(self.matrix.groups())
+        if self.group_box.findText(current) != -1:
+            self.group_box.setCurrentText(current)
+        self.group_box.blockSignals(False)
+        self.show_group(self.group_box.currentText())
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, List, Dict, Set
 
 from PySide6.QtCore import (
     Qt,
@@ -12,6 +13,7 @@ from PySide6.QtCore import (
     QObject,
     Signal,
     QEventLoop,
+    QTimer,
 )
 from PySide6.QtGui import QStandardItemModel, QStandardItem
 from PySide6.QtWidgets import (
@@ -24,23 +26,41 @@ from PySide6.QtWidgets import (
     QProgressDialog,
     QMessageBox,
     QPushButton,
+    QCheckBox,
+    QSplitter,
+    QTreeView,
 )
 
+from ..config_db import ConfigDB
+from ..cvar_index import CVarIndex
+from ..index_daemon import IndexClient
 from ..indexer import (
     load_cache,
     build_cache,
     detect_engine_from_uproject,
     detect_version_from_uproject,
 )
+from ..header_watch import HeaderWatcher, IndexDelta
+from ..usage_scan import scan_project
+from .completion import attach_completer
+from .namespace_model import NamespaceTreeModel, PATH_ROLE
+
+#: Item data role on the name column marking CVars set in a loaded ini.
+SET_ROLE = Qt.UserRole + 1
+
+VALUE_COLUMN = 4
+SOURCE_COLUMN = 5
 
 
 class SearchFilterProxyModel(QSortFilterProxyModel):
-    """Proxy model handling text and category filtering."""
+    """Proxy model handling text, category and namespace filtering."""
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._text: str = ""
         self._category: str = "All"
+        self._only_set = False
+        self._namespace = ""
 
     def set_text_filter(self, text: str) -> None:
         self._text = text.lower()
@@ -50,12 +70,25 @@ class SearchFilterProxyModel(QSortFilterProxyModel):
         self._category = category
         self.invalidateFilter()
 
+    def set_only_set_filter(self, only_set: bool) -> None:
+        self._only_set = only_set
+        self.invalidateFilter()
+
+    def set_namespace_filter(self, namespace: str) -> None:
+        """Only accept CVars named ``namespace`` or inside it (``""`` for all)."""
+        self._namespace = namespace.lower()
+        self.invalidateFilter()
+
     def filterAcceptsRow(self, source_row: int, source_parent) -> bool:  # type: ignore[override]
         model = self.sourceModel()
         name_index = model.index(source_row, 0, source_parent)
         desc_index = model.index(source_row, 1, source_parent)
         name = (name_index.data() or "").lower()
         desc = (desc_index.data() or "").lower()
+        if self._only_set and not name_index.data(SET_ROLE):
+            return False
+        if self._namespace and name != self._namespace and not name.startswith(self._namespace + "."):
+            return False
         category = name_index.data(Qt.UserRole) or ""
         text_match = self._text in name or self._text in desc
         category_match = self._category == "All" or category == self._category
@@ -115,6 +148,69 @@ class BuildCacheWorker(QObject):
             self.finished.emit(False, str(exc))
 
 
+class UsageScanWorker(QObject):
+    """Worker object running ``scan_project`` in a separate thread."""
+
+    finished = Signal(object, str)
+
+    def __init__(self, project_dir: Path, names: List[str]) -> None:
+        super().__init__()
+        self.project_dir = project_dir
+        self.names = names
+
+    def run(self) -> None:
+        try:
+            self.finished.emit(scan_project(self.project_dir, self.names), "")
+        except Exception as exc:  # pragma: no cover - IO failures
+            self.finished.emit({}, str(exc))
+
+
+class HeaderWatchWorker(QObject):
+    """Worker object polling engine headers in a separate thread.
+
+    Each scan that changes the index updates the cache file and emits the
+    :class:`~ue_configurator.header_watch.IndexDelta`.  The cache file is
+    only read and written while holding ``lock``, which the pane also holds
+    when it reads the cache.
+    """
+
+    delta = Signal(object)
+
+    def __init__(
+        self, cache_file: Path, engine_root: Path, lock: threading.Lock, interval_ms: int = 2000
+    ) -> None:
+        super().__init__()
+        self.cache_file = cache_file
+        self.engine_root = engine_root
+        self.lock = lock
+        self.interval_ms = interval_ms
+        self.watcher: HeaderWatcher | None = None
+        self.timer: QTimer | None = None
+
+    def run(self) -> None:
+        with self.lock:
+            self.watcher = HeaderWatcher.from_cache(self.cache_file, self.engine_root)
+        # Created here so the timer lives in the worker thread.
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.poll)
+        self.timer.start(self.interval_ms)
+        self.poll()
+
+    def poll(self) -> None:
+        assert self.watcher is not None
+        try:
+            delta = self.watcher.scan()
+            if delta.files:
+                with self.lock:
+                    data = self.watcher.write(self.cache_file)
+                # Rows show the cached records, docs fields included.
+                delta = delta.resolve(data)
+        except OSError:  # pragma: no cover - engine tree on a flaky drive
+            return
+        if delta:
+            self.delta.emit(delta)
+
+
 class SearchPane(QWidget):
     def __init__(
         self,
@@ -143,8 +239,10 @@ class SearchPane(QWidget):
         self.category_box = QComboBox()
         self.category_box.addItem("All")
 
-        self.model = QStandardItemModel(0, 3, self)
-        self.model.setHorizontalHeaderLabels(["Name", "Description", "File"])
+        self.model = QStandardItemModel(0, 6, self)
+        self.model.setHorizontalHeaderLabels(
+            ["Name", "Description", "File", "Usage", "Value", "Source"]
+        )
 
         self.proxy_model = SearchFilterProxyModel(self)
         self.proxy_model.setSourceModel(self.model)
@@ -155,23 +253,113 @@ class SearchPane(QWidget):
         self.table.setSortingEnabled(True)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
+        # Namespace browser: selecting a node narrows the table to it.
+        self.ns_model = NamespaceTreeModel(self)
+        self.ns_tree = QTreeView()
+        self.ns_tree.setModel(self.ns_model)
+        self.ns_tree.setUniformRowHeights(True)
+        self.ns_tree.header().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.ns_tree.header().setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        self.ns_tree.header().setStretchLastSection(False)
+        self.splitter = QSplitter(Qt.Horizontal)
+        self.splitter.addWidget(self.ns_tree)
+        self.splitter.addWidget(self.table)
+        self.splitter.setStretchFactor(1, 3)
+
         layout = QVBoxLayout(self)
         layout.addWidget(self.search_box)
         layout.addWidget(self.category_box)
+        self.only_set_box = QCheckBox("Only show CVars set in project")
+        layout.addWidget(self.only_set_box)
         self.rebuild_btn = QPushButton("Rebuild Cache")
         layout.addWidget(self.rebuild_btn)
-        layout.addWidget(self.table)
+        self.usage_btn = QPushButton("Scan Project Usage")
+        self.usage_btn.setEnabled(project_dir is not None)
+        layout.addWidget(self.usage_btn)
+        self.watch_box = QCheckBox("Watch engine headers")
+        self.watch_box.setToolTip("Re-index changed engine headers while the app is open")
+        self.watch_box.setVisible(use_local_engine)
+        layout.addWidget(self.watch_box)
+        layout.addWidget(self.splitter)
 
         self.search_box.textChanged.connect(self.update_filter)
         self.category_box.currentTextChanged.connect(self.update_filter)
         self.rebuild_btn.clicked.connect(self.rebuild_cache)
+        self.usage_btn.clicked.connect(self.scan_usage)
+        self.only_set_box.toggled.connect(self.proxy_model.set_only_set_filter)
+        self.watch_box.toggled.connect(self.set_header_watch)
+        self.ns_tree.selectionModel().currentChanged.connect(self._namespace_selected)
+        self.ns_model.modelReset.connect(self._namespace_reset)
 
         self.data: List[Dict[str, str]] = []
+        self.usage: Dict[str, List[Dict[str, Any]]] = {}
+        self._usage_thread: QThread | None = None
+        self.db: ConfigDB | None = None
+        self._rows: Dict[str, int] = {}
+        self._index: IndexClient | None = None
+        self._index_data: List[Dict[str, str]] | None = None
+        self.engine_root: Path | None = None
+        self._watch_thread: QThread | None = None
+        # Serializes cache file access with the header watch thread.
+        self._cache_lock = threading.Lock()
+        attach_completer(self.search_box, lambda text: self.cvar_index().complete(text))
         self.load_data()
 
+    def set_db(self, db: ConfigDB) -> None:
+        """Show values from ``db`` and follow its edits."""
+        if self.db is not None:
+            self.db.remove_listener(self._db_changed)
+        self.db = db
+        db.add_listener(self._db_changed)
+        self._db_changed(None)
+
+    def _db_changed(self, names: Set[str] | None) -> None:
+        if names is None:
+            names = set(self._rows)
+        settings = self.db.settings() if self.db is not None else {}
+        for name in names:
+            row = self._rows.get(name)
+            if row is not None:
+                self._set_value_items(row, settings.get(name))
+        self.proxy_model.invalidateFilter()
+
+    def _set_value_items(self, row: int, found) -> None:
+        name_item = self.model.item(row, 0)
+        value_item = self.model.item(row, VALUE_COLUMN)
+        source_item = self.model.item(row, SOURCE_COLUMN)
+        if not found:
+            name_item.setData(False, SET_ROLE)
+            value_item.setText("")
+            source_item.setText("")
+            source_item.setToolTip("")
+            return
+        effective = found[-1]
+        name_item.setData(True, SET_ROLE)
+        value_item.setText(effective.value)
+        source_item.setText(effective.file)
+        source_item.setToolTip(
+            "\n".join(f"{s.file} [{s.section}] = {s.value}" for s in found)
+        )
+
+    def cvar_index(self) -> IndexClient:
+        """Return the CVar index, recreated when :attr:`data` changes.
+
+        Queries go to the index daemon when one serves this engine version;
+        otherwise an in-process index is built over :attr:`data`.
+        """
+        if self._index is None or self._index_data is not self.data:
+            if self._index is not None:
+                self._index.close()
+            data = self.data
+            self._index = IndexClient(self.cache_file, self.engine_version, local=lambda: CVarIndex(data))
+            self._index_data = data
+        return self._index
+
     def load_data(self) -> None:
-        if self.cache_file.exists():
-            self.data = load_cache(self.cache_file)
+        with self._cache_lock:
+            data = load_cache(self.cache_file) if self.cache_file.exists() else None
+        if data is not None:
+            self.data = data
             self._populate_categories()
             self.update_table()
             return
@@ -188,16 +376,22 @@ class SearchPane(QWidget):
                 if chosen:
                     engine_root = Path(chosen)
 
+        self.engine_root = engine_root
         self._build_cache(engine_root)
 
     def rebuild_cache(self) -> None:
-        if self.cache_file.exists():
+        # The watcher would write its old records over the rebuilt cache.
+        watching = self._watch_thread is not None
+        self.stop_header_watch()
+        with self._cache_lock:
             try:
                 self.cache_file.unlink()
             except OSError:
                 pass
         self.data = []
         self.load_data()
+        if watching:
+            self.set_header_watch(True)
 
     def ask_engine_root(self) -> str | None:
         from PySide6.QtWidgets import QFileDialog
@@ -215,19 +409,161 @@ class SearchPane(QWidget):
         """Update proxy model filters based on search text and category."""
         self.proxy_model.set_text_filter(self.search_box.text())
         self.proxy_model.set_category_filter(self.category_box.currentText())
+        self.ns_model.set_text_filter(self.search_box.text())
+
+    def set_namespace(self, path: str) -> None:
+        """Select ``path`` in the namespace tree and show only its CVars."""
+        index = self.ns_model.index_for_path(path)
+        self.ns_tree.setCurrentIndex(index)
+        if index.isValid():
+            self.ns_tree.scrollTo(index)
+
+    def _namespace_selected(self, current, _previous=None) -> None:
+        self.proxy_model.set_namespace_filter((current.data(PATH_ROLE) or "") if current.isValid() else "")
+
+    def _namespace_reset(self) -> None:
+        self.proxy_model.set_namespace_filter("")
 
     def update_table(self, items: List[Dict[str, str]] | None = None) -> None:
         items = items if items is not None else self.data
         self.model.setRowCount(0)
+        self._rows = {}
+        # Hash join against the config reverse index: one dict lookup per row.
+        settings = self.db.settings() if self.db is not None else {}
         for item in items:
-            name = QStandardItem(item["name"])
-            # Store category in the first column for filtering
-            name.setData(item.get("category", ""), Qt.UserRole)
-            desc = QStandardItem(item["description"])
-            file_item = QStandardItem(item.get("file", ""))
-            self.model.appendRow([name, desc, file_item])
+            self._append_row(item, settings)
+        self.ns_model.set_records(items)
         self.table.resizeRowsToContents()
 
+    def _append_row(self, item: Dict[str, str], settings) -> None:
+        name = QStandardItem(item["name"])
+        # Store category in the first column for filtering
+        name.setData(item.get("category", ""), Qt.UserRole)
+        desc = QStandardItem(item["description"])
+        file_item = QStandardItem(item.get("file", ""))
+        usage_item = QStandardItem()
+        self._set_usage_item(usage_item, item["name"])
+        row = self.model.rowCount()
+        self.model.appendRow(
+            [name, desc, file_item, usage_item, QStandardItem(), QStandardItem()]
+        )
+        key = item["name"].lower()
+        self._rows[key] = row
+        self._set_value_items(row, settings.get(key))
+
+    # ------------------------------------------------------------------
+    # Engine header watch
+    # ------------------------------------------------------------------
+
+    def apply_index_delta(self, delta: IndexDelta) -> None:
+        """Patch :attr:`data` and the model row by row from a header scan."""
+        settings = self.db.settings() if self.db is not None else {}
+        rows = sorted(
+            (self._rows[n.lower()] for n in delta.removed if n.lower() in self._rows),
+            reverse=True,
+        )
+        for row in rows:
+            self.model.removeRow(row)
+            del self.data[row]
+        if rows:
+            self._rows = {item["name"].lower(): idx for idx, item in enumerate(self.data)}
+        # A CVar new to the headers may already have a row from the docs.
+        for item in [*delta.updated, *delta.added]:
+            row = self._rows.get(item["name"].lower())
+            if row is None:
+                self.data.append(item)
+                self._append_row(item, settings)
+                continue
+            self.data[row] = item
+            name_item = self.model.item(row, 0)
+            name_item.setText(item["name"])
+            name_item.setData(item.get("category", ""), Qt.UserRole)
+            self.model.item(row, 1).setText(item["description"])
+            self.model.item(row, 2).setText(item.get("file", ""))
+        # Rows were replaced in place, so the local index is stale.
+        self._index_data = None
+        self._populate_categories()
+        if delta:
+            self.ns_model.set_records(self.data)
+
+    def set_header_watch(self, enabled: bool) -> None:
+        """Start or stop re-indexing changed engine headers in the background."""
+        if not enabled:
+            self.stop_header_watch()
+            return
+        if self._watch_thread is not None:
+            return
+        if self.engine_root is None and self.project_dir is not None:
+            self.engine_root = detect_engine_from_uproject(self.project_dir)
+        if self.engine_root is None:
+            chosen = self.ask_engine_root()
+            self.engine_root = Path(chosen) if chosen else None
+        if self.engine_root is None:
+            self.watch_box.setChecked(False)
+            return
+        thread = QThread(self)
+        worker = HeaderWatchWorker(self.cache_file, self.engine_root, self._cache_lock)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.delta.connect(self.apply_index_delta)
+        thread.finished.connect(worker.deleteLater)
+        self._watch_thread = thread
+        self._watch_worker = worker
+        thread.start()
+
+    def stop_header_watch(self) -> None:
+        thread = self._watch_thread
+        if thread is None:
+            return
+        self._watch_thread = None
+        thread.quit()
+        thread.wait()
+        thread.deleteLater()
+
+    # ------------------------------------------------------------------
+    # Project usage
+    # ------------------------------------------------------------------
+
+    def _set_usage_item(self, item: QStandardItem, name: str) -> None:
+        hits = self.usage.get(name.lower(), [])
+        # Sort numerically rather than by display text.
+        item.setData(len(hits), Qt.DisplayRole)
+        item.setToolTip(
+            "\n".join(f"{h['file']}:{h['line']} ({h['kind']})" for h in hits[:30])
+        )
+
+    def apply_usage(self, usage: Dict[str, List[Dict[str, Any]]]) -> None:
+        """Store a ``scan_project`` report and refresh the Usage column."""
+        self.usage = usage
+        for row in range(self.model.rowCount()):
+            name = self.model.item(row, 0).text()
+            self._set_usage_item(self.model.item(row, 3), name)
+
+    def scan_usage(self) -> None:
+        """Scan the project for CVar usage in a background thread."""
+        if self.project_dir is None or self._usage_thread is not None:
+            return
+        self.usage_btn.setEnabled(False)
+        thread = QThread(self)
+        worker = UsageScanWorker(self.project_dir, [d["name"] for d in self.data])
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.finished.connect(self._usage_finished)
+        worker.finished.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        self._usage_thread = thread
+        self._usage_worker = worker
+        thread.start()
+
+    def _usage_finished(self, usage: Dict[str, List[Dict[str, Any]]], msg: str) -> None:
+        self._usage_thread = None
+        self.usage_btn.setEnabled(True)
+        if msg:
+            QMessageBox.warning(self, "Usage Scan", f"Failed to scan project: {msg}")
+            return
+        self.apply_usage(usage)
+
     # ------------------------------------------------------------------
     # Cache building helpers
     # ------------------------------------------------------------------
@@ -255,11 +591,14 @@ class SearchPane(QWidget):
 
         worker.finished.connect(_finished)
 
-        self._thread.started.connect(worker.run)
-        self._thread.start()
-
+        # Connect the loop before starting the thread: a fast worker could
+        # otherwise finish before ``quit`` is connected and ``exec`` would
+        # never return.  The queued ``quit`` is delivered once ``exec`` runs.
         loop = QEventLoop()
         worker.finished.connect(loop.quit)
+
+        self._thread.started.connect(worker.run)
+        self._thread.start()
         loop.exec()
 
         self._thread.wait()
@@ -267,7 +606,8 @@ class SearchPane(QWidget):
         self._thread.deleteLater()
 
         if result.get("success"):
-            self.data = load_cache(self.cache_file)
+            with self._cache_lock:
+                self.data = load_cache(self.cache_file)
             self._populate_categories()
             self.update_table()
         else:
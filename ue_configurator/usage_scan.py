@@ -0,0 +1,171 @@
+"""Find where indexed CVars are used in a project's source and config files.
+
+All names are matched in a single pass per file: a compiled regex splits the
+text into identifier-like tokens (the character set CVar names are made of)
+and each token is checked with one hash lookup against the set of known
+names.  The cost is therefore independent of how many names are indexed.
+
+Results are cached per file fingerprint (modification time and size), so a
+rescan only reads files that changed since the last run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+from .config_db import fingerprint
+
+DEFAULT_CACHE_DIR = Path.home() / ".ue5_config_assistant" / "usage"
+SCAN_DIRS = ("Source", "Config", "Plugins")
+SCAN_SUFFIXES = {
+    ".h", ".hpp", ".cpp", ".c", ".inl", ".cs",
+    ".ini", ".txt", ".bat", ".sh", ".json", ".uplugin",
+}
+SKIP_DIRS = {"Backup", "Intermediate", "Binaries", "Saved", "DerivedDataCache", ".git"}
+
+TOKEN = re.compile(rb"[A-Za-z_][A-Za-z0-9_.]*")
+FIND_CVAR = re.compile(rb"FindConsoleVariable(?:Data(?:Int|Float))?\s*\(")
+
+Hit = Tuple[str, int, str]  # (lowercased name, line, kind)
+
+_worker_names: FrozenSet[bytes] = frozenset()
+
+
+def _classify(path: Path, line_text: bytes) -> str:
+    """Return the kind of usage for a match on ``line_text`` in ``path``."""
+    name = path.name.lower()
+    if b"execcmds" in line_text.lower():
+        return "exec_cmds"
+    if path.suffix.lower() == ".ini":
+        if "deviceprofiles" in name:
+            return "device_profile"
+        if "scalability" in name:
+            return "scalability"
+        return "config"
+    if FIND_CVAR.search(line_text):
+        return "lookup"
+    return "source"
+
+
+def scan_bytes(path: Path, data: bytes, names: FrozenSet[bytes]) -> List[Hit]:
+    """Return every occurrence of ``names`` (lowercased bytes) in ``data``."""
+    hits: List[Hit] = []
+    lowered = data.lower()
+    line_no, counted_to = 1, 0
+    for match in TOKEN.finditer(lowered):
+        token = match.group().rstrip(b".")
+        if token not in names:
+            continue
+        start = match.start()
+        line_no += lowered.count(b"\n", counted_to, start)
+        counted_to = start
+        line_start = lowered.rfind(b"\n", 0, start) + 1
+        line_end = lowered.find(b"\n", start)
+        line_text = data[line_start : line_end if line_end != -1 else len(data)]
+        hits.append((token.decode(), line_no, _classify(path, line_text)))
+    return hits
+
+
+def _init_worker(names: FrozenSet[bytes]) -> None:
+    global _worker_names
+    _worker_names = names
+
+
+def _scan_file(path: str, names: FrozenSet[bytes] | None = None) -> Tuple[str, List[Hit]]:
+    p = Path(path)
+    try:
+        data = p.read_bytes()
+    except OSError:
+        return path, []
+    return path, scan_bytes(p, data, _worker_names if names is None else names)
+
+
+def iter_project_files(project_dir: Path) -> Iterable[Path]:
+    """Yield files below ``Source``/``Config``/``Plugins`` worth scanning."""
+    for sub in SCAN_DIRS:
+        root = project_dir / sub
+        if not root.is_dir():
+            continue
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            for fname in filenames:
+                if os.path.splitext(fname)[1].lower() in SCAN_SUFFIXES:
+                    yield Path(dirpath) / fname
+
+
+def _names_digest(names: FrozenSet[bytes]) -> str:
+    h = hashlib.sha1()
+    for name in sorted(names):
+        h.update(name + b"\n")
+    return h.hexdigest()
+
+
+def default_cache_file(project_dir: Path) -> Path:
+    key = hashlib.sha1(str(project_dir.resolve()).encode()).hexdigest()[:16]
+    return DEFAULT_CACHE_DIR / f"{key}.json"
+
+
+def scan_project(
+    project_dir: Path,
+    names: Iterable[str],
+    cache_file: Path | None = None,
+    workers: int | None = None,
+) -> Dict[str, List[Dict[str, object]]]:
+    """Return ``{lowercased name: [{"file", "line", "kind"}, ...]}``.
+
+    Only files whose fingerprint changed since the cached run are read.  The
+    cache is discarded when the set of names changes.  ``workers`` controls
+    the process pool size; ``1`` scans in-process.
+    """
+    name_set = frozenset(n.lower().encode() for n in names if n)
+    cache_file = cache_file or default_cache_file(project_dir)
+    digest = _names_digest(name_set)
+    cached: Dict[str, Dict] = {}
+    if cache_file.exists():
+        try:
+            raw = json.loads(cache_file.read_text())
+            if raw.get("names") == digest:
+                cached = raw.get("files", {})
+        except Exception:
+            cached = {}
+
+    files: Dict[str, Dict] = {}
+    todo: List[str] = []
+    for path in iter_project_files(project_dir):
+        key = str(path)
+        stamp = fingerprint(path)
+        # Stored as a JSON list, so compare in that form.
+        fp = list(stamp) if stamp else None
+        entry = cached.get(key)
+        if entry and entry.get("fp") == fp:
+            files[key] = entry
+        else:
+            files[key] = {"fp": fp, "hits": []}
+            todo.append(key)
+
+    if todo and name_set:
+        if workers == 1 or len(todo) < 32:
+            for key in todo:
+                files[key]["hits"] = _scan_file(key, name_set)[1]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(name_set,)
+            ) as pool:
+                for key, hits in pool.map(_scan_file, todo, chunksize=16):
+                    files[key]["hits"] = hits
+
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text(json.dumps({"names": digest, "files": files}))
+
+    report: Dict[str, List[Dict[str, object]]] = {}
+    for key, entry in files.items():
+        rel = os.path.relpath(key, project_dir)
+        for name, line, kind in entry["hits"]:
+            report.setdefault(name, []).append({"file": rel, "line": line, "kind": kind})
+    return report
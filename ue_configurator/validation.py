@@ -0,0 +1,154 @@
+"""Validate ini console variables against the CVar index."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Tuple, Union
+
+from .config_db import ConfigDB
+from .cvar_index import CVarIndex
+from .cvar_types import cvar_metadata
+from .index_daemon import IndexClient
+
+#: Anything answering ``lookup``/``suggest``: an in-process index or a daemon client.
+Index = Union[CVarIndex, IndexClient]
+
+CVAR_SECTIONS = ("ConsoleVariables", "SystemSettings")
+
+#: Distinct unknown names :func:`add_suggestions` looks up per call.
+MAX_SUGGESTED = 200
+
+UNKNOWN_CVAR = "unknown-cvar"
+WRONG_TYPE = "wrong-type"
+OUT_OF_RANGE = "out-of-range"
+
+
+@dataclass
+class Diagnostic:
+    """A single problem with a CVar setting."""
+
+    code: str
+    file: str
+    line: int
+    section: str
+    key: str
+    value: str
+    message: str
+    suggestions: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+Row = Tuple[str, int, str, str, str]
+
+
+def _strip(value: str) -> str:
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1]
+    return value
+
+
+def _parse_number(dtype: str, value: str) -> float | None:
+    try:
+        return int(value) if dtype == "int" else float(value)
+    except ValueError:
+        return None
+
+
+def check_rows(rows: List[Row], index: Index) -> List[Diagnostic]:
+    """Check ``(file, line, section, key, value)`` rows in one pass.
+
+    Every key is resolved with a single hashed lookup.  Metadata for each
+    distinct CVar is fetched once and reused for all rows that set it, so
+    the cost is dominated by the number of rows rather than range parsing.
+    Unknown names get no suggestions here; see :func:`add_suggestions`.
+    """
+    diagnostics: List[Diagnostic] = []
+    meta_cache: Dict[str, Dict[str, Any] | None] = {}
+    for file, line, section, key, raw in rows:
+        name = key.lower()
+        if name not in meta_cache:
+            record = index.lookup(name)
+            meta = cvar_metadata(record) if record else None
+            if meta and meta["options"]:
+                meta["allowed"] = {o.lower() for o in meta["options"]}
+            meta_cache[name] = meta
+        meta = meta_cache[name]
+        if meta is None:
+            diagnostics.append(
+                Diagnostic(UNKNOWN_CVAR, file, line, section, key, raw, f"Unknown console variable '{key}'")
+            )
+            continue
+        value = _strip(raw)
+        dtype = meta["dtype"]
+        options = meta["options"]
+        if options:
+            if value.lower() not in meta["allowed"]:
+                diagnostics.append(
+                    Diagnostic(
+                        WRONG_TYPE, file, line, section, key, raw,
+                        f"'{value}' is not one of {', '.join(options)}",
+                    )
+                )
+            continue
+        if dtype not in ("int", "float"):
+            continue
+        number = _parse_number(dtype, value)
+        if number is None:
+            diagnostics.append(
+                Diagnostic(WRONG_TYPE, file, line, section, key, raw, f"Expected {dtype} value, got '{value}'")
+            )
+            continue
+        vmin, vmax = meta["min"], meta["max"]
+        if (vmin is not None and number < vmin) or (vmax is not None and number > vmax):
+            diagnostics.append(
+                Diagnostic(
+                    OUT_OF_RANGE, file, line, section, key, raw,
+                    f"{value} is outside the valid range {vmin}..{vmax}",
+                )
+            )
+    return diagnostics
+
+
+def add_suggestions(diagnostics: List[Diagnostic], index: Index, limit: int | None = None) -> None:
+    """Add "did you mean" names to unknown-CVar ``diagnostics`` in place.
+
+    Call this only for the diagnostics that are shown.  Each distinct name
+    is looked up once, and only the first ``limit`` names (default
+    :data:`MAX_SUGGESTED`) are looked up at all.
+    """
+    limit = MAX_SUGGESTED if limit is None else limit
+    cache: Dict[str, List[str]] = {}
+    for diag in diagnostics:
+        if diag.code != UNKNOWN_CVAR or diag.suggestions:
+            continue
+        name = diag.key.lower()
+        if name not in cache:
+            cache[name] = index.suggest(name, 3) if len(cache) < limit else []
+        diag.suggestions = list(cache[name])
+        if diag.suggestions:
+            diag.message += f" (did you mean {', '.join(diag.suggestions)}?)"
+
+
+def collect_rows(db: ConfigDB, sections: Tuple[str, ...] = CVAR_SECTIONS) -> List[Row]:
+    """Return every CVar setting from the active files of ``db``."""
+    rows: List[Row] = []
+    for ini in db._active_files():
+        name = ini.path.name
+        for section, key, value, line in ini.iter_options():
+            if section in sections:
+                rows.append((name, line, section, key, value))
+    return rows
+
+
+def validate_cvars(
+    db: ConfigDB,
+    index: Index,
+    sections: Tuple[str, ...] = CVAR_SECTIONS,
+) -> List[Diagnostic]:
+    """Check CVar keys in ``sections`` for existence, type and range."""
+    if not len(index):
+        return []
+    return check_rows(collect_rows(db, sections), index)
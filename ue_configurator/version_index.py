@@ -0,0 +1,184 @@
+"""Console variables across several engine versions.
+
+:func:`scrape_versions` fetches and parses the reference pages of several
+versions concurrently on a thread pool (the work is network bound) that
+shares one pooled :class:`~ue_configurator.fetch.Fetcher`.
+
+:class:`VersionIndex` merges the per-version lists into one deduplicated
+index: each CVar stores the versions it exists in and a *revision* only
+when its default or description differs from the previous version that had
+it.  What changed in each version (added, removed and changed CVars) is
+derived once when the index is built, so ``changed_in("5.5")`` is a dict
+lookup.
+"""
+
+from __future__ import annotations
+
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+import requests
+
+from .fetch import Fetcher, default_fetcher
+from .indexer import scrape_console_variables
+
+Record = Dict[str, str]
+FIELDS = ("default", "description")
+INDEX_VERSION = 1
+
+
+def version_key(version: str) -> Tuple[Any, ...]:
+    """Sort key ordering ``"5.10"`` after ``"5.9"``."""
+    return tuple(int(part) if part.isdigit() else part for part in version.split("."))
+
+
+def scrape_versions(
+    versions: Iterable[str],
+    fetcher: Fetcher | None = None,
+    max_workers: int = 4,
+    scrape: Callable[[str, Fetcher], List[Record]] = scrape_console_variables,
+) -> Tuple[Dict[str, List[Record]], Dict[str, str]]:
+    """Scrape ``versions`` with at most ``max_workers`` requests in flight.
+
+    Returns ``(records per version, error message per failed version)``.
+    """
+    versions = list(dict.fromkeys(versions))
+    fetcher = fetcher or default_fetcher()
+    results: Dict[str, List[Record]] = {}
+    errors: Dict[str, str] = {}
+    if not versions:
+        return results, errors
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(versions)))) as pool:
+        futures = {pool.submit(scrape, version, fetcher): version for version in versions}
+        for future in as_completed(futures):
+            version = futures[future]
+            try:
+                results[version] = future.result()
+            except (RuntimeError, OSError, requests.RequestException) as exc:
+                errors[version] = str(exc)
+    return results, errors
+
+
+class VersionIndex:
+    """Deduplicated CVar history over a set of engine versions."""
+
+    def __init__(self, versions: Iterable[str], cvars: Dict[str, Dict[str, Any]]) -> None:
+        self.versions: List[str] = sorted(versions, key=version_key)
+        #: lowercased name -> {"name", "versions", "revisions": [{"version", "default", "description"}]}
+        self.cvars = cvars
+        self._changes = self._derive_changes()
+
+    @classmethod
+    def build(cls, per_version: Dict[str, List[Record]]) -> "VersionIndex":
+        versions = sorted(per_version, key=version_key)
+        cvars: Dict[str, Dict[str, Any]] = {}
+        for version in versions:
+            for record in per_version[version]:
+                name = record.get("name", "")
+                if not name:
+                    continue
+                entry = cvars.setdefault(name.lower(), {"name": name, "versions": [], "revisions": []})
+                if entry["versions"] and entry["versions"][-1] == version:
+                    continue  # listed twice on one page
+                entry["versions"].append(version)
+                values = {f: record.get(f, "") for f in FIELDS}
+                revisions = entry["revisions"]
+                if not revisions or any(revisions[-1][f] != values[f] for f in FIELDS):
+                    revisions.append({"version": version, **values})
+        return cls(versions, cvars)
+
+    def _derive_changes(self) -> Dict[str, Dict[str, List[Any]]]:
+        changes: Dict[str, Dict[str, List[Any]]] = {
+            v: {"added": [], "removed": [], "changed": []} for v in self.versions
+        }
+        for entry in self.cvars.values():
+            name = entry["name"]
+            present = set(entry["versions"])
+            revisions = {r["version"]: r for r in entry["revisions"]}
+            previous_revision = None
+            for idx, version in enumerate(self.versions):
+                before = idx > 0 and self.versions[idx - 1] in present
+                if version in present and not before and idx > 0:
+                    changes[version]["added"].append(name)
+                elif version not in present and before:
+                    changes[version]["removed"].append(name)
+                revision = revisions.get(version)
+                if revision is not None:
+                    if before and previous_revision is not None:
+                        for f in FIELDS:
+                            if revision[f] != previous_revision[f]:
+                                changes[version]["changed"].append(
+                                    {"name": name, "field": f, "old": previous_revision[f], "new": revision[f]}
+                                )
+                    previous_revision = revision
+        for change in changes.values():
+            change["added"].sort(key=str.lower)
+            change["removed"].sort(key=str.lower)
+        return changes
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self.cvars
+
+    def versions_of(self, name: str) -> List[str]:
+        entry = self.cvars.get(name.lower())
+        return list(entry["versions"]) if entry else []
+
+    def history(self, name: str) -> List[Dict[str, str]]:
+        """Return the revisions of ``name``: the first version and every change."""
+        entry = self.cvars.get(name.lower())
+        return list(entry["revisions"]) if entry else []
+
+    def value_at(self, name: str, version: str) -> Dict[str, str] | None:
+        """Return ``{"default", "description"}`` of ``name`` in ``version``."""
+        entry = self.cvars.get(name.lower())
+        if not entry or version not in entry["versions"]:
+            return None
+        current = None
+        for revision in entry["revisions"]:
+            if version_key(revision["version"]) > version_key(version):
+                break
+            current = revision
+        return {f: current[f] for f in FIELDS} if current else None
+
+    def records_at(self, version: str) -> List[Record]:
+        """Reconstruct the CVar list of ``version`` (name, default, description)."""
+        records = []
+        for entry in self.cvars.values():
+            values = self.value_at(entry["name"], version)
+            if values is not None:
+                records.append({"name": entry["name"], **values})
+        return records
+
+    def merged(self, per_version: Dict[str, List[Record]]) -> "VersionIndex":
+        """Return a new index with ``per_version`` added or replacing versions."""
+        combined = {v: self.records_at(v) for v in self.versions if v not in per_version}
+        combined.update(per_version)
+        return VersionIndex.build(combined)
+
+    def changed_in(self, version: str) -> Dict[str, List[Any]]:
+        """Return what ``version`` added, removed and changed vs. the previous one."""
+        if version not in self._changes:
+            raise KeyError(f"Version not indexed: {version}")
+        return self._changes[version]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": INDEX_VERSION, "versions": self.versions, "cvars": self.cvars}
+        path.write_text(json.dumps(payload))
+
+    @classmethod
+    def load(cls, path: Path) -> "VersionIndex":
+        raw = json.loads(path.read_text())
+        if raw.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported version index format in {path}")
+        return cls(raw["versions"], raw["cvars"])